@@ -0,0 +1,599 @@
+"""
+Python API returning typed objects
+
+`JenkinsClient` exposes the data behind the read commands (`list-jobs`,
+`list-builds`, `job-status`, `list-credentials`, ...) as dataclasses, so
+services embedding jenkee call it in-process instead of spawning the CLI and
+parsing its text. The commands themselves are formatters over this client.
+
+    from jenkins_tools.api import JenkinsClient
+
+    client = JenkinsClient()
+    for build in client.list_builds("backend-build", limit=20):
+        print(build.number, build.result)
+
+The client uses the process-wide session (see `JenkinsSession`) unless given
+its own config and transport. `AsyncJenkinsClient` offers the same calls as
+coroutines, running the hot read paths natively on asyncio (`async_http`).
+"""
+
+import functools
+import json
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Dict, Iterator, List, Optional
+
+from jenkins_tools.build_history import RECORD_PREFIX, build_history_script
+from jenkins_tools.cache import (
+    CACHE_DEFAULT,
+    CredentialIndex,
+    credential_element,
+    fetch_credential_index,
+)
+from jenkins_tools.core import JenkinsConfig, Transport, get_http_backend, get_session
+from jenkins_tools.groovy_scripts import JOB_RECORD_FUNCTION, groovy_string
+
+DEFAULT_CREDENTIAL_STORE = "system::system::jenkins"
+
+
+class JenkinsError(Exception):
+    """
+    A Jenkins request failed
+
+    Attributes:
+        detail: Server or jenkins-cli.jar error output, possibly empty
+    """
+
+    def __init__(self, message: str, detail: str = ""):
+        super().__init__(message)
+        self.detail = detail
+
+
+class NotFoundError(JenkinsError):
+    """The requested job, view or build does not exist"""
+
+
+def _camel_case(name: str) -> str:
+    return re.sub(r"_([a-z])", lambda m: m.group(1).upper(), name)
+
+
+def _plain(value):
+    if is_dataclass(value):
+        return value.to_record()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+class _Record:
+    """Mixin converting a dataclass to the record dict printed by `--format`"""
+
+    __slots__ = ()
+
+    def to_record(self) -> dict:
+        """Get the object as a record, with camelCase keys as in `--format` output"""
+        return {_camel_case(f.name): _plain(getattr(self, f.name)) for f in fields(self)}
+
+
+# __slots__ are declared by hand: dataclass(slots=True) needs Python 3.10
+
+
+@dataclass
+class Identity(_Record):
+    """The authenticated user"""
+
+    __slots__ = ("name", "authorities")
+    name: str
+    authorities: List[str]
+
+
+@dataclass
+class Job(_Record):
+    """A job, as listed in a view or at the root"""
+
+    __slots__ = ("name", "view")
+    name: str
+    view: Optional[str]
+
+
+@dataclass
+class Build(_Record):
+    """
+    One build of a job
+
+    `timestamp` is the start time (epoch milliseconds); `result` and
+    `duration` (milliseconds) are None while the build runs. `node` is None
+    for builds without a single executor node (e.g. Pipeline runs).
+    """
+
+    __slots__ = ("job", "number", "result", "building", "timestamp", "duration", "cause", "node")
+    job: str
+    number: int
+    result: Optional[str]
+    building: bool
+    timestamp: int
+    duration: Optional[int]
+    cause: Optional[str]
+    node: Optional[str]
+
+
+@dataclass
+class Health(_Record):
+    """A job's health report"""
+
+    __slots__ = ("score", "description")
+    score: int
+    description: Optional[str]
+
+
+@dataclass
+class JobStatus(_Record):
+    """A job's state, permalinks (build numbers) and trigger relations"""
+
+    __slots__ = (
+        "name",
+        "type",
+        "enabled",
+        "buildable",
+        "health",
+        "last_build",
+        "last_stable_build",
+        "last_successful_build",
+        "last_failed_build",
+        "last_unsuccessful_build",
+        "last_completed_build",
+        "upstream",
+        "downstream",
+    )
+    name: str
+    type: str
+    enabled: bool
+    buildable: bool
+    health: Optional[Health]
+    last_build: Optional[int]
+    last_stable_build: Optional[int]
+    last_successful_build: Optional[int]
+    last_failed_build: Optional[int]
+    last_unsuccessful_build: Optional[int]
+    last_completed_build: Optional[int]
+    upstream: List[str]
+    downstream: List[str]
+
+
+@dataclass
+class Credential(_Record):
+    """Credential metadata; secrets are never included"""
+
+    __slots__ = (
+        "domain",
+        "id",
+        "type",
+        "scope",
+        "description",
+        "username",
+        "file_name",
+        "project_id",
+        "storage_account",
+    )
+    domain: str
+    id: Optional[str]
+    type: str
+    scope: Optional[str]
+    description: Optional[str]
+    username: Optional[str]
+    file_name: Optional[str]
+    project_id: Optional[str]
+    storage_account: Optional[str]
+
+    @classmethod
+    def from_element(cls, domain: str, element: ET.Element) -> "Credential":
+        """Build from a credential element of `list-credentials-as-xml`"""
+
+        def text(path):
+            child = element.find(path)
+            return child.text if child is not None and child.text else None
+
+        return cls(
+            domain=domain,
+            id=text("id"),
+            type=element.tag.split(".")[-1],
+            scope=text("scope"),
+            description=text("description"),
+            username=text("username"),
+            file_name=text("fileName"),
+            project_id=text("projectId"),
+            storage_account=text("storageData/storageAccountName"),
+        )
+
+
+@dataclass
+class QueuedBuild(_Record):
+    """A build request; `queue_id` is None when jenkins-cli.jar queued it"""
+
+    __slots__ = ("job", "queue_id")
+    job: str
+    queue_id: Optional[int]
+
+
+def _job_status_script(job_name: str) -> str:
+    return f"""
+import groovy.json.JsonOutput
+{JOB_RECORD_FUNCTION}
+def job = jenkins.model.Jenkins.instance.getItemByFullName({groovy_string(job_name)})
+if (!(job instanceof hudson.model.Job)) {{
+    println "ERROR: Job not found"
+    return
+}}
+println JsonOutput.toJson(jobRecord(job, 0))
+"""
+
+
+def _job_status_from_output(job_name: str, text: str) -> JobStatus:
+    """Parse the output of `_job_status_script`"""
+    if text.startswith("ERROR:"):
+        raise NotFoundError(f"Job '{job_name}' not found")
+    try:
+        record = json.loads(text)
+    except json.JSONDecodeError:
+        # A script error reported by the server
+        raise JenkinsError(f"Failed to get status for job '{job_name}'", text)
+
+    health = record.get("health")
+    return JobStatus(
+        name=record["name"],
+        type=record["type"],
+        enabled=record["enabled"],
+        buildable=record["buildable"],
+        health=Health(**health) if health else None,
+        last_build=record.get("lastBuild"),
+        last_stable_build=record.get("lastStableBuild"),
+        last_successful_build=record.get("lastSuccessfulBuild"),
+        last_failed_build=record.get("lastFailedBuild"),
+        last_unsuccessful_build=record.get("lastUnsuccessfulBuild"),
+        last_completed_build=record.get("lastCompletedBuild"),
+        upstream=record.get("upstream", []),
+        downstream=record.get("downstream", []),
+    )
+
+
+def _build_from_line(job_name: str, line: str) -> Build:
+    """Parse one record line of `build_history_script`"""
+    return Build(job=job_name, **json.loads(line[len(RECORD_PREFIX) :]))
+
+
+def _check_build_history(job_name: str, other_lines: List[str]) -> None:
+    """Raise for the non-record lines of `build_history_script` output"""
+    if other_lines and other_lines[0].startswith("ERROR:"):
+        raise NotFoundError(f"Job '{job_name}' not found")
+    if other_lines:
+        # Anything that is not a record is a script error reported by the server
+        raise JenkinsError(f"Failed to list builds for job '{job_name}'", "\n".join(other_lines))
+
+
+class JenkinsClient:
+    """
+    In-process access to Jenkins returning typed objects
+
+    Failures raise `JenkinsError` (`NotFoundError` for missing items). Methods
+    returning iterators stream results as the server produces them and raise
+    once the stream has ended.
+    """
+
+    def __init__(
+        self, config: Optional[JenkinsConfig] = None, transport: Optional[Transport] = None
+    ):
+        """
+        Args:
+            config: Config to use; defaults to the session's, re-read when .env changes
+            transport: Transport to use; defaults to the session's transport
+        """
+        self._config = config
+        self._transport = transport
+
+    @property
+    def config(self) -> JenkinsConfig:
+        return self._config if self._config is not None else get_session().config
+
+    @property
+    def transport(self) -> Transport:
+        if self._transport is not None:
+            return self._transport
+        return get_session().transport(self._config)
+
+    def whoami(self) -> Identity:
+        """Get the authenticated user"""
+        http = get_http_backend(self.transport)
+        if http is not None:
+            status, data = http.whoami()
+            if status != 200:
+                raise JenkinsError(f"Failed to query /whoAmI (HTTP {status})")
+            return Identity(name=data.get("name"), authorities=data.get("authorities", []))
+
+        result = self.transport.run("who-am-i")
+        if result.returncode != 0:
+            raise JenkinsError("Authentication failed", result.stderr or "")
+        lines = [line.strip() for line in (result.stdout or "").splitlines() if line.strip()]
+        name = lines[0].split(":", 1)[1].strip() if lines else None
+        return Identity(name=name, authorities=[line for line in lines[2:]])
+
+    def list_jobs(self, view: Optional[str] = None) -> Iterator[Job]:
+        """
+        List the jobs of a view, or all top-level jobs
+
+        Raises:
+            JenkinsError: If the view does not exist or the request fails
+        """
+        args = [view] if view else []
+        with self.transport.stream("list-jobs", *args) as output:
+            for line in output:
+                name = line.strip()
+                if name:
+                    yield Job(name=name, view=view)
+
+        if output.returncode != 0:
+            target = f" in view '{view}'" if view else ""
+            raise JenkinsError(f"Failed to list jobs{target}", output.stderr)
+
+    def get_job_config(self, job_name: str) -> str:
+        """
+        Get a job's config.xml
+
+        Raises:
+            NotFoundError: If the job does not exist
+        """
+        result = self.transport.run("get-job", job_name)
+        if result.returncode == 3:
+            raise NotFoundError(f"Job '{job_name}' not found", result.stderr or "")
+        if result.returncode != 0:
+            raise JenkinsError(f"Failed to get job '{job_name}'", result.stderr or "")
+        return result.stdout
+
+    def list_builds(
+        self,
+        job_name: str,
+        limit: Optional[int] = None,
+        since: Optional[int] = None,
+        build_range: Optional[str] = None,
+    ) -> Iterator[Build]:
+        """
+        List a job's builds, newest first
+
+        Args:
+            job_name: Job full name
+            limit: Maximum number of builds
+            since: Only builds started at or after this time (epoch milliseconds)
+            build_range: Build number range such as '100-150' or '100,105'
+
+        Raises:
+            NotFoundError: If the job does not exist
+        """
+        script = build_history_script(job_name, limit, since, build_range)
+        other_lines = []
+        with self.transport.stream("groovy", "=", stdin_input=script) as output:
+            for line in output:
+                if line.startswith(RECORD_PREFIX):
+                    yield _build_from_line(job_name, line)
+                elif line.strip():
+                    other_lines.append(line.rstrip("\n"))
+
+        if output.returncode != 0:
+            raise JenkinsError(f"Failed to list builds for job '{job_name}'", output.stderr)
+        _check_build_history(job_name, other_lines)
+
+    def job_status(self, job_name: str) -> JobStatus:
+        """
+        Get a job's state, permalinks and trigger relations
+
+        Raises:
+            NotFoundError: If the job does not exist
+        """
+        # Streamed so the HTTP transport can serve the script via /scriptText
+        script = _job_status_script(job_name)
+        with self.transport.stream("groovy", "=", stdin_input=script) as output:
+            text = "".join(output).strip()
+
+        if output.returncode != 0 or not text:
+            raise JenkinsError(f"Failed to get status for job '{job_name}'", output.stderr)
+        return _job_status_from_output(job_name, text)
+
+    def list_credentials(
+        self,
+        store: str = DEFAULT_CREDENTIAL_STORE,
+        domain: Optional[str] = None,
+        credential_type: Optional[str] = None,
+        cache_mode: str = CACHE_DEFAULT,
+    ) -> List[Credential]:
+        """
+        List credential metadata of a store, from the local cache when fresh
+
+        Args:
+            store: Credentials store ID
+            domain: Only credentials of this domain
+            credential_type: Only credentials of this type (e.g. 'StringCredentialsImpl')
+            cache_mode: CACHE_DEFAULT, CACHE_REFRESH or CACHE_OFF
+
+        Raises:
+            JenkinsError: If the store cannot be read
+        """
+        try:
+            index, failed = fetch_credential_index(
+                self.transport, CredentialIndex(self.config), store, cache_mode
+            )
+        except ET.ParseError as e:
+            raise JenkinsError(f"Failed to parse XML: {e}")
+        if index is None:
+            raise JenkinsError("Failed to list credentials", failed.stderr or "")
+
+        credentials = []
+        for entry_domain in index["domains"]:
+            if domain and entry_domain["name"] != domain:
+                continue
+            for entry in index["credentials"].values():
+                if entry["domain"] != entry_domain["name"]:
+                    continue
+                credential = Credential.from_element(entry["domain"], credential_element(entry))
+                if not credential_type or credential.type == credential_type:
+                    credentials.append(credential)
+        return credentials
+
+    def build(self, job_name: str, params: Optional[Dict[str, str]] = None) -> QueuedBuild:
+        """
+        Queue a build, with parameters if given
+
+        Raises:
+            NotFoundError: If the job does not exist
+        """
+        params = params or {}
+        http = get_http_backend(self.transport)
+        if http is not None:
+            status, queue_id, data = http.trigger_build(job_name, list(params.items()))
+            if status == 404:
+                raise NotFoundError(f"No such job '{job_name}'")
+            if status >= 400:
+                detail = data.decode("utf-8", errors="replace").strip()
+                raise JenkinsError(f"Failed to build job '{job_name}'", detail)
+            return QueuedBuild(job=job_name, queue_id=queue_id)
+
+        args = [arg for key, value in params.items() for arg in ("-p", f"{key}={value}")]
+        result = self.transport.run("build", job_name, *args)
+        if result.returncode != 0:
+            raise JenkinsError(f"Failed to build job '{job_name}'", result.stderr or "")
+        return QueuedBuild(job=job_name, queue_id=None)
+
+
+class AsyncJenkinsClient:
+    """
+    `JenkinsClient` calls as coroutines, for many concurrent queries
+
+    Over HTTP (JENKINS_TRANSPORT=auto or http), `get_job_config`,
+    `job_status` and `list_builds` run natively on `AsyncJenkinsHTTP`, so
+    hundreds of them can be awaited together, e.g. with `asyncio.gather`. The
+    transport bounds concurrency with its per-host connection limit, and it
+    retries failed requests with jittered backoff. Cancelling a task aborts
+    its request. The other calls, and every call over jenkins-cli.jar, run
+    the blocking client in the event loop's default executor. Iterators are
+    returned as lists.
+
+        async with AsyncJenkinsClient(limit=32) as client:
+            statuses = await asyncio.gather(
+                *(client.job_status(name) for name in names), return_exceptions=True
+            )
+    """
+
+    def __init__(
+        self,
+        client: Optional[JenkinsClient] = None,
+        limit: Optional[int] = None,
+        retries: Optional[int] = None,
+    ):
+        """
+        Args:
+            client: Blocking client providing the config and transport
+            limit: Maximum concurrent connections to the Jenkins host
+                   (default ASYNC_HTTP_LIMIT)
+            retries: Retries per request after a connection failure or a
+                     429/502/503/504 response (default ASYNC_HTTP_RETRIES)
+        """
+        self.client = client or JenkinsClient()
+        self.limit = limit
+        self.retries = retries
+        self._http = None
+
+    async def __aenter__(self) -> "AsyncJenkinsClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections"""
+        if self._http is not None:
+            await self._http.aclose()
+
+    @property
+    def http(self) -> Optional["AsyncJenkinsHTTP"]:
+        """The native transport, or None when the client runs over jenkins-cli.jar"""
+        if self._http is None and get_http_backend(self.client.transport) is not None:
+            # Imported here: asyncio is slow to import and only async callers need it
+            from jenkins_tools.async_http import (
+                ASYNC_HTTP_LIMIT,
+                ASYNC_HTTP_RETRIES,
+                AsyncJenkinsHTTP,
+            )
+
+            self._http = AsyncJenkinsHTTP(
+                self.client.config,
+                limit=self.limit or ASYNC_HTTP_LIMIT,
+                retries=ASYNC_HTTP_RETRIES if self.retries is None else self.retries,
+            )
+        return self._http
+
+    async def _call(self, func, *args, **kwargs):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def whoami(self) -> Identity:
+        return await self._call(self.client.whoami)
+
+    async def list_jobs(self, view: Optional[str] = None) -> List[Job]:
+        return await self._call(lambda: list(self.client.list_jobs(view)))
+
+    async def get_job_config(self, job_name: str) -> str:
+        if self.http is None:
+            return await self._call(self.client.get_job_config, job_name)
+
+        status, _, data = await self.http.request(
+            "GET", f"{self.http.item_path(job_name)}/config.xml"
+        )
+        if status == 404:
+            raise NotFoundError(f"Job '{job_name}' not found")
+        if status != 200:
+            raise JenkinsError(
+                f"Failed to get job '{job_name}' (HTTP {status})",
+                data.decode("utf-8", errors="replace"),
+            )
+        return data.decode("utf-8")
+
+    async def job_status(self, job_name: str) -> JobStatus:
+        if self.http is None:
+            return await self._call(self.client.job_status, job_name)
+
+        status, text = await self.http.run_script(_job_status_script(job_name), idempotent=True)
+        if status != 200 or not text.strip():
+            raise JenkinsError(f"Failed to get status for job '{job_name}' (HTTP {status})", text)
+        return _job_status_from_output(job_name, text.strip())
+
+    async def list_builds(
+        self,
+        job_name: str,
+        limit: Optional[int] = None,
+        since: Optional[int] = None,
+        build_range: Optional[str] = None,
+    ) -> List[Build]:
+        if self.http is None:
+            return await self._call(
+                lambda: list(self.client.list_builds(job_name, limit, since, build_range))
+            )
+
+        script = build_history_script(job_name, limit, since, build_range)
+        status, text = await self.http.run_script(script, idempotent=True)
+        if status != 200:
+            raise JenkinsError(f"Failed to list builds for job '{job_name}' (HTTP {status})", text)
+        builds = []
+        other_lines = []
+        for line in text.splitlines():
+            if line.startswith(RECORD_PREFIX):
+                builds.append(_build_from_line(job_name, line))
+            elif line.strip():
+                other_lines.append(line)
+        _check_build_history(job_name, other_lines)
+        return builds
+
+    async def list_credentials(self, **options) -> List[Credential]:
+        return await self._call(self.client.list_credentials, **options)
+
+    async def build(self, job_name: str, params: Optional[Dict[str, str]] = None) -> QueuedBuild:
+        return await self._call(self.client.build, job_name, params)
@@ -0,0 +1,282 @@
+"""
+Asyncio HTTP transport for many concurrent Jenkins requests
+
+`AsyncJenkinsHTTP` speaks HTTP/1.1 over `asyncio` streams (standard library
+only), so hundreds of requests can be in flight from one thread:
+
+- At most `limit` connections are open to the Jenkins host at a time. Idle
+  keep-alive connections are reused, and further requests wait for a free
+  slot.
+- Connection failures and 429/502/503/504 responses are retried with
+  jittered exponential backoff ("full jitter"), honouring `Retry-After`.
+  Requests that are not idempotent are only retried when the server refused
+  them (429/503).
+- Cancelling the awaiting task aborts its request. A connection whose
+  response was not fully read is closed rather than returned to the pool.
+"""
+
+import asyncio
+import base64
+import json
+import random
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode, urlsplit
+
+from jenkins_tools.core import HTTP_TIMEOUT, JenkinsConfig, JenkinsHTTP
+
+# Constants
+ASYNC_HTTP_LIMIT = 16  # Concurrent connections to the Jenkins host
+ASYNC_HTTP_RETRIES = 3  # Retries per request after the first attempt
+ASYNC_HTTP_BACKOFF = 0.5  # Seconds; the backoff before retry n is up to BACKOFF * 2**n
+ASYNC_HTTP_MAX_BACKOFF = 10.0
+RETRY_STATUSES = {429, 502, 503, 504}
+REFUSED_STATUSES = {429, 503}  # The server did not process the request
+
+# Raised while talking to the server; all mean the connection is unusable
+CONNECTION_ERRORS = (OSError, EOFError, asyncio.TimeoutError, ValueError)
+
+
+class AsyncJenkinsHTTP:
+    """Asyncio HTTP client for the Jenkins REST API and /scriptText"""
+
+    def __init__(
+        self,
+        config: JenkinsConfig,
+        limit: int = ASYNC_HTTP_LIMIT,
+        retries: int = ASYNC_HTTP_RETRIES,
+        backoff: float = ASYNC_HTTP_BACKOFF,
+        max_backoff: float = ASYNC_HTTP_MAX_BACKOFF,
+    ):
+        url = urlsplit(config.jenkins_url or "")
+        self.scheme = url.scheme or "http"
+        self.host = url.hostname or ""
+        self.port = url.port or (443 if self.scheme == "https" else 80)
+        self.base_path = url.path.rstrip("/")
+        self.limit = limit
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.headers = {"Host": url.netloc, "Connection": "keep-alive"}
+        if config.is_configured():
+            token = f"{config.username}:{config.api_token}".encode("utf-8")
+            self.headers["Authorization"] = "Basic " + base64.b64encode(token).decode("ascii")
+
+        # Bound to the running event loop on first use (see _bind_loop)
+        self._loop = None
+        self._slots = None
+        self._crumb_lock = None
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self.crumb = None
+
+    item_path = staticmethod(JenkinsHTTP.item_path)
+
+    async def __aenter__(self) -> "AsyncJenkinsHTTP":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close idle pooled connections"""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except CONNECTION_ERRORS:
+                pass
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send an HTTP request relative to JENKINS_URL
+
+        Args:
+            method: HTTP method
+            path: Path starting with '/', relative to the Jenkins root
+            body: Optional request body
+            headers: Optional extra headers
+            idempotent: Whether the request may be retried after a failure
+                        (defaults to True for GET and HEAD)
+
+        Returns:
+            Tuple of (status, response headers with lower-case names, body)
+
+        Raises:
+            OSError, EOFError, asyncio.TimeoutError: Once retries are exhausted
+        """
+        self._bind_loop()
+        if idempotent is None:
+            idempotent = method in ("GET", "HEAD")
+
+        request_headers = dict(self.headers)
+        if method == "POST":
+            request_headers.update(await self._get_crumb())
+        if headers:
+            request_headers.update(headers)
+
+        attempt = 0
+        while True:
+            retry_after = 0.0
+            try:
+                status, response_headers, data = await self._send(
+                    method, path, body, request_headers
+                )
+            except CONNECTION_ERRORS:
+                if not idempotent or attempt >= self.retries:
+                    raise
+            else:
+                retryable = status in (RETRY_STATUSES if idempotent else REFUSED_STATUSES)
+                if not retryable or attempt >= self.retries:
+                    return status, response_headers, data
+                retry_after = _retry_after(response_headers)
+
+            attempt += 1
+            await asyncio.sleep(max(retry_after, self._backoff_delay(attempt)))
+
+    async def get_json(self, path: str, tree: Optional[str] = None) -> Tuple[int, Optional[dict]]:
+        """GET a `/api/json` document, optionally filtered with `tree`"""
+        query = f"?tree={quote(tree, safe='[],{}')}" if tree else ""
+        status, _, data = await self.request("GET", f"{path}/api/json{query}")
+        if status != 200:
+            return status, None
+        return status, json.loads(data)
+
+    async def run_script(self, script: str, idempotent: bool = False) -> Tuple[int, str]:
+        """
+        Run a Groovy script with /scriptText
+
+        Args:
+            script: Groovy source
+            idempotent: The script only reads, so it may be retried
+
+        Returns:
+            Tuple of (status, output)
+        """
+        body = urlencode({"script": script}).encode("utf-8")
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        status, _, data = await self.request(
+            "POST", "/scriptText", body, headers, idempotent=idempotent
+        )
+        return status, data.decode("utf-8", errors="replace")
+
+    def _bind_loop(self) -> None:
+        """Create loop-bound primitives, and drop connections of a previous loop"""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        self._loop = loop
+        self._slots = asyncio.Semaphore(self.limit)
+        self._crumb_lock = asyncio.Lock()
+        for _, writer in self._idle:
+            writer.close()
+        self._idle = []
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    async def _get_crumb(self) -> Dict[str, str]:
+        """Fetch the CSRF crumb once; servers without a crumb issuer get {}"""
+        async with self._crumb_lock:
+            if self.crumb is None:
+                status, _, data = await self.request("GET", "/crumbIssuer/api/json")
+                self.crumb = {}
+                if status == 200:
+                    crumb = json.loads(data)
+                    self.crumb = {crumb["crumbRequestField"]: crumb["crumb"]}
+        return self.crumb
+
+    async def _send(self, method, path, body, headers) -> Tuple[int, Dict[str, str], bytes]:
+        """Send one request on a pooled connection within the connection limit"""
+        async with self._slots:
+            while True:
+                reused = bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await self._connect()
+                try:
+                    status, response_headers, data, keep_alive = await asyncio.wait_for(
+                        self._exchange(reader, writer, method, path, body, headers), HTTP_TIMEOUT
+                    )
+                except (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        # Stale keep-alive connection; retry on the next one
+                        continue
+                    raise
+                except BaseException:
+                    # Includes cancellation: the response may be half read
+                    writer.close()
+                    raise
+
+                if keep_alive:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, response_headers, data
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        ssl = None
+        if self.scheme == "https":
+            import ssl as ssl_module
+
+            ssl = ssl_module.create_default_context()
+        return await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=ssl), HTTP_TIMEOUT
+        )
+
+    async def _exchange(self, reader, writer, method, path, body, headers):
+        """Write a request and read the whole response"""
+        lines = [f"{method} {self.base_path}{path} HTTP/1.1"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        if body is not None or method == "POST":
+            lines.append(f"Content-Length: {len(body or b'')}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await writer.drain()
+
+        status_line = (await reader.readuntil(b"\r\n")).decode("latin-1")
+        status = int(status_line.split(" ", 2)[1])
+        response_headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        keep_alive = response_headers.get("connection", "").lower() != "close"
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            data = b""
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await self._read_chunked(reader)
+        elif "content-length" in response_headers:
+            data = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            data = await reader.read()
+            keep_alive = False
+        return status, response_headers, data, keep_alive
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            if size == 0:
+                # Skip trailers
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+
+def _retry_after(headers: Dict[str, str]) -> float:
+    """Get the Retry-After delay in seconds (HTTP dates are ignored)"""
+    value = headers.get("retry-after", "")
+    return float(value) if value.isdigit() else 0.0
@@ -0,0 +1,154 @@
+"""Build history queries: option parsing, the server-side script and formatting
+
+Builds are walked newest first and the script stops as soon as `--limit`,
+`--since` or `--range` is satisfied, so a long history is never loaded in
+full. Each build is printed as one `BUILD <json>` line and flushed in
+batches, so records can be consumed while the script is still running.
+"""
+
+import re
+import time
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from jenkins_tools.groovy_scripts import BUILD_RECORD_FUNCTION, groovy_string
+
+# Prefix of each build record line in the script output
+RECORD_PREFIX = "BUILD "
+
+# Record fields, in tsv column order
+RECORD_FIELDS = ["job", "number", "result", "building", "timestamp", "duration", "cause", "node"]
+
+# Build numbers accepted by --range: "N", "N-M" or a comma-separated list of those
+RANGE_PATTERN = re.compile(r"^\d+(-\d+)?(,\d+(-\d+)?)*$")
+
+# Relative --since values: a count and a unit (minutes, hours, days, weeks)
+RELATIVE_PATTERN = re.compile(r"^(\d+)([mhdw])$")
+_UNIT_SECONDS = {"m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+
+def parse_since(value: str, now: Optional[float] = None) -> int:
+    """
+    Convert a --since value to epoch milliseconds
+
+    Accepts a relative age (`30m`, `12h`, `7d`, `2w`) or a local ISO date /
+    datetime (`2026-10-01`, `2026-10-01T08:00`).
+
+    Raises:
+        ValueError: If the value matches neither form
+    """
+    match = RELATIVE_PATTERN.match(value)
+    if match:
+        now = time.time() if now is None else now
+        return int((now - int(match.group(1)) * _UNIT_SECONDS[match.group(2)]) * 1000)
+    try:
+        return int(datetime.fromisoformat(value).timestamp() * 1000)
+    except ValueError:
+        raise ValueError(f"Invalid value for --since: '{value}' (use e.g. 7d, 12h or 2026-10-01)")
+
+
+def parse_history_options(args: List[str]) -> Tuple[List[str], int, Optional[int], Optional[str]]:
+    """
+    Split `--limit N`, `--since WHEN` and `--range SPEC` off an argument list
+
+    Returns:
+        Tuple of (remaining args, limit (0 = no limit), since in epoch
+        milliseconds or None, range spec or None)
+
+    Raises:
+        ValueError: If an option value is missing or invalid
+    """
+    remaining = []
+    limit = 0
+    since = None
+    build_range = None
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg not in ("--limit", "--since", "--range"):
+            remaining.append(arg)
+            i += 1
+            continue
+        if i + 1 >= len(args):
+            raise ValueError(f"Missing value for {arg}")
+        value = args[i + 1]
+        if arg == "--limit":
+            if not value.isdigit() or int(value) < 1:
+                raise ValueError(f"Invalid value for --limit: '{value}'")
+            limit = int(value)
+        elif arg == "--since":
+            since = parse_since(value)
+        else:
+            if not RANGE_PATTERN.match(value):
+                raise ValueError(f"Invalid value for --range: '{value}' (use e.g. 100-150)")
+            build_range = value
+        i += 2
+
+    return remaining, limit, since, build_range
+
+
+def build_history_script(
+    job_name: str, limit: int = 0, since: Optional[int] = None, build_range: Optional[str] = None
+) -> str:
+    """
+    Build the Groovy script printing one record line per matching build
+
+    Without --range the script iterates `job.builds` (capped with
+    `RunList.limit`), which loads build records lazily, newest first. With
+    --range only the builds inside the range are looked up. In both cases
+    the walk stops at the first build older than `since`.
+    """
+    if build_range:
+        # getBuilds(RangeSet) returns the range oldest first
+        builds = (
+            "job.getBuilds(hudson.model.Fingerprint.RangeSet.fromString("
+            f"{groovy_string(build_range)}, false)).reverse()"
+        )
+        if limit:
+            builds += f".take({limit})"
+    else:
+        builds = f"job.builds.limit({limit})" if limit else "job.builds"
+
+    return f"""
+import groovy.json.JsonOutput
+{BUILD_RECORD_FUNCTION}
+def job = jenkins.model.Jenkins.instance.getItemByFullName({groovy_string(job_name)})
+if (!(job instanceof hudson.model.Job)) {{
+    println "ERROR: Job not found"
+    return
+}}
+
+def since = {since or 0}L
+def count = 0
+for (build in {builds}) {{
+    if (since > 0 && build.timeInMillis < since) {{
+        break
+    }}
+    println "{RECORD_PREFIX}" + JsonOutput.toJson(buildRecord(build))
+    if (++count % 100 == 0) {{
+        out.flush()
+    }}
+}}
+"""
+
+
+def format_duration(millis: Optional[int]) -> str:
+    """Format a duration in milliseconds as e.g. '1h 2m', '3m 4s' or '5.6s'"""
+    if millis is None:
+        return "-"
+    seconds = millis / 1000
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, seconds = divmod(int(seconds), 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m"
+
+
+def format_timestamp(millis: Optional[int]) -> str:
+    """Format epoch milliseconds as local 'YYYY-MM-DD HH:MM:SS'"""
+    if millis is None:
+        return "-"
+    return datetime.fromtimestamp(millis / 1000).strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,171 @@
+"""Build queue helpers: matrix files and queue lookups over the REST API
+
+The whole queue is read with one `/queue/api/json` request; only items that
+have left the queue are looked up individually (`/queue/item/<id>`), which
+Jenkins answers for a few minutes after an item started or was cancelled.
+"""
+
+import csv
+import json
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import unquote, urlsplit
+
+QUEUE_TREE = "items[id,why,task[url],actions[parameters[name,value]]]"
+QUEUE_ITEM_TREE = "cancelled,why,task[url],executable[number,url]"
+
+
+def read_matrix(path: str) -> List[Dict[str, str]]:
+    """
+    Read build parameter rows from a CSV or JSON Lines file
+
+    CSV files need a header row naming the parameters; empty cells are kept
+    as empty strings. JSON Lines files (.jsonl/.ndjson) hold one object per
+    line; values are converted to strings the way Jenkins receives them.
+
+    Raises:
+        ValueError: If the file cannot be read or a row is malformed
+    """
+    try:
+        with open(path, encoding="utf-8", newline="") as f:
+            if path.endswith((".jsonl", ".ndjson")):
+                return [_json_row(line, n) for n, line in enumerate(f, 1) if line.strip()]
+            reader = csv.DictReader(f)
+            if not reader.fieldnames:
+                raise ValueError(f"No header row in {path}")
+            rows = []
+            for n, row in enumerate(reader, 2):
+                if None in row:
+                    raise ValueError(f"Line {n}: more values than header columns")
+                rows.append({key: value or "" for key, value in row.items()})
+            return rows
+    except OSError as e:
+        raise ValueError(f"Cannot read {path}: {e.strerror}")
+
+
+def _json_row(line: str, n: int) -> Dict[str, str]:
+    try:
+        row = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Line {n}: {e.msg}")
+    if not isinstance(row, dict):
+        raise ValueError(f"Line {n}: expected a JSON object")
+    return {key: "" if value is None else _param_string(value) for key, value in row.items()}
+
+
+def find_queued(items: List[dict], job_name: str, params: Dict[str, str]) -> Optional[int]:
+    """
+    Find a queued build of a job with the given parameter values
+
+    Parameters not given are not compared, so a queued build that also sets
+    other parameters (e.g. defaults) still matches.
+
+    Returns:
+        The queue item ID, or None
+    """
+    for item in items:
+        if item["job"] == job_name and all(
+            item["params"].get(key) == value for key, value in params.items()
+        ):
+            return item["id"]
+    return None
+
+
+def url_path(http, url: str) -> str:
+    """Get the path of an absolute Jenkins URL relative to JENKINS_URL"""
+    return urlsplit(url).path[len(http.base_path) :]
+
+
+def job_name_from_url(http, url: str) -> Optional[str]:
+    """Convert a job or build URL to the job's full name"""
+    parts = url_path(http, url).strip("/").split("/")
+    names = [unquote(parts[i + 1]) for i in range(0, len(parts) - 1, 2) if parts[i] == "job"]
+    return "/".join(names) or None
+
+
+def queued_items(http) -> List[dict]:
+    """
+    List every item waiting in the build queue
+
+    Returns:
+        List of {"id", "job", "why", "params"} where params maps parameter
+        names to string values
+
+    Raises:
+        ValueError: If the queue cannot be read
+    """
+    status, data = http.get_json("/queue", tree=QUEUE_TREE)
+    if status != 200:
+        raise ValueError(f"HTTP {status} from /queue")
+
+    items = []
+    for item in (data or {}).get("items", []):
+        params = {}
+        for action in item.get("actions") or []:
+            for parameter in (action or {}).get("parameters") or []:
+                value = parameter.get("value")
+                params[parameter["name"]] = "" if value is None else _param_string(value)
+        items.append(
+            {
+                "id": item["id"],
+                "job": job_name_from_url(http, (item.get("task") or {}).get("url", "")),
+                "why": item.get("why"),
+                "params": params,
+            }
+        )
+    return items
+
+
+def poll_queue_items(http, queue_ids: Iterable[int]) -> Dict[int, dict]:
+    """
+    Get the state of queue items
+
+    Returns:
+        Queue ID -> {"state", "job", "number", "url"} where state is one of
+        queued, leaving (left the queue, no executor yet), started, cancelled
+        or lost (unknown to Jenkins); number and url are set once started
+
+    Raises:
+        ValueError: If the queue or an item cannot be read
+    """
+    queue_ids = list(queue_ids)
+    if not queue_ids:
+        return {}
+    waiting = {item["id"]: item for item in queued_items(http)}
+
+    states = {}
+    for queue_id in queue_ids:
+        if queue_id in waiting:
+            states[queue_id] = _state("queued", waiting[queue_id]["job"])
+            continue
+
+        status, item = http.get_json(f"/queue/item/{queue_id}", tree=QUEUE_ITEM_TREE)
+        if status == 404 or (status == 200 and not item):
+            states[queue_id] = _state("lost")
+            continue
+        if status != 200:
+            raise ValueError(f"HTTP {status} from queue item {queue_id}")
+
+        job_name = job_name_from_url(http, (item.get("task") or {}).get("url", ""))
+        executable = item.get("executable")
+        if item.get("cancelled"):
+            states[queue_id] = _state("cancelled", job_name)
+        elif executable:
+            states[queue_id] = _state(
+                "started", job_name, executable["number"], url_path(http, executable["url"])
+            )
+        else:
+            states[queue_id] = _state("leaving", job_name)
+    return states
+
+
+def _state(state: str, job_name=None, number=None, url=None) -> dict:
+    return {"state": state, "job": job_name, "number": number, "url": url}
+
+
+def _param_string(value) -> str:
+    """Render a parameter value the way it is submitted as a form field"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
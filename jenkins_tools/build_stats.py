@@ -0,0 +1,279 @@
+"""Build duration and result analytics
+
+Build records are transferred and cached as columns (parallel lists of
+numbers, timestamps, durations and results, newest first) rather than one
+object per build, so a job's whole window comes back as one JSON line and
+every statistic is a single pass over a column.
+
+The server-side script only returns builds the local cache does not have
+yet: builds newer than the cache's watermark and, when the requested window
+is larger than what is cached, older builds below the cache's oldest one.
+Running builds are never cached; the watermark stays below them so they are
+picked up once finished.
+"""
+
+import json
+import statistics
+from typing import Dict, List, Optional
+
+from jenkins_tools.groovy_scripts import groovy_string
+
+# Prefixes of the lines in the script output
+JOB_PREFIX = "JOB "
+VIEW_PREFIX = "VIEW "
+COLUMNS_PREFIX = "BUILDS "
+
+COLUMNS = ["numbers", "timestamps", "durations", "results"]
+
+# Results counted as failures, and results left out of rates and durations
+FAILED_RESULTS = ("FAILURE", "UNSTABLE")
+SKIPPED_RESULTS = ("ABORTED", "NOT_BUILT", None)
+
+# Completed builds kept in the local cache per job
+MAX_CACHED_BUILDS = 5000
+
+# Builds per job in the analysis window unless --limit is given
+DEFAULT_LIMIT = 100
+
+
+def resolve_script(target: str) -> str:
+    """
+    Build the Groovy script resolving a job or view name to job names
+
+    Prints `JOB <name>` for a job, or `VIEW <name>` followed by one
+    `JOB <name>` per job in the view (including jobs in nested folders).
+    """
+    return f"""
+def jenkins = jenkins.model.Jenkins.instance
+def target = {groovy_string(target)}
+def item = jenkins.getItemByFullName(target)
+if (item instanceof hudson.model.Job) {{
+    println "{JOB_PREFIX}" + item.fullName
+    return
+}}
+def view = jenkins.getView(target)
+if (view == null) {{
+    println "ERROR: Not found"
+    return
+}}
+println "{VIEW_PREFIX}" + view.viewName
+view.allItems.findAll {{ it instanceof hudson.model.Job }}.each {{
+    println "{JOB_PREFIX}" + it.fullName
+}}
+"""
+
+
+def columns_script(known: Dict[str, list], limit: int) -> str:
+    """
+    Build the Groovy script returning the missing build records of each job
+
+    Args:
+        known: Job name -> [watermark, oldest cached number, builds to backfill]
+        limit: Maximum number of new builds to return per job
+
+    Each job is printed as one `BUILDS <json>` line holding the COLUMNS plus
+    `running` (numbers of builds still in progress), `truncated` (more than
+    `limit` new builds exist, so the result does not connect to the cache)
+    and `complete` (the walk reached the job's first build).
+    """
+    return f"""
+import groovy.json.JsonOutput
+import groovy.json.JsonSlurper
+
+def known = new JsonSlurper().parseText({groovy_string(json.dumps(known))})
+def jenkins = jenkins.model.Jenkins.instance
+
+def columns(job, long watermark, long oldest, int backfill, int limit) {{
+    def rec = [name: job.fullName, numbers: [], timestamps: [], durations: [], results: [],
+               running: [], truncated: false, complete: false]
+    def add = {{ build ->
+        if (build.building) {{
+            rec.running << build.number
+            return
+        }}
+        rec.numbers << build.number
+        rec.timestamps << build.timeInMillis
+        rec.durations << build.duration
+        rec.results << build.result?.toString()
+    }}
+
+    // Newest builds, down to the cache watermark
+    def seen = 0
+    def reachedCache = false
+    for (build in job.builds) {{
+        if (build.number <= watermark) {{
+            reachedCache = true
+            break
+        }}
+        if (seen++ >= limit) {{
+            rec.truncated = true
+            break
+        }}
+        add(build)
+    }}
+    rec.complete = !reachedCache && !rec.truncated
+
+    // Older builds below the oldest cached one, to fill the window
+    if (reachedCache && backfill > 0) {{
+        def build = job.getNearestOldBuild((int) oldest - 1)
+        while (build != null && backfill-- > 0) {{
+            add(build)
+            build = build.previousBuild
+        }}
+        rec.complete = build == null
+    }}
+    return rec
+}}
+
+known.each {{ name, state ->
+    def job = jenkins.getItemByFullName(name)
+    if (job instanceof hudson.model.Job) {{
+        println "{COLUMNS_PREFIX}" + JsonOutput.toJson(columns(job, state[0], state[1], state[2], {limit}))
+        out.flush()
+    }}
+}}
+"""
+
+
+def cache_state(cached: Optional[dict], limit: int) -> list:
+    """Get the [watermark, oldest, backfill] a job's cache sends to the script"""
+    if not cached or not cached["numbers"]:
+        return [0, 0, 0]
+    backfill = 0 if cached["complete"] else max(0, limit - len(cached["numbers"]))
+    return [cached["watermark"], cached["numbers"][-1], backfill]
+
+
+def merge_columns(cached: Optional[dict], fetched: dict) -> dict:
+    """
+    Merge fetched build columns into a job's cached columns
+
+    Returns:
+        New cache entry with the COLUMNS (newest first, deduplicated by
+        build number), `watermark` and `complete`
+    """
+    rows = {}
+    if cached and not fetched["truncated"]:
+        rows.update(zip(cached["numbers"], zip(*(cached[c] for c in COLUMNS[1:]))))
+    rows.update(zip(fetched["numbers"], zip(*(fetched[c] for c in COLUMNS[1:]))))
+
+    numbers = sorted(rows, reverse=True)[:MAX_CACHED_BUILDS]
+    merged = {"numbers": numbers}
+    for i, column in enumerate(COLUMNS[1:]):
+        merged[column] = [rows[number][i] for number in numbers]
+
+    if fetched["running"]:
+        watermark = min(fetched["running"]) - 1
+    else:
+        watermark = numbers[0] if numbers else 0
+    complete = fetched["complete"] or bool(
+        cached and cached.get("complete") and not fetched["truncated"]
+    )
+    merged.update(watermark=watermark, complete=complete and len(numbers) < MAX_CACHED_BUILDS)
+    return merged
+
+
+def window(columns: dict, limit: int, since: Optional[int] = None) -> dict:
+    """Select the newest `limit` builds, started at or after `since`, of cached columns"""
+    count = min(limit, len(columns["numbers"]))
+    if since:
+        count = sum(1 for timestamp in columns["timestamps"][:count] if timestamp >= since)
+    return {column: columns[column][:count] for column in COLUMNS}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Linearly interpolated percentile of an ascending list (fraction in 0..1)"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(columns: dict, sequence: bool = True) -> dict:
+    """
+    Aggregate build columns (newest first) into statistics
+
+    Aborted and not-built builds are left out of failure rates and
+    durations. Trends compare the newer half of the counted builds with the
+    older half.
+
+    Args:
+        columns: Build COLUMNS, newest first
+        sequence: The columns are one job's consecutive builds, so flakiness
+                  and streaks are meaningful
+
+    Returns:
+        Dict with builds, failures, failureRate, flakiness, p50, p95, mean
+        (milliseconds), durationTrend (relative change of the p50),
+        failureRateTrend (change in failure rate), streakResult, streak and
+        longestFailureStreak; values that cannot be computed are None
+    """
+    counted = [
+        (result in FAILED_RESULTS, duration)
+        for result, duration in zip(columns["results"], columns["durations"])
+        if result not in SKIPPED_RESULTS
+    ]
+    failed = [is_failed for is_failed, _ in counted]
+    durations = sorted(duration for _, duration in counted)
+
+    def failure_rate(flags):
+        return sum(flags) / len(flags) if flags else None
+
+    stats = {
+        "builds": len(columns["numbers"]),
+        "failures": sum(failed),
+        "failureRate": failure_rate(failed),
+        "flakiness": None,
+        "p50": percentile(durations, 0.5),
+        "p95": percentile(durations, 0.95),
+        "mean": statistics.mean(durations) if durations else None,
+        "durationTrend": None,
+        "failureRateTrend": None,
+        "streakResult": None,
+        "streak": None,
+        "longestFailureStreak": None,
+    }
+
+    half = len(counted) // 2
+    if half >= 2:
+        newer, older = counted[:half], counted[-half:]
+        newer_p50 = percentile(sorted(duration for _, duration in newer), 0.5)
+        older_p50 = percentile(sorted(duration for _, duration in older), 0.5)
+        if older_p50:
+            stats["durationTrend"] = (newer_p50 - older_p50) / older_p50
+        stats["failureRateTrend"] = failure_rate([f for f, _ in newer]) - failure_rate(
+            [f for f, _ in older]
+        )
+
+    if not sequence:
+        return stats
+
+    # Flakiness: share of consecutive counted builds whose outcome flipped
+    if len(failed) >= 2:
+        flips = sum(1 for newer, older in zip(failed, failed[1:]) if newer != older)
+        stats["flakiness"] = flips / (len(failed) - 1)
+
+    results = columns["results"]
+    if results:
+        streak = 1
+        while streak < len(results) and results[streak] == results[0]:
+            streak += 1
+        stats["streakResult"], stats["streak"] = results[0], streak
+
+    longest = current = 0
+    for is_failed in failed:
+        current = current + 1 if is_failed else 0
+        longest = max(longest, current)
+    stats["longestFailureStreak"] = longest
+    return stats
+
+
+def pool(all_columns: List[dict]) -> dict:
+    """Combine several jobs' columns into one set ordered by start time, newest first"""
+    rows = sorted(
+        (row for columns in all_columns for row in zip(*(columns[c] for c in COLUMNS))),
+        key=lambda row: row[1],
+        reverse=True,
+    )
+    return {column: [row[i] for row in rows] for i, column in enumerate(COLUMNS)}
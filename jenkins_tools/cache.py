@@ -0,0 +1,453 @@
+"""Local on-disk caches of job config.xml, credential metadata and build records"""
+
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from jenkins_tools.core import JenkinsConfig, Transport
+
+# Constants
+CACHE_DIR = Path.home() / ".jenkins-inspector" / "cache"
+
+# Cache modes
+CACHE_DEFAULT = "default"  # Serve fresh entries, refetch stale ones
+CACHE_REFRESH = "refresh"  # Always fetch from the server and update the cache
+CACHE_OFF = "off"  # Bypass the cache entirely
+
+DOMAIN_CREDENTIALS_TAG = "com.cloudbees.plugins.credentials.domains.DomainCredentials"
+
+
+def parse_cache_options(args: List[str]) -> Tuple[List[str], str]:
+    """
+    Split `--no-cache` and `--refresh` off an argument list
+
+    Returns:
+        Tuple of (remaining args, cache mode)
+    """
+    mode = CACHE_DEFAULT
+    remaining = []
+    for arg in args:
+        if arg == "--no-cache":
+            mode = CACHE_OFF
+        elif arg == "--refresh":
+            mode = CACHE_REFRESH
+        else:
+            remaining.append(arg)
+    return remaining, mode
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Replace a file's content atomically (readers never see a partial file)
+
+    Every writer gets its own temp file, so concurrent writers of the same
+    path (threads or processes) never clobber each other: the last rename wins.
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _unlink_missing_ok(path: Path) -> None:
+    """Remove a file that a concurrent store or eviction may already have removed"""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class ConfigCache:
+    """
+    Content-addressed cache of job configurations
+
+    Layout under `~/.jenkins-inspector/cache/configs/`:
+        index/<key>.json   server URL + job name -> content hash and fetch time
+        blobs/<sha256>.xml config content, shared by identical configs
+
+    Index files' mtimes record last use and drive LRU eviction once the blobs
+    exceed the configured size.
+    """
+
+    def __init__(self, config: JenkinsConfig, cache_dir: Path = CACHE_DIR):
+        self.config = config
+        self.ttl = config.cache_ttl
+        self.max_bytes = config.cache_max_bytes
+        self.index_dir = cache_dir / "configs" / "index"
+        self.blob_dir = cache_dir / "configs" / "blobs"
+
+    def _key(self, job_name: str) -> str:
+        identity = f"{self.config.jenkins_url}\0{job_name.strip('/')}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _index_path(self, job_name: str) -> Path:
+        return self.index_dir / f"{self._key(job_name)}.json"
+
+    def lookup(self, job_name: str) -> Optional[dict]:
+        """
+        Get the cache entry for a job
+
+        Returns:
+            Entry dict with 'content' and 'fetched_at', or None if the job is
+            not cached
+        """
+        index_path = self._index_path(job_name)
+        try:
+            entry = json.loads(index_path.read_text(encoding="utf-8"))
+            blob_path = self.blob_dir / f"{entry['sha256']}.xml"
+            entry["content"] = blob_path.read_text(encoding="utf-8")
+        except (OSError, ValueError, KeyError):
+            return None
+
+        os.utime(index_path)  # Mark as recently used
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        """Check whether an entry is still within its TTL"""
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    def store(self, job_name: str, content: str) -> None:
+        """Store a job's config"""
+        data = content.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+
+        # Blobs are content-addressed: one written by another thread or process
+        # holds the same bytes, so finding it in place counts as stored
+        blob_path = self.blob_dir / f"{sha256}.xml"
+        if not blob_path.exists():
+            try:
+                write_atomic(blob_path, data)
+            except OSError:
+                if not blob_path.exists():
+                    raise
+
+        entry = {
+            "server": self.config.jenkins_url,
+            "job": job_name,
+            "sha256": sha256,
+            "fetched_at": time.time(),
+        }
+        write_atomic(self._index_path(job_name), json.dumps(entry).encode("utf-8"))
+        self.evict()
+
+    def invalidate(self, job_name: str) -> None:
+        """Drop a job from the cache (its blob is reclaimed by eviction)"""
+        _unlink_missing_ok(self._index_path(job_name))
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until blobs fit in max_bytes
+
+        Other threads and processes may store or evict at the same time, so
+        files that vanish between listing and use are skipped.
+        """
+        if not self.blob_dir.exists():
+            return
+
+        blobs = {}
+        for path in self.blob_dir.glob("*.xml"):
+            try:
+                blobs[path.stem] = path.stat().st_size
+            except FileNotFoundError:
+                continue
+        if sum(blobs.values()) <= self.max_bytes:
+            return
+
+        entries = []
+        for index_path in self.index_dir.glob("*.json"):
+            try:
+                sha256 = json.loads(index_path.read_text(encoding="utf-8"))["sha256"]
+                mtime = index_path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError, KeyError):
+                _unlink_missing_ok(index_path)
+                continue
+            entries.append((mtime, index_path, sha256))
+        entries.sort()
+
+        referenced = {}
+        for _, _, sha256 in entries:
+            referenced[sha256] = referenced.get(sha256, 0) + 1
+
+        # Orphaned blobs go first, then the least recently used entries
+        total = sum(blobs.values())
+        for sha256 in [sha for sha in blobs if sha not in referenced]:
+            _unlink_missing_ok(self.blob_dir / f"{sha256}.xml")
+            total -= blobs.pop(sha256)
+
+        for _, index_path, sha256 in entries:
+            if total <= self.max_bytes:
+                break
+            _unlink_missing_ok(index_path)
+            referenced[sha256] -= 1
+            if referenced[sha256] == 0 and sha256 in blobs:
+                _unlink_missing_ok(self.blob_dir / f"{sha256}.xml")
+                total -= blobs.pop(sha256)
+
+
+def fetch_job_config(
+    transport: Transport, cache: ConfigCache, job_name: str, mode: str = CACHE_DEFAULT
+) -> subprocess.CompletedProcess:
+    """
+    Get a job's config.xml through the cache
+
+    Fresh entries are served from disk; stale ones are fetched again. The
+    cache is purely TTL-based: Jenkins sends neither ETag nor Last-Modified
+    for config.xml, so there is nothing to revalidate against.
+
+    Args:
+        transport: Transport used on cache misses
+        cache: Config cache
+        job_name: Job full name
+        mode: CACHE_DEFAULT, CACHE_REFRESH or CACHE_OFF
+
+    Returns:
+        CompletedProcess object, as returned by `get-job`
+    """
+    if mode == CACHE_OFF:
+        return transport.run("get-job", job_name)
+
+    entry = cache.lookup(job_name) if mode == CACHE_DEFAULT else None
+    if entry is not None and cache.is_fresh(entry):
+        argv = ["get-job", job_name]
+        return subprocess.CompletedProcess(argv, 0, stdout=entry["content"], stderr="")
+
+    result = transport.run("get-job", job_name)
+    if result.returncode == 0:
+        cache.store(job_name, result.stdout)
+    return result
+
+
+class CredentialIndex:
+    """
+    Cache of parsed credential metadata, one file per server and store
+
+    Each file under `~/.jenkins-inspector/cache/credentials/` holds the domains
+    and, per credential ID, its domain, type, scope, description and the
+    credential's XML from `list-credentials-as-xml` (where Jenkins has already
+    redacted every secret). Secrets are never cached.
+    """
+
+    def __init__(self, config: JenkinsConfig, cache_dir: Path = CACHE_DIR):
+        self.config = config
+        self.ttl = config.credential_cache_ttl
+        self.index_dir = cache_dir / "credentials"
+
+    def _path(self, store_id: str) -> Path:
+        identity = f"{self.config.jenkins_url}\0{store_id}"
+        return self.index_dir / f"{hashlib.sha256(identity.encode('utf-8')).hexdigest()}.json"
+
+    def load(self, store_id: str) -> Optional[dict]:
+        """Get the cached index of a store, or None if missing or expired"""
+        try:
+            index = json.loads(self._path(store_id).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if time.time() - index.get("fetched_at", 0) >= self.ttl:
+            return None
+        return index
+
+    def store(self, store_id: str, index: dict) -> None:
+        """Persist the index of a store"""
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(self._path(store_id), json.dumps(index).encode("utf-8"))
+
+    def invalidate(self, store_id: str) -> None:
+        """Drop the cached index of a store"""
+        try:
+            self._path(store_id).unlink()
+        except FileNotFoundError:
+            pass
+
+
+class BuildRecordCache:
+    """
+    Cache of completed build records, one file per server and job
+
+    Each file under `~/.jenkins-inspector/cache/builds/` holds a job's build
+    numbers, timestamps, durations and results as parallel columns, plus the
+    watermark below which every build is known to be finished. Entries never
+    expire: later runs fetch only builds above the watermark.
+    """
+
+    def __init__(self, config: JenkinsConfig, cache_dir: Path = CACHE_DIR):
+        self.config = config
+        self.records_dir = cache_dir / "builds"
+
+    def _path(self, job_name: str) -> Path:
+        identity = f"{self.config.jenkins_url}\0{job_name}"
+        return self.records_dir / f"{hashlib.sha256(identity.encode('utf-8')).hexdigest()}.json"
+
+    def load(self, job_name: str) -> Optional[dict]:
+        """Get the cached columns of a job, or None if missing or unreadable"""
+        try:
+            return json.loads(self._path(job_name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def store(self, job_name: str, columns: dict) -> None:
+        """Persist the columns of a job"""
+        self.records_dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(self._path(job_name), json.dumps(columns).encode("utf-8"))
+
+
+def iter_credential_index(chunks: Iterable[str]) -> Iterator[Tuple[str, dict]]:
+    """
+    Incrementally parse `list-credentials-as-xml` output
+
+    Chunks are fed to a pull parser as they arrive, so events are produced
+    while the server is still sending. Every element is detached from the
+    tree once handled, keeping memory bounded by the largest credential.
+
+    Yields:
+        ("domain", {name, description}) when a domain header has been read,
+        then ("credential", {id, domain, type, scope, description, xml}) for
+        each of its credentials. Duplicate IDs are skipped.
+
+    Raises:
+        ET.ParseError: If the XML is malformed
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack = []
+    seen = set()
+    domain_name = "(global)"
+
+    def handle_events():
+        nonlocal domain_name
+        for event, elem in parser.read_events():
+            if event == "start":
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if not stack:
+                continue
+            parent = stack[-1]
+            grandparent = stack[-2] if len(stack) > 1 else None
+
+            if parent.tag == DOMAIN_CREDENTIALS_TAG and elem.tag == "domain":
+                domain_name = elem.findtext("name") or "(global)"
+                yield "domain", {
+                    "name": domain_name,
+                    "description": elem.findtext("description") or "",
+                }
+            elif (
+                grandparent is not None
+                and grandparent.tag == DOMAIN_CREDENTIALS_TAG
+                and parent.tag == "credentials"
+            ):
+                cred_id = elem.findtext("id")
+                if cred_id is not None and cred_id not in seen:
+                    seen.add(cred_id)
+                    yield "credential", {
+                        "id": cred_id,
+                        "domain": domain_name,
+                        "type": elem.tag.split(".")[-1],
+                        "scope": elem.findtext("scope"),
+                        "description": elem.findtext("description"),
+                        "xml": ET.tostring(elem, encoding="unicode"),
+                    }
+            elif elem.tag != DOMAIN_CREDENTIALS_TAG:
+                continue
+
+            # Handled: drop it so the tree never holds more than one credential
+            parent.remove(elem)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from handle_events()
+    parser.close()
+    yield from handle_events()
+
+
+def fetch_credential_index(
+    transport: Transport,
+    cache: CredentialIndex,
+    store_id: str,
+    mode: str = CACHE_DEFAULT,
+    on_event: Optional[Callable[[str, dict], None]] = None,
+) -> Tuple[Optional[dict], Optional[subprocess.CompletedProcess]]:
+    """
+    Get the credential index of a store, from the cache when fresh
+
+    On a miss `list-credentials-as-xml` is streamed through
+    `iter_credential_index`, so `on_event` sees each domain and credential as
+    soon as it is parsed. A cached index is replayed through `on_event` in the
+    same order.
+
+    Args:
+        transport: Transport used on cache misses
+        cache: Credential index cache
+        store_id: Credentials store ID
+        mode: CACHE_DEFAULT, CACHE_REFRESH or CACHE_OFF
+        on_event: Optional callback receiving ("domain" | "credential", item)
+
+    Returns:
+        Tuple of (index, None) on success, or (None, failed CompletedProcess).
+        With CACHE_OFF and a callback, credentials are only handed to the
+        callback and the returned index holds the domains alone.
+
+    Raises:
+        ET.ParseError: If the server returned malformed XML
+    """
+    if mode == CACHE_DEFAULT:
+        index = cache.load(store_id)
+        if index is not None:
+            if on_event is not None:
+                for domain in index["domains"]:
+                    on_event("domain", domain)
+                    for entry in index["credentials"].values():
+                        if entry["domain"] == domain["name"]:
+                            on_event("credential", entry)
+            index["cached"] = True
+            return index, None
+
+    keep_credentials = mode != CACHE_OFF or on_event is None
+    index = {"domains": [], "credentials": {}}
+    with transport.stream("list-credentials-as-xml", store_id) as output:
+        try:
+            for kind, item in iter_credential_index(output):
+                if kind == "domain":
+                    index["domains"].append(item)
+                elif keep_credentials:
+                    index["credentials"][item["id"]] = item
+                if on_event is not None:
+                    on_event(kind, item)
+        except ET.ParseError:
+            # A failed command prints nothing parseable: report the failure instead
+            if output.returncode in (None, 0):
+                raise
+
+    if output.returncode != 0:
+        failed = subprocess.CompletedProcess(
+            ["list-credentials-as-xml", store_id], output.returncode, "", output.stderr
+        )
+        return None, failed
+
+    index["fetched_at"] = time.time()
+    if mode != CACHE_OFF:
+        cache.store(store_id, index)
+    index["cached"] = False
+    return index, None
+
+
+def credential_element(entry: Dict[str, str]) -> ET.Element:
+    """Rebuild the XML element of an index entry, for the credential describers"""
+    return ET.fromstring(entry["xml"])
@@ -0,0 +1,372 @@
+"""Persistent jenkins-cli daemon
+
+Each `JenkinsCLI.run` normally forks `java -jar jenkins-cli.jar`, paying for JVM
+startup and class loading on every call. The daemon keeps a small pool of
+pre-started JVMs that already have jenkins-cli.jar loaded and the server
+arguments applied; a request only has to hand its command line and stdin to a
+warm JVM. Clients talk to the daemon over a Unix socket, it is started on first
+use and exits by itself after being idle.
+
+Enable it with `JENKINS_CLI_DAEMON=1` in `~/.jenkins-inspector/.env`.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import queue
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from jenkins_tools.core import JENKINS_CLI_JAR_PATH, JenkinsCLI, JenkinsConfig
+
+# Constants
+DAEMON_DIR = JENKINS_CLI_JAR_PATH.parent
+LAUNCHER_PATH = DAEMON_DIR / "CliLauncher.java"
+DAEMON_START_TIMEOUT = 10.0
+DAEMON_POOL_SIZE = 2
+DAEMON_SPARE_TIMEOUT = 15.0  # Seconds a request waits for a warm JVM
+DAEMON_ACCEPT_TIMEOUT = (
+    DAEMON_SPARE_TIMEOUT + 5.0
+)  # Seconds a client waits for a JVM to be assigned
+
+# Java launcher run in single-file source mode (Java 11+). It loads the CLI
+# classes up front, then blocks until the daemon sends a header line with the
+# base64-encoded command arguments. The rest of stdin is passed through to the
+# command unchanged.
+LAUNCHER_SOURCE = """
+import java.io.ByteArrayOutputStream;
+import java.io.InputStream;
+import java.lang.reflect.Method;
+import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
+import java.util.Base64;
+import java.util.List;
+
+public class CliLauncher {
+    public static void main(String[] baseArgs) throws Exception {
+        Method cliMain = Class.forName("hudson.cli.CLI").getMethod("main", String[].class);
+
+        InputStream in = System.in;
+        ByteArrayOutputStream header = new ByteArrayOutputStream();
+        int b;
+        while ((b = in.read()) != -1 && b != '\\n') {
+            header.write(b);
+        }
+        if (b == -1) {
+            return;
+        }
+
+        List<String> args = new ArrayList<>();
+        for (String arg : baseArgs) {
+            args.add(arg);
+        }
+        String line = new String(header.toByteArray(), StandardCharsets.US_ASCII).trim();
+        if (!line.isEmpty()) {
+            for (String encoded : line.split(" ")) {
+                args.add(new String(Base64.getDecoder().decode(encoded), StandardCharsets.UTF_8));
+            }
+        }
+        cliMain.invoke(null, (Object) args.toArray(new String[0]));
+    }
+}
+"""
+
+
+def get_socket_path(config: JenkinsConfig) -> Path:
+    """
+    Get the daemon socket path for a server/user/token combination
+
+    The warm JVMs get their credentials when they start, so a rotated API
+    token must not reuse a daemon started with the old one: it starts a new
+    daemon, and the old one exits once idle.
+    """
+    identity = f"{os.getuid()}:{config.jenkins_url}:{config.username}:{config.api_token}"
+    digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16]
+    return DAEMON_DIR / f"cli-daemon-{digest}.sock"
+
+
+def _encode_header(args: List[str]) -> str:
+    """Encode command arguments as the launcher header line"""
+    encoded = [base64.b64encode(arg.encode("utf-8")).decode("ascii") for arg in args]
+    return " ".join(encoded) + "\n"
+
+
+def _send_request(socket_path: Path, request: dict) -> dict:
+    """
+    Send one request to the daemon and return its decoded response
+
+    The daemon answers a command with an `accepted` line once a JVM runs it,
+    then with the result. Only the wait for `accepted` is bounded: the
+    command itself may legitimately run for a long time (e.g. `build -f`).
+
+    Raises:
+        socket.timeout: If the daemon did not accept the request in time; the
+                        command has not been run
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(DAEMON_ACCEPT_TIMEOUT)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+
+        with sock.makefile("rb") as reader:
+            response = json.loads(reader.readline().decode("utf-8"))
+            if response.get("accepted"):
+                sock.settimeout(None)
+                response = json.loads(reader.readline().decode("utf-8"))
+    return response
+
+
+def _start_daemon(socket_path: Path) -> bool:
+    """Start the daemon in the background and wait until its socket is ready"""
+    subprocess.Popen(
+        [sys.executable, "-m", "jenkins_tools.cli_daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if socket_path.exists():
+            try:
+                _send_request(socket_path, {"ping": True})
+                return True
+            except OSError:
+                pass
+        time.sleep(0.05)
+    return False
+
+
+def run_via_daemon(
+    config: JenkinsConfig, args: List[str], stdin_input: Optional[str] = None
+) -> Optional[subprocess.CompletedProcess]:
+    """
+    Run a jenkins-cli command through the daemon, starting it if needed
+
+    Args:
+        config: Jenkins configuration
+        args: Command and its arguments (without server/auth arguments)
+        stdin_input: Optional input to pass to command's stdin
+
+    Returns:
+        CompletedProcess object, or None if the daemon is unavailable and the
+        caller should run the command directly
+    """
+    socket_path = get_socket_path(config)
+    request = {"args": args, "stdin": stdin_input}
+
+    for attempt in range(2):
+        try:
+            response = _send_request(socket_path, request)
+        except socket.timeout:
+            # The daemon is running but hung; restarting it would not help
+            return None
+        except (OSError, ValueError):
+            if attempt > 0 or not _start_daemon(socket_path):
+                return None
+            continue
+
+        if "error" in response:
+            return None
+        return subprocess.CompletedProcess(
+            ["jenkins-cli"] + args,
+            response["returncode"],
+            stdout=response["stdout"],
+            stderr=response["stderr"],
+        )
+
+    return None
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle a single client request"""
+
+    def handle(self):
+        daemon = self.server.cli_daemon
+        daemon.begin_request()
+        self.started = False
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+            if request.get("ping"):
+                response = {"pong": True}
+            else:
+                response = daemon.execute(request["args"], request.get("stdin"), self._accepted)
+        except Exception as e:
+            if self.started:
+                # The command may have run, so the client must not run it again
+                response = {"returncode": 1, "stdout": "", "stderr": f"Error: {e}\n"}
+            else:
+                response = {"error": str(e)}
+        finally:
+            daemon.end_request()
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+    def _accepted(self):
+        self.started = True
+        self.wfile.write(b'{"accepted": true}\n')
+        self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class CLIDaemon:
+    """Serve jenkins-cli commands from a pool of warm JVMs"""
+
+    def __init__(self, config: JenkinsConfig, socket_path: Path, idle_timeout: int):
+        self.config = config
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.cli = JenkinsCLI(config)
+        self.spares = queue.Queue()
+        self.lock = threading.Lock()
+        self.spawning = 0  # JVMs being started, guarded by `lock`
+        self.active = 0
+        self.last_activity = time.monotonic()
+        self.server = None
+
+    def _refill(self) -> None:
+        """Start JVMs until spares plus those being started reach DAEMON_POOL_SIZE"""
+        with self.lock:
+            missing = DAEMON_POOL_SIZE - self.spares.qsize() - self.spawning
+            self.spawning += max(missing, 0)
+        for _ in range(missing):
+            threading.Thread(target=self._spawn, daemon=True).start()
+
+    def _spawn(self) -> None:
+        """
+        Start one warm JVM and add it to the pool (nothing is added if it fails)
+
+        Callers must have counted it in `spawning` (see `_refill`).
+        """
+        cmd = [
+            "java",
+            "-XX:TieredStopAtLevel=1",
+            "-cp",
+            str(self.cli.jar_path),
+            str(LAUNCHER_PATH),
+        ] + self.cli.get_server_args()
+
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except OSError:
+            proc = None
+        with self.lock:
+            if proc is not None:
+                self.spares.put(proc)
+            self.spawning -= 1
+
+    def begin_request(self) -> None:
+        with self.lock:
+            self.active += 1
+            self.last_activity = time.monotonic()
+
+    def end_request(self) -> None:
+        with self.lock:
+            self.active -= 1
+            self.last_activity = time.monotonic()
+
+    def execute(self, args: List[str], stdin_input: Optional[str], on_start=None) -> dict:
+        """
+        Run a command on a warm JVM and start its replacement
+
+        Args:
+            args: Command and its arguments
+            stdin_input: Optional input to pass to command's stdin
+            on_start: Called once a JVM has been assigned, before it runs
+
+        Raises:
+            RuntimeError: If no JVM is available; the command has not been run
+        """
+        # Tops the pool up if an earlier replacement failed to start or a burst
+        # drained it; never more than DAEMON_POOL_SIZE JVMs wait or start at once
+        self._refill()
+        try:
+            proc = self.spares.get(timeout=DAEMON_SPARE_TIMEOUT)
+        except queue.Empty:
+            raise RuntimeError("No CLI launcher available")
+        self._refill()
+
+        if proc.poll() is not None:
+            # The JVM died before receiving work (e.g. Java older than 11)
+            _, stderr = proc.communicate()
+            raise RuntimeError(f"CLI launcher exited early: {stderr.strip()}")
+
+        if on_start:
+            on_start()
+        stdout, stderr = proc.communicate(_encode_header(args) + (stdin_input or ""))
+        return {"returncode": proc.returncode, "stdout": stdout, "stderr": stderr}
+
+    def _watch_idle(self) -> None:
+        """Shut the server down after `idle_timeout` seconds without requests"""
+        while True:
+            time.sleep(1)
+            with self.lock:
+                idle = time.monotonic() - self.last_activity
+                if self.active == 0 and idle > self.idle_timeout:
+                    break
+        self.server.shutdown()
+
+    def serve_forever(self) -> None:
+        """Bind the socket and serve until idle"""
+        self.cli.ensure_cli_jar()
+        DAEMON_DIR.mkdir(parents=True, exist_ok=True)
+        LAUNCHER_PATH.write_text(LAUNCHER_SOURCE, encoding="utf-8")
+
+        if self.socket_path.exists():
+            try:
+                _send_request(self.socket_path, {"ping": True})
+                return  # Another daemon is already serving this socket
+            except OSError:
+                self.socket_path.unlink()
+
+        old_umask = os.umask(0o077)
+        try:
+            self.server = _UnixServer(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self.server.cli_daemon = self
+
+        self._refill()
+
+        threading.Thread(target=self._watch_idle, daemon=True).start()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            while not self.spares.empty():
+                self.spares.get().kill()
+
+
+def main():
+    """Daemon entry point (python -m jenkins_tools.cli_daemon)"""
+    config = JenkinsConfig()
+    if not config.is_configured():
+        print("Error: Jenkins credentials not configured.", file=sys.stderr)
+        sys.exit(1)
+
+    daemon = CLIDaemon(config, get_socket_path(config), config.cli_daemon_idle_timeout)
+    daemon.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,90 @@
-"""Jenkins CLI commands"""
-
-from jenkins_tools.commands.auth import AuthCommand
-from jenkins_tools.commands.list_views import ListViewsCommand
-from jenkins_tools.commands.list_jobs import ListJobsCommand
-from jenkins_tools.commands.get_job import GetJobCommand
-from jenkins_tools.commands.list_builds import ListBuildsCommand
-from jenkins_tools.commands.console import ConsoleCommand
-from jenkins_tools.commands.job_status import JobStatusCommand
-from jenkins_tools.commands.job_diff import JobDiffCommand
-from jenkins_tools.commands.list_credentials import ListCredentialsCommand
-from jenkins_tools.commands.describe_credentials import DescribeCredentialsCommand
-from jenkins_tools.commands.add_job_to_view import AddJobToViewCommand
-from jenkins_tools.commands.copy_job import CopyJobCommand
-from jenkins_tools.commands.update_job import UpdateJobCommand
-from jenkins_tools.commands.build import BuildCommand
-from jenkins_tools.commands.stop_builds import StopBuildsCommand
-from jenkins_tools.commands.create_job import CreateJobCommand
-from jenkins_tools.commands.delete_job import DeleteJobCommand
-from jenkins_tools.commands.disable_job import DisableJobCommand
-from jenkins_tools.commands.enable_job import EnableJobCommand
-from jenkins_tools.commands.delete_builds import DeleteBuildsCommand
-from jenkins_tools.commands.groovy import GroovyCommand
-from jenkins_tools.commands.help import HelpCommand
-from jenkins_tools.commands.prompt import PromptCommand
+"""Jenkins CLI commands
+
+Command modules are imported on first use: the registry below only maps command
+names to "module path, class name", so running one command (or `help`) does not
+import every other command and its dependencies.
+"""
+
+import importlib
+from collections.abc import Mapping
+
+# Command name -> (module path, class name)
+COMMAND_MODULES = {
+    "auth": ("jenkins_tools.commands.auth", "AuthCommand"),
+    "list-views": ("jenkins_tools.commands.list_views", "ListViewsCommand"),
+    "list-jobs": ("jenkins_tools.commands.list_jobs", "ListJobsCommand"),
+    "get-job": ("jenkins_tools.commands.get_job", "GetJobCommand"),
+    "list-builds": ("jenkins_tools.commands.list_builds", "ListBuildsCommand"),
+    "console": ("jenkins_tools.commands.console", "ConsoleCommand"),
+    "console-grep": ("jenkins_tools.commands.console_grep", "ConsoleGrepCommand"),
+    "job-status": ("jenkins_tools.commands.job_status", "JobStatusCommand"),
+    "build-stats": ("jenkins_tools.commands.build_stats", "BuildStatsCommand"),
+    "watch": ("jenkins_tools.commands.watch", "WatchCommand"),
+    "job-diff": ("jenkins_tools.commands.job_diff", "JobDiffCommand"),
+    "list-credentials": ("jenkins_tools.commands.list_credentials", "ListCredentialsCommand"),
+    "describe-credentials": (
+        "jenkins_tools.commands.describe_credentials",
+        "DescribeCredentialsCommand",
+    ),
+    "add-job-to-view": ("jenkins_tools.commands.add_job_to_view", "AddJobToViewCommand"),
+    "copy-job": ("jenkins_tools.commands.copy_job", "CopyJobCommand"),
+    "update-job": ("jenkins_tools.commands.update_job", "UpdateJobCommand"),
+    "build": ("jenkins_tools.commands.build", "BuildCommand"),
+    "wait": ("jenkins_tools.commands.wait", "WaitCommand"),
+    "stop-builds": ("jenkins_tools.commands.stop_builds", "StopBuildsCommand"),
+    "create-job": ("jenkins_tools.commands.create_job", "CreateJobCommand"),
+    "delete-job": ("jenkins_tools.commands.delete_job", "DeleteJobCommand"),
+    "disable-job": ("jenkins_tools.commands.disable_job", "DisableJobCommand"),
+    "enable-job": ("jenkins_tools.commands.enable_job", "EnableJobCommand"),
+    "delete-builds": ("jenkins_tools.commands.delete_builds", "DeleteBuildsCommand"),
+    "groovy": ("jenkins_tools.commands.groovy", "GroovyCommand"),
+    "snapshot": ("jenkins_tools.commands.snapshot", "SnapshotCommand"),
+    "index": ("jenkins_tools.commands.index", "IndexCommand"),
+    "find": ("jenkins_tools.commands.find", "FindCommand"),
+    "search-config": ("jenkins_tools.commands.search_config", "SearchConfigCommand"),
+    "batch": ("jenkins_tools.commands.batch", "BatchCommand"),
+    "prompt": ("jenkins_tools.commands.prompt", "PromptCommand"),
+    "help": ("jenkins_tools.commands.help", "HelpCommand"),
+}
+
+# Class name -> command name, for `from jenkins_tools.commands import XxxCommand`
+_CLASS_COMMANDS = {class_name: name for name, (_, class_name) in COMMAND_MODULES.items()}
+
+
+class LazyCommandRegistry(Mapping):
+    """Command name -> Command class mapping that imports each module on first access"""
+
+    def __init__(self, modules):
+        self._modules = modules
+        self._classes = {}
+
+    def __getitem__(self, name):
+        if name not in self._classes:
+            module_path, class_name = self._modules[name]
+            module = importlib.import_module(module_path)
+            self._classes[name] = getattr(module, class_name)
+        return self._classes[name]
+
+    def __contains__(self, name):
+        return name in self._modules
+
+    def __iter__(self):
+        return iter(self._modules)
+
+    def __len__(self):
+        return len(self._modules)
+
+
+# Command name -> Command class, used by the CLI and batch dispatch
+COMMAND_CLASSES = LazyCommandRegistry(COMMAND_MODULES)
+
+
+def __getattr__(name):
+    """Import command classes lazily on attribute access"""
+    if name in _CLASS_COMMANDS:
+        return COMMAND_CLASSES[_CLASS_COMMANDS[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "AuthCommand",
@@ -31,7 +93,10 @@ __all__ = [
     "GetJobCommand",
     "ListBuildsCommand",
     "ConsoleCommand",
+    "ConsoleGrepCommand",
     "JobStatusCommand",
+    "BuildStatsCommand",
+    "WatchCommand",
     "JobDiffCommand",
     "ListCredentialsCommand",
     "DescribeCredentialsCommand",
@@ -39,6 +104,7 @@ __all__ = [
     "CopyJobCommand",
     "UpdateJobCommand",
     "BuildCommand",
+    "WaitCommand",
     "StopBuildsCommand",
     "CreateJobCommand",
     "DeleteJobCommand",
@@ -46,6 +112,13 @@ __all__ = [
     "EnableJobCommand",
     "DeleteBuildsCommand",
     "GroovyCommand",
-    "HelpCommand",
+    "SnapshotCommand",
+    "IndexCommand",
+    "FindCommand",
+    "SearchConfigCommand",
+    "BatchCommand",
     "PromptCommand",
+    "HelpCommand",
+    "COMMAND_CLASSES",
+    "COMMAND_MODULES",
 ]
@@ -2,7 +2,7 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.core import Command, fan_out, parse_fan_out_options
 
 
 class AddJobToViewCommand(Command):
@@ -15,12 +15,13 @@ class AddJobToViewCommand(Command):
         Args:
             args: List of command arguments (sys.argv[2:])
                   First argument is view name, rest are job names
+                  Optional flags: --parallel N, --rate R
         """
         self.args = args
 
     def execute(self) -> int:
         """Execute add-job-to-view command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -29,18 +30,30 @@ class AddJobToViewCommand(Command):
             return 1
 
         # Parse arguments
-        if len(self.args) < 2:
+        try:
+            args, parallel, rate = parse_fan_out_options(self.args)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        if len(args) < 2:
             print("Error: View name and at least one job name are required.", file=sys.stderr)
             print(
-                "Usage: jks add-job-to-view <view-name> <job-name> [job-name ...]", file=sys.stderr
+                "Usage: jks add-job-to-view <view-name> <job-name> [job-name ...]"
+                " [--parallel N] [--rate R]",
+                file=sys.stderr,
             )
             return 1
 
-        view_name = self.args[0]
-        job_names = self.args[1:]
+        view_name = args[0]
+        job_names = args[1:]
 
         # Use Jenkins CLI to add jobs to view
-        cli = JenkinsCLI(config)
+        cli = self.open_transport(config)
+
+        if parallel > 1 and len(job_names) > 1:
+            return self._add_each(cli, view_name, job_names, parallel, rate)
+
         result = cli.run("add-job-to-view", view_name, *job_names)
 
         if result.returncode != 0:
@@ -55,3 +68,31 @@ class AddJobToViewCommand(Command):
             print(f"  - {job}")
 
         return 0
+
+    def _add_each(self, cli, view_name, job_names, parallel, rate) -> int:
+        """Add jobs one by one with bounded concurrency, reporting each job"""
+        failed_jobs = []
+
+        results = fan_out(
+            lambda job: cli.run("add-job-to-view", view_name, job), job_names, parallel, rate
+        )
+        for job_name, result in results:
+            if result.returncode == 0:
+                print(f"✓ Added job '{job_name}' to view '{view_name}'")
+            else:
+                failed_jobs.append(job_name)
+                print(
+                    f"Error: Failed to add job '{job_name}' to view '{view_name}'",
+                    file=sys.stderr,
+                )
+                if result.stderr:
+                    print(result.stderr, file=sys.stderr)
+
+        if failed_jobs:
+            success_count = len(job_names) - len(failed_jobs)
+            print(
+                f"Warning: {success_count} job(s) added, {len(failed_jobs)} failed",
+                file=sys.stderr,
+            )
+            return 1
+        return 0
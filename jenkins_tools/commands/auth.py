@@ -3,15 +3,24 @@
 import sys
 from pathlib import Path
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.core import Command
 
 
 class AuthCommand(Command):
     """Verify Jenkins authentication"""
 
+    def __init__(self, args=None):
+        """
+        Initialize with command line arguments
+
+        Args:
+            args: List of command arguments (sys.argv[2:]), unused
+        """
+        self.args = args or []
+
     def execute(self) -> int:
         """Execute auth command - verify credentials by running whoami"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -39,7 +48,7 @@ class AuthCommand(Command):
             return 1
 
         # Run who-am-i to verify authentication
-        cli = JenkinsCLI(config)
+        cli = self.open_transport(config)
         print("Verifying authentication...")
 
         result = cli.run("who-am-i")
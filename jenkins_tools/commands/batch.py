@@ -0,0 +1,155 @@
+"""Batch command"""
+
+import contextlib
+import io
+import json
+import shlex
+import sys
+from pathlib import Path
+
+from jenkins_tools.core import Command
+
+
+class BatchCommand(Command):
+    """Run many jenkee subcommands in one process sharing one session"""
+
+    def __init__(self, args=None):
+        """
+        Initialize with command line arguments
+
+        Args:
+            args: List of command arguments (sys.argv[2:])
+                  Optional path to a batch file (default: stdin)
+                  Optional flag: --stop-on-error
+        """
+        self.args = args or []
+
+    def execute(self) -> int:
+        """Execute batch command"""
+        # Imported here: the command registry itself imports this module
+        from jenkins_tools.commands import COMMAND_CLASSES
+
+        stop_on_error = "--stop-on-error" in self.args
+        paths = [arg for arg in self.args if arg != "--stop-on-error"]
+
+        if len(paths) > 1:
+            print("Error: Too many arguments", file=sys.stderr)
+            print("Usage: jenkee batch [file] [--stop-on-error]", file=sys.stderr)
+            return 1
+
+        if paths and paths[0] != "-":
+            batch_path = Path(paths[0])
+            if not batch_path.exists():
+                print(f"Error: Batch file not found: {batch_path}", file=sys.stderr)
+                return 1
+            source = batch_path.open(encoding="utf-8")
+        else:
+            if sys.stdin.isatty():
+                print("Error: No batch input provided.", file=sys.stderr)
+                print("Usage: jenkee batch [file] [--stop-on-error]", file=sys.stderr)
+                print("   or: jenkee batch < commands.txt", file=sys.stderr)
+                return 1
+            source = sys.stdin
+
+        config = self.load_config()
+        if not config.is_configured():
+            print("Error: Jenkins credentials not configured.", file=sys.stderr)
+            print(f"Run 'jenkee auth' to configure credentials.", file=sys.stderr)
+            return 1
+
+        # Subcommands share the process-wide session: one parsed config (re-read
+        # if .env changes mid-batch) and one transport
+        out = sys.stdout
+        exit_code = 0
+        seq = 0
+
+        with source:
+            for line in source:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                seq += 1
+                try:
+                    argv, stdin_input = self._parse_line(line)
+                except ValueError as e:
+                    record = {"seq": seq, "args": None, "returncode": 2, "stdout": ""}
+                    record["stderr"] = f"Error: Invalid batch line: {e}\n"
+                else:
+                    record = {"seq": seq}
+                    record.update(self._run(COMMAND_CLASSES, argv, stdin_input))
+
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+
+                if record["returncode"] != 0:
+                    exit_code = 1
+                    if stop_on_error:
+                        break
+
+        return exit_code
+
+    def _parse_line(self, line: str):
+        """
+        Parse one batch line
+
+        Accepted forms:
+            get-job my-job                                  (shell-style words)
+            ["get-job", "my-job"]                           (JSON array)
+            {"args": ["update-job", "my-job"], "stdin": ""} (JSON object)
+
+        Returns:
+            Tuple of (argv, stdin_input)
+        """
+        if line.startswith("[") or line.startswith("{"):
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(str(e))
+            if isinstance(data, dict):
+                argv, stdin_input = data.get("args"), data.get("stdin")
+            else:
+                argv, stdin_input = data, None
+            if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+                raise ValueError("'args' must be a list of strings")
+        else:
+            argv, stdin_input = shlex.split(line), None
+
+        if not argv:
+            raise ValueError("empty command")
+        return argv, stdin_input
+
+    def _run(self, command_classes, argv, stdin_input) -> dict:
+        """Run one subcommand and capture its output as a record"""
+        record = {"args": argv}
+        command_class = command_classes.get(argv[0])
+
+        if command_class is None or command_class is BatchCommand:
+            record.update(returncode=1, stdout="")
+            record["stderr"] = f"Error: Unknown command '{argv[0]}'\n"
+            return record
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        saved_stdin = sys.stdin
+        sys.stdin = io.StringIO(stdin_input or "")
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    command = command_class.from_args(argv[1:])
+                except ValueError as e:
+                    print(f"Error: {e}", file=sys.stderr)
+                    returncode = 1
+                else:
+                    try:
+                        returncode = command.execute()
+                    except SystemExit as e:
+                        returncode = e.code if isinstance(e.code, int) else 1
+                    except Exception as e:
+                        # One failing subcommand must not abort the rest of the batch
+                        print(f"Error: {type(e).__name__}: {e}", file=sys.stderr)
+                        returncode = 1
+        finally:
+            sys.stdin = saved_stdin
+
+        record.update(returncode=returncode, stdout=stdout.getvalue(), stderr=stderr.getvalue())
+        return record
@@ -1,13 +1,34 @@
 """Build command"""
 
 import sys
+import time
+from http.client import HTTPException
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.build_queue import find_queued, poll_queue_items, queued_items, read_matrix
+from jenkins_tools.core import (
+    OUTPUT_FORMATS,
+    Command,
+    fan_out,
+    get_http_backend,
+    parse_fan_out_options,
+)
+
+# Constants
+MATRIX_MIN_INTERVAL = 2.0  # Seconds between queue polls right after a build started
+MATRIX_MAX_INTERVAL = 15.0  # Upper bound while nothing changes
+MATRIX_BACKOFF = 1.5  # Interval growth per quiet poll
+MATRIX_RETRIES = 10  # Consecutive failed polls before giving up
 
 
 class BuildCommand(Command):
     """Trigger a Jenkins job build"""
 
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
+    # Record fields, in tsv column order
+    RECORD_FIELDS = ["job", "queueId"]
+    MATRIX_RECORD_FIELDS = ["row", "params", "status", "queueId", "number", "error"]
+
     def __init__(self, args=None):
         """
         Initialize with command line arguments
@@ -16,12 +37,13 @@ class BuildCommand(Command):
             args: List of command arguments (sys.argv[2:])
                   First argument is job name
                   Optional flags: -p key=value (multiple), -s, -f, -v
+                  Matrix flags: --matrix FILE, --no-wait, --parallel N, --rate R
         """
         self.args = args or []
 
     def execute(self) -> int:
         """Execute build command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -35,38 +57,62 @@ class BuildCommand(Command):
             print(
                 "Usage: jenkee build <job-name> [-p key=value ...] [-s] [-f] [-v]", file=sys.stderr
             )
+            print(
+                "       jenkee build <job-name> --matrix FILE [-p key=value ...] [--no-wait] "
+                "[--parallel N] [--rate R]",
+                file=sys.stderr,
+            )
             print("", file=sys.stderr)
             print("Options:", file=sys.stderr)
             print("  -p key=value  Build parameters (can be used multiple times)", file=sys.stderr)
             print("  -s            Wait until build completion", file=sys.stderr)
             print("  -f            Follow build progress (implies -s)", file=sys.stderr)
             print("  -v            Print console output (use with -s or -f)", file=sys.stderr)
+            print(
+                "  --matrix FILE Queue one build per row of a .csv or .jsonl file", file=sys.stderr
+            )
+            print("  --no-wait     Do not wait for matrix build numbers", file=sys.stderr)
             return 1
 
         job_name = self.args[0]
 
         # Parse flags and parameters
-        cli_args = []
-        i = 1
-        while i < len(self.args):
-            arg = self.args[i]
-            if arg == "-p" and i + 1 < len(self.args):
-                # Build parameter
-                cli_args.append("-p")
-                cli_args.append(self.args[i + 1])
-                i += 2
-            elif arg in ["-s", "-f", "-v"]:
-                # Boolean flags
-                cli_args.append(arg)
-                i += 1
-            else:
-                print(f"Error: Unknown option '{arg}'", file=sys.stderr)
+        try:
+            cli_args, matrix, no_wait, parallel, rate = self._parse_args(self.args[1:])
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        # Without -s/-f/-v, queue over HTTP and report the queue item right away
+        cli = self.open_transport(config)
+        http = get_http_backend(cli)
+        waits = any(arg in ("-s", "-f", "-v") for arg in cli_args)
+        if matrix is not None:
+            if waits:
+                print("Error: --matrix cannot be combined with -s, -f or -v", file=sys.stderr)
+                return 1
+            if http is None:
+                print(
+                    "Error: --matrix requires the HTTP transport (JENKINS_TRANSPORT=auto or http)",
+                    file=sys.stderr,
+                )
                 return 1
+            return self._build_matrix(http, job_name, cli_args, matrix, no_wait, parallel, rate)
+        if http is not None and not waits:
+            return self._trigger(http, job_name, cli_args)
+        if self.wants_records() and waits:
+            print("Error: --format cannot be combined with -s, -f or -v", file=sys.stderr)
+            return 1
 
         # Execute build command
-        cli = JenkinsCLI(config)
         result = cli.run("build", job_name, *cli_args)
 
+        if result.returncode == 0 and self.wants_records():
+            # jenkins-cli.jar does not report the queue item
+            writer = self.record_writer(self.RECORD_FIELDS, single=True)
+            writer.write({"job": job_name, "queueId": None})
+            writer.close()
+            return 0
         if result.returncode == 0:
             # Success
             output = result.stdout.strip() if result.stdout else ""
@@ -81,3 +127,242 @@ class BuildCommand(Command):
             if result.stderr:
                 print(result.stderr, file=sys.stderr)
             return 1
+
+    @staticmethod
+    def _parse_args(args):
+        """
+        Split build parameters and flags
+
+        Returns:
+            Tuple of (jenkins-cli.jar args: -p key=value pairs and -s/-f/-v
+            flags, matrix file or None, no wait, parallel, rate)
+
+        Raises:
+            ValueError: If an option is unknown or used without --matrix
+        """
+        args, parallel, rate = parse_fan_out_options(args)
+
+        cli_args = []
+        matrix = None
+        no_wait = False
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if arg == "-p" and i + 1 < len(args):
+                # Build parameter
+                cli_args.append("-p")
+                cli_args.append(args[i + 1])
+                i += 2
+            elif arg in ["-s", "-f", "-v"]:
+                # Boolean flags
+                cli_args.append(arg)
+                i += 1
+            elif arg == "--matrix":
+                if i + 1 >= len(args):
+                    raise ValueError("Missing value for --matrix")
+                matrix = args[i + 1]
+                i += 2
+            elif arg == "--no-wait":
+                no_wait = True
+                i += 1
+            else:
+                raise ValueError(f"Unknown option '{arg}'")
+
+        if matrix is None and (no_wait or parallel != 1 or rate):
+            raise ValueError("--no-wait, --parallel and --rate require --matrix")
+        return cli_args, matrix, no_wait, parallel, rate
+
+    @staticmethod
+    def _params(cli_args):
+        """Get the (key, value) build parameters from -p key=value args"""
+        return [
+            tuple(cli_args[i + 1].partition("=")[::2])
+            for i in range(0, len(cli_args), 2)
+            if cli_args[i] == "-p"
+        ]
+
+    def _trigger(self, http, job_name: str, cli_args) -> int:
+        """Queue the build over HTTP and print its queue item ID"""
+        try:
+            status, queue_id, data = http.trigger_build(job_name, self._params(cli_args))
+        except (OSError, HTTPException) as e:
+            status, queue_id, data = 0, None, f"ERROR: {e}".encode("utf-8")
+
+        if status == 0 or status >= 400:
+            print(f"Error: Failed to build job '{job_name}'", file=sys.stderr)
+            if status == 404:
+                print(f"ERROR: No such job '{job_name}'", file=sys.stderr)
+            elif data:
+                print(data.decode("utf-8", errors="replace").strip(), file=sys.stderr)
+            return 1
+
+        if self.wants_records():
+            writer = self.record_writer(self.RECORD_FIELDS, single=True)
+            writer.write({"job": job_name, "queueId": queue_id})
+            writer.close()
+        elif queue_id is not None:
+            print(f"✓ Build triggered for job '{job_name}' (queue item {queue_id})")
+        else:
+            print(f"✓ Build triggered for job '{job_name}'")
+        return 0
+
+    def _build_matrix(self, http, job_name, cli_args, path, no_wait, parallel, rate) -> int:
+        """
+        Queue one build per matrix row and report each row's queue item and build
+
+        Rows override the -p parameters. A row is skipped when the job already
+        has a queued build with the same parameter values, or when an earlier
+        row has the same values; both reuse that queue item. The remaining
+        rows are submitted with bounded concurrency.
+        """
+        try:
+            rows = read_matrix(path)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        if not rows:
+            print(f"Error: No rows in {path}", file=sys.stderr)
+            return 1
+
+        try:
+            queued = queued_items(http)
+        except (OSError, HTTPException, ValueError) as e:
+            print(f"Error: Failed to read the build queue: {e}", file=sys.stderr)
+            return 1
+
+        base = dict(self._params(cli_args))
+        results = []
+        first_rows = {}  # parameter values -> first row with them
+        submit = []
+        for n, row in enumerate(rows, 1):
+            params = dict(base, **row)
+            result = {field: None for field in self.MATRIX_RECORD_FIELDS}
+            result.update(row=n, params=params)
+            results.append(result)
+
+            key = tuple(sorted(params.items()))
+            if key in first_rows:
+                result.update(status="duplicate", duplicateOf=first_rows[key])
+                continue
+            first_rows[key] = result
+            queue_id = find_queued(queued, job_name, params)
+            if queue_id is not None:
+                result.update(status="skipped", queueId=queue_id)
+            else:
+                submit.append(result)
+
+        def trigger(result):
+            try:
+                return http.trigger_build(job_name, list(result["params"].items()))
+            except (OSError, HTTPException) as e:
+                return 0, None, str(e).encode("utf-8")
+
+        for result, (status, queue_id, data) in fan_out(trigger, submit, parallel, rate):
+            if status == 0 or status >= 400:
+                message = data.decode("utf-8", errors="replace").strip().splitlines()
+                if status == 404:
+                    error = f"No such job '{job_name}'"
+                elif status:
+                    error = f"HTTP {status}" + (f": {message[0]}" if message else "")
+                else:
+                    error = message[0] if message else "Connection failed"
+                result.update(status="failed", error=error)
+            else:
+                result.update(status="queued", queueId=queue_id)
+
+        if not no_wait:
+            self._resolve_numbers(http, results)
+
+        for result in results:
+            first = result.pop("duplicateOf", None)
+            if first is not None:
+                result.update(queueId=first["queueId"], number=first["number"])
+                if first["status"] in ("failed", "cancelled"):
+                    result.update(status=first["status"], error=first["error"])
+
+        return self._print_matrix(job_name, results)
+
+    def _resolve_numbers(self, http, results) -> None:
+        """
+        Poll the queue until every queued row has a build number
+
+        Each poll costs one `/queue/api/json` request plus one request per
+        item that left the queue since the last poll.
+        """
+        waiting = {}  # queue ID -> rows
+        for result in results:
+            if result["queueId"] is not None:
+                waiting.setdefault(result["queueId"], []).append(result)
+
+        interval = MATRIX_MIN_INTERVAL
+        errors = 0
+        try:
+            while waiting:
+                try:
+                    states = poll_queue_items(http, waiting)
+                except (OSError, HTTPException, ValueError) as e:
+                    errors += 1
+                    if errors > MATRIX_RETRIES:
+                        print(f"Warning: Stopped waiting for build numbers: {e}", file=sys.stderr)
+                        return
+                    time.sleep(min(MATRIX_MIN_INTERVAL * 2**errors, MATRIX_MAX_INTERVAL))
+                    continue
+                errors = 0
+
+                changed = False
+                for queue_id, state in states.items():
+                    if state["state"] in ("queued", "leaving"):
+                        continue
+                    changed = True
+                    for result in waiting.pop(queue_id):
+                        if state["state"] == "started":
+                            result["number"] = state["number"]
+                        elif state["state"] == "cancelled":
+                            result.update(status="cancelled", error="Cancelled in the queue")
+                        else:
+                            result["error"] = "Queue item no longer known to Jenkins"
+                if waiting:
+                    interval = (
+                        MATRIX_MIN_INTERVAL
+                        if changed
+                        else min(interval * MATRIX_BACKOFF, MATRIX_MAX_INTERVAL)
+                    )
+                    time.sleep(interval)
+        except KeyboardInterrupt:
+            print("Warning: Stopped waiting for build numbers", file=sys.stderr)
+
+    def _print_matrix(self, job_name: str, results) -> int:
+        """Print one line or record per matrix row"""
+        failed = [r for r in results if r["status"] in ("failed", "cancelled")]
+
+        if self.wants_records():
+            writer = self.record_writer(self.MATRIX_RECORD_FIELDS)
+            for result in results:
+                writer.write(result)
+            writer.close()
+            return 1 if failed else 0
+
+        for result in results:
+            params = " ".join(f"{key}={value}" for key, value in result["params"].items())
+            label = f"Row {result['row']} ({params})"
+            if result["status"] in ("failed", "cancelled"):
+                print(f"Error: {label}: {result['error']}", file=sys.stderr)
+                continue
+            where = f"queue item {result['queueId']}"
+            if result["number"] is not None:
+                where += f", build #{result['number']}"
+            if result["status"] == "queued":
+                print(f"✓ {label}: {where}")
+            elif result["status"] == "skipped":
+                print(f"- {label}: already queued as {where}")
+            else:
+                print(f"- {label}: same as an earlier row, {where}")
+            if result["error"]:
+                print(f"Warning: {label}: {result['error']}", file=sys.stderr)
+
+        counts = {}
+        for result in results:
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        summary = ", ".join(f"{count} {status}" for status, count in counts.items())
+        print(f"Job '{job_name}': {len(results)} row(s), {summary}")
+        return 1 if failed else 0
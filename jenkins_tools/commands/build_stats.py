@@ -0,0 +1,225 @@
+"""Build statistics command"""
+
+import json
+import sys
+
+from jenkins_tools.build_history import format_duration, parse_history_options
+from jenkins_tools.build_stats import (
+    COLUMNS_PREFIX,
+    DEFAULT_LIMIT,
+    JOB_PREFIX,
+    VIEW_PREFIX,
+    cache_state,
+    columns_script,
+    merge_columns,
+    pool,
+    resolve_script,
+    summarize,
+    window,
+)
+from jenkins_tools.cache import (
+    CACHE_OFF,
+    CACHE_REFRESH,
+    BuildRecordCache,
+    parse_cache_options,
+)
+from jenkins_tools.core import OUTPUT_FORMATS, Command
+
+
+class BuildStatsCommand(Command):
+    """Report duration percentiles, failure rates, flakiness and trends of builds"""
+
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
+    # Record fields, in tsv column order
+    RECORD_FIELDS = [
+        "scope",
+        "name",
+        "builds",
+        "failures",
+        "failureRate",
+        "flakiness",
+        "p50",
+        "p95",
+        "mean",
+        "durationTrend",
+        "failureRateTrend",
+        "streakResult",
+        "streak",
+        "longestFailureStreak",
+    ]
+
+    def __init__(self, args=None):
+        """
+        Initialize with command line arguments
+
+        Args:
+            args: List of command arguments (sys.argv[2:])
+                  Job or view name
+                  Optional flags: --limit N, --since WHEN, --no-cache, --refresh
+        """
+        self.args = args or []
+
+    def execute(self) -> int:
+        """Execute build-stats command"""
+        config = self.load_config()
+
+        # Check if credentials are configured
+        if not config.is_configured():
+            print("Error: Jenkins credentials not configured.", file=sys.stderr)
+            print(f"Run 'jenkee auth' to configure credentials.", file=sys.stderr)
+            return 1
+
+        # Parse arguments
+        args, cache_mode = parse_cache_options(self.args)
+        try:
+            args, limit, since, build_range = parse_history_options(args)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        if build_range:
+            print("Error: --range is not supported by build-stats", file=sys.stderr)
+            return 1
+        if len(args) != 1:
+            print("Error: Expected exactly one job or view name", file=sys.stderr)
+            print(
+                "Usage: jenkee build-stats <job|view> [--limit N] [--since WHEN] "
+                "[--no-cache|--refresh]",
+                file=sys.stderr,
+            )
+            return 1
+        target = args[0]
+        limit = limit or DEFAULT_LIMIT
+
+        cli = self.open_transport(config)
+        view_name, job_names = self._resolve(cli, target)
+        if job_names is None:
+            return 1
+
+        # Fetch only the builds each job's cache is missing
+        cache = BuildRecordCache(config)
+        cached = {}
+        for name in job_names:
+            if cache_mode not in (CACHE_OFF, CACHE_REFRESH):
+                cached[name] = cache.load(name)
+        known = {name: cache_state(cached.get(name), limit) for name in job_names}
+
+        merged = {}
+        fetched_count = 0
+        other_lines = []
+        with cli.stream("groovy", "=", stdin_input=columns_script(known, limit)) as output:
+            for line in output:
+                if line.startswith(COLUMNS_PREFIX):
+                    fetched = json.loads(line[len(COLUMNS_PREFIX) :])
+                    name = fetched["name"]
+                    merged[name] = merge_columns(cached.get(name), fetched)
+                    fetched_count += len(fetched["numbers"])
+                    if cache_mode != CACHE_OFF:
+                        cache.store(name, merged[name])
+                elif line.strip():
+                    other_lines.append(line.rstrip("\n"))
+
+        if output.returncode != 0 or other_lines:
+            print(f"Error: Failed to fetch builds for '{target}'", file=sys.stderr)
+            if output.stderr:
+                print(output.stderr, file=sys.stderr)
+            if other_lines:
+                print("\n".join(other_lines), file=sys.stderr)
+            return 1
+
+        # Aggregate each job's window, and the pooled builds of a view
+        windows = {name: window(merged[name], limit, since) for name in job_names if name in merged}
+        rows = [
+            {"scope": "job", "name": name, **summarize(columns)}
+            for name, columns in windows.items()
+        ]
+        if view_name is not None:
+            rows.append(
+                {
+                    "scope": "view",
+                    "name": view_name,
+                    **summarize(pool(list(windows.values())), False),
+                }
+            )
+
+        if self.wants_records():
+            writer = self.record_writer(self.RECORD_FIELDS)
+            for row in rows:
+                writer.write(row)
+            writer.close()
+            return 0
+
+        self._print_table(rows)
+        cached_count = sum(len(columns["numbers"]) for columns in merged.values()) - fetched_count
+        print()
+        print(
+            f"Fetched {fetched_count} new build(s) for {len(merged)} job(s), "
+            f"{max(cached_count, 0)} from cache"
+        )
+        return 0
+
+    def _resolve(self, cli, target: str):
+        """
+        Resolve a job or view name to the job names to analyze
+
+        Returns:
+            Tuple of (view name or None, list of job names), or (None, None) on error
+        """
+        view_name = None
+        job_names = []
+        other_lines = []
+        with cli.stream("groovy", "=", stdin_input=resolve_script(target)) as output:
+            for line in output:
+                line = line.rstrip("\n")
+                if line.startswith(JOB_PREFIX):
+                    job_names.append(line[len(JOB_PREFIX) :])
+                elif line.startswith(VIEW_PREFIX):
+                    view_name = line[len(VIEW_PREFIX) :]
+                elif line.strip():
+                    other_lines.append(line)
+
+        if output.returncode != 0:
+            print(f"Error: Failed to look up '{target}'", file=sys.stderr)
+            if output.stderr:
+                print(output.stderr, file=sys.stderr)
+            return None, None
+        if other_lines and other_lines[0].startswith("ERROR:"):
+            print(f"Error: No job or view named '{target}'", file=sys.stderr)
+            return None, None
+        if other_lines:
+            # Anything that is not a name is a script error reported by the server
+            print("\n".join(other_lines), file=sys.stderr)
+            return None, None
+        return view_name, job_names
+
+    def _print_table(self, rows) -> None:
+        """Print one line of statistics per job, then the view total"""
+
+        def percent(value, signed=False):
+            if value is None:
+                return "-"
+            return f"{value * 100:+.1f}%" if signed else f"{value * 100:.1f}%"
+
+        def duration(value):
+            return "-" if value is None else format_duration(int(value))
+
+        width = max(
+            [len("NAME")]
+            + [len(row["name"]) + (7 if row["scope"] == "view" else 0) for row in rows]
+        )
+        header = (
+            f"{'NAME':<{width}}  {'BUILDS':>6}  {'FAIL%':>6}  {'FAILΔ':>7}  {'FLAKY':>5}  "
+            f"{'P50':>8}  {'P95':>8}  {'P50Δ':>7}  {'STREAK':<14}  MAX-FAIL-STREAK"
+        )
+        print(header)
+        for row in rows:
+            name = row["name"] if row["scope"] == "job" else f"(view) {row['name']}"
+            flakiness = "-" if row["flakiness"] is None else f"{row['flakiness']:.2f}"
+            streak = f"{row['streakResult']} x{row['streak']}" if row["streak"] else "-"
+            longest = "-" if row["longestFailureStreak"] is None else row["longestFailureStreak"]
+            print(
+                f"{name:<{width}}  {row['builds']:>6}  {percent(row['failureRate']):>6}  "
+                f"{percent(row['failureRateTrend'], True):>7}  {flakiness:>5}  "
+                f"{duration(row['p50']):>8}  {duration(row['p95']):>8}  "
+                f"{percent(row['durationTrend'], True):>7}  {streak:<14}  {longest}"
+            )
@@ -1,8 +1,16 @@
 """Console command"""
 
+import codecs
 import sys
+import time
+from http.client import HTTPException
+from pathlib import Path
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.core import Command, get_http_backend
+
+# Constants
+CONSOLE_POLL_INTERVAL = 2.0  # Seconds between polls while following a running build
+CONSOLE_RETRIES = 5  # Reconnect attempts after a dropped connection
 
 
 class ConsoleCommand(Command):
@@ -14,12 +22,14 @@ class ConsoleCommand(Command):
 
         Args:
             args: List of command arguments (sys.argv[2:])
+                  Job name, optional build number
+                  Optional flags: -f/--follow, --offset N, --offset-file PATH
         """
         self.args = args
 
     def execute(self) -> int:
         """Execute console command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -28,26 +38,205 @@ class ConsoleCommand(Command):
             return 1
 
         # Parse arguments
-        if not self.args:
-            print("Error: Missing job name", file=sys.stderr)
-            print("Usage: jks console <job-name> [build-number]", file=sys.stderr)
+        try:
+            positional, follow, offset, offset_file = self._parse_args(self.args)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
             return 1
 
-        job_name = self.args[0]
-        build_number = self.args[1] if len(self.args) > 1 else "lastBuild"
-
-        # Execute console command
-        cli = JenkinsCLI(config)
-        result = cli.run("console", job_name, build_number)
-
-        if result.returncode == 0:
-            print(result.stdout, end="")
-            return 0
-        else:
+        if not positional:
+            print("Error: Missing job name", file=sys.stderr)
             print(
-                f"Error: Failed to get console output for job '{job_name}' build {build_number}",
+                "Usage: jks console <job-name> [build-number] [-f] [--offset N] "
+                "[--offset-file PATH]",
                 file=sys.stderr,
             )
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
             return 1
+
+        job_name = positional[0]
+        build_number = positional[1] if len(positional) > 1 else "lastBuild"
+
+        # Stream console output
+        cli = self.open_transport(config)
+        http = get_http_backend(cli)
+        if http is None:
+            if offset is not None or offset_file is not None:
+                print(
+                    "Error: --offset and --offset-file require the HTTP transport", file=sys.stderr
+                )
+                return 1
+            return self._stream_cli(cli, job_name, build_number, follow)
+
+        return self._stream_http(http, job_name, build_number, follow, offset, offset_file)
+
+    def _parse_args(self, args):
+        """
+        Split flags from positional arguments
+
+        Returns:
+            Tuple of (positional args, follow, offset or None, offset file or None)
+        """
+        positional = []
+        follow = False
+        offset = None
+        offset_file = None
+
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if arg in ("-f", "--follow"):
+                follow = True
+            elif arg in ("--offset", "--offset-file"):
+                if i + 1 >= len(args):
+                    raise ValueError(f"{arg} requires a value")
+                value = args[i + 1]
+                i += 1
+                if arg == "--offset":
+                    if not value.isdigit():
+                        raise ValueError(f"Invalid offset: {value}")
+                    offset = int(value)
+                else:
+                    offset_file = Path(value)
+            else:
+                positional.append(arg)
+            i += 1
+
+        return positional, follow, offset, offset_file
+
+    def _stream_cli(self, cli, job_name: str, build_number: str, follow: bool) -> int:
+        """Stream console output through jenkins-cli.jar"""
+        args = [job_name, build_number] + (["-f"] if follow else [])
+        with cli.stream("console", *args) as output:
+            for line in output:
+                sys.stdout.write(line)
+                sys.stdout.flush()
+
+        if output.returncode != 0:
+            self._print_error(job_name, build_number, output.stderr)
+            return 1
+        return 0
+
+    def _stream_http(
+        self, http, job_name: str, build_number: str, follow: bool, offset, offset_file
+    ) -> int:
+        """
+        Stream console output through logText/progressiveText
+
+        Each request asks for the log from the last known byte offset; with
+        --follow the endpoint is polled until the build finishes. The offset
+        advances with every chunk written, so a read that fails midway is
+        retried after the output already printed. It is saved to
+        `offset_file` as "<build number> <offset>" after every read and when
+        streaming stops, so an interrupted run can be resumed where it
+        stopped, on the same build even if a permalink has moved since.
+        """
+        saved_number, saved_offset = None, None
+        if offset_file is not None and offset_file.exists():
+            saved_number, saved_offset = self._read_offset_file(offset_file)
+
+        if saved_number is not None:
+            if build_number.isdigit() and build_number != saved_number:
+                self._print_error(
+                    job_name,
+                    build_number,
+                    f"ERROR: {offset_file} records the offset of build {saved_number}",
+                )
+                return 1
+            build_number = saved_number
+
+        start = offset if offset is not None else saved_offset or 0
+
+        # Pin permalinks such as lastBuild so that polling and resuming stay on
+        # the same build even if a newer one starts
+        if not build_number.isdigit():
+            try:
+                status, data = http.get_json(
+                    f"{http.item_path(job_name)}/{build_number}", tree="number"
+                )
+            except (OSError, HTTPException) as e:
+                self._print_error(job_name, build_number, f"ERROR: {e}")
+                return 1
+            if status != 200 or not data:
+                self._print_error(
+                    job_name,
+                    build_number,
+                    f"ERROR: No such job '{job_name}' or build {build_number}",
+                )
+                return 1
+            build_number = str(data["number"])
+
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        position = start  # Offset just past the last byte handed to the decoder
+
+        def write(chunk: bytes) -> None:
+            nonlocal position
+            position += len(chunk)
+            sys.stdout.write(decoder.decode(chunk))
+            sys.stdout.flush()
+
+        def save_offset() -> None:
+            if offset_file is not None:
+                # The decoder may hold the start of a character that was not printed yet
+                pending = len(decoder.getstate()[0])
+                offset_file.write_text(f"{build_number} {position - pending}\n", encoding="utf-8")
+
+        retries = 0
+        try:
+            while True:
+                try:
+                    status, next_start, more_data = http.read_progressive_text(
+                        job_name, build_number, position, write
+                    )
+                except (OSError, HTTPException) as e:
+                    retries += 1
+                    if retries > CONSOLE_RETRIES:
+                        self._print_error(job_name, build_number, f"ERROR: {e}")
+                        if offset_file is not None:
+                            print(f"Resume with: --offset-file {offset_file}", file=sys.stderr)
+                        return 1
+                    time.sleep(min(2**retries, 30))
+                    continue
+
+                retries = 0
+                if status != 200:
+                    self._print_error(
+                        job_name,
+                        build_number,
+                        f"ERROR: No such job '{job_name}' or build {build_number}",
+                    )
+                    return 1
+
+                position = next_start
+                save_offset()
+                if not (follow and more_data):
+                    break
+                time.sleep(CONSOLE_POLL_INTERVAL)
+        finally:
+            save_offset()
+
+        sys.stdout.write(decoder.decode(b"", final=True))
+        sys.stdout.flush()
+        return 0
+
+    def _read_offset_file(self, offset_file: Path):
+        """
+        Read a saved position
+
+        Returns:
+            Tuple of (build number or None, offset or None). Files written
+            before build numbers were saved hold the offset alone.
+        """
+        fields = offset_file.read_text(encoding="utf-8").split()
+        if len(fields) == 2 and all(field.isdigit() for field in fields):
+            return fields[0], int(fields[1])
+        if len(fields) == 1 and fields[0].isdigit():
+            return None, int(fields[0])
+        return None, None
+
+    def _print_error(self, job_name: str, build_number: str, detail: str) -> None:
+        print(
+            f"Error: Failed to get console output for job '{job_name}' build {build_number}",
+            file=sys.stderr,
+        )
+        if detail:
+            print(detail, file=sys.stderr)
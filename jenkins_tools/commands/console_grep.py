@@ -0,0 +1,227 @@
+"""Console grep command"""
+
+import json
+import sys
+
+from jenkins_tools.core import Command
+from jenkins_tools.groovy_scripts import groovy_string
+
+# Prefix of each matched/context line record in the script output
+RECORD_PREFIX = "LINE "
+
+
+def parse_build_range(spec: str):
+    """
+    Parse a build range such as "120", "100-150" or "1-5,9,20-"
+
+    Returns:
+        List of [first, last] pairs; last is None for an open-ended range
+
+    Raises:
+        ValueError: If the range is malformed
+    """
+    ranges = []
+    for part in spec.split(","):
+        part = part.strip()
+        first, dash, last = part.partition("-")
+        if not first.isdigit() or (last and not last.isdigit()):
+            raise ValueError(f"Invalid build range: '{spec}'")
+        if not dash:
+            ranges.append([int(first), int(first)])
+        else:
+            ranges.append([int(first), int(last) if last else None])
+    return ranges
+
+
+class ConsoleGrepCommand(Command):
+    """Search console logs of many builds on the server"""
+
+    def __init__(self, args=None):
+        """
+        Initialize with command line arguments
+
+        Args:
+            args: List of command arguments (sys.argv[2:])
+                  Job name and regular expression (Java syntax)
+                  Optional flags: --builds RANGE, --context N, --max-count N, -i
+        """
+        self.args = args or []
+
+    def execute(self) -> int:
+        """Execute console-grep command"""
+        config = self.load_config()
+
+        # Check if credentials are configured
+        if not config.is_configured():
+            print("Error: Jenkins credentials not configured.", file=sys.stderr)
+            print(f"Run 'jenkee auth' to configure credentials.", file=sys.stderr)
+            return 1
+
+        # Parse arguments
+        positional = []
+        ranges = None
+        context = 0
+        max_count = 0
+        ignore_case = False
+        i = 0
+        try:
+            while i < len(self.args):
+                arg = self.args[i]
+                if arg in ("--builds", "--context", "--max-count") and i + 1 < len(self.args):
+                    value = self.args[i + 1]
+                    if arg == "--builds":
+                        ranges = parse_build_range(value)
+                    elif not value.isdigit():
+                        raise ValueError(f"Invalid value for {arg}: '{value}'")
+                    elif arg == "--context":
+                        context = int(value)
+                    else:
+                        max_count = int(value)
+                    i += 2
+                    continue
+                if arg in ("-i", "--ignore-case"):
+                    ignore_case = True
+                elif arg.startswith("--"):
+                    raise ValueError(f"Unknown option '{arg}'")
+                else:
+                    positional.append(arg)
+                i += 1
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        if len(positional) != 2:
+            print("Error: Missing job name or pattern", file=sys.stderr)
+            print(
+                "Usage: jenkee console-grep <job-name> <regex> [--builds RANGE] "
+                "[--context N] [--max-count N] [-i]",
+                file=sys.stderr,
+            )
+            return 1
+
+        job_name, pattern = positional
+        script = self._build_script(job_name, pattern, ranges, context, max_count, ignore_case)
+
+        # Only matching lines (and their context) leave the controller
+        cli = self.open_transport(config)
+        output = cli.stream("groovy", "=", stdin_input=script)
+
+        matches = 0
+        builds = set()
+        last = None
+        other_lines = []
+        with output:
+            for line in output:
+                if line.startswith(RECORD_PREFIX):
+                    record = json.loads(line[len(RECORD_PREFIX) :])
+                    position = (record["build"], record["line"])
+                    if context and last is not None and position != (last[0], last[1] + 1):
+                        print("--")
+                    last = position
+
+                    separator = ":" if record["match"] else "-"
+                    print(
+                        f"#{record['build']}{separator}{record['line']}{separator}{record['text']}"
+                    )
+                    sys.stdout.flush()
+                    if record["match"]:
+                        matches += 1
+                        builds.add(record["build"])
+                elif line.strip():
+                    other_lines.append(line.rstrip("\n"))
+
+        if output.returncode != 0:
+            print(f"Error: Failed to search console logs of job '{job_name}'", file=sys.stderr)
+            if output.stderr:
+                print(output.stderr, file=sys.stderr)
+            return 1
+
+        if other_lines and other_lines[0].startswith("ERROR:"):
+            print(f"Error: Job '{job_name}' not found", file=sys.stderr)
+            return 1
+        if other_lines:
+            # Anything that is not a record is a script error (e.g. an invalid regex)
+            print("\n".join(other_lines), file=sys.stderr)
+            return 1
+
+        print(f"Total: {matches} matching line(s) in {len(builds)} build(s)")
+        return 0
+
+    def _build_script(self, job_name, pattern, ranges, context, max_count, ignore_case) -> str:
+        """Build the Groovy script that scans build logs on the controller"""
+        flags = "java.util.regex.Pattern.CASE_INSENSITIVE" if ignore_case else "0"
+        if ranges is None:
+            ranges_literal = "null"
+        else:
+            pairs = [f"[{first}, {'null' if last is None else last}]" for first, last in ranges]
+            ranges_literal = "[" + ", ".join(pairs) + "]"
+
+        return f"""
+import groovy.json.JsonOutput
+import hudson.console.ConsoleNote
+
+def job = jenkins.model.Jenkins.instance.getItemByFullName({groovy_string(job_name)})
+if (!(job instanceof hudson.model.Job)) {{
+    println "ERROR: Job not found"
+    return
+}}
+
+def pattern = java.util.regex.Pattern.compile({groovy_string(pattern)}, {flags})
+def contextLines = {context}
+def maxCount = {max_count}
+def ranges = {ranges_literal}
+
+def emit = {{ build, lineNo, text, isMatch ->
+    println "{RECORD_PREFIX}" + JsonOutput.toJson([build: build.number, line: lineNo, text: text, match: isMatch])
+}}
+
+def grepBuild = {{ build ->
+    def before = new ArrayDeque()
+    def after = 0
+    def found = 0
+    def lineNo = 0
+    def reader = new BufferedReader(build.logReader)
+    try {{
+        def line
+        while ((line = reader.readLine()) != null) {{
+            lineNo++
+            def text = ConsoleNote.removeNotes(line)
+            if ((maxCount == 0 || found < maxCount) && pattern.matcher(text).find()) {{
+                before.each {{ emit(build, it[0], it[1], false) }}
+                before.clear()
+                emit(build, lineNo, text, true)
+                found++
+                after = contextLines
+            }} else if (after > 0) {{
+                emit(build, lineNo, text, false)
+                after--
+            }} else if (maxCount > 0 && found >= maxCount) {{
+                break
+            }} else if (contextLines > 0) {{
+                before.addLast([lineNo, text])
+                if (before.size() > contextLines) {{
+                    before.removeFirst()
+                }}
+            }}
+        }}
+    }} finally {{
+        reader.close()
+    }}
+    out.flush()
+}}
+
+if (ranges == null) {{
+    job.builds.each {{ grepBuild(it) }}
+}} else {{
+    def newest = job.nextBuildNumber - 1
+    ranges.each {{ range ->
+        def last = range[1] == null ? newest : Math.min(range[1], newest)
+        for (def number = last; number >= range[0]; number--) {{
+            def build = job.getBuildByNumber(number)
+            if (build != null) {{
+                grepBuild(build)
+            }}
+        }}
+    }}
+}}
+"""
@@ -2,7 +2,7 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.core import Command
 
 
 class CopyJobCommand(Command):
@@ -20,7 +20,7 @@ class CopyJobCommand(Command):
 
     def execute(self) -> int:
         """Execute copy-job command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -38,7 +38,7 @@ class CopyJobCommand(Command):
         dest_job = self.args[1]
 
         # Use Jenkins CLI to copy job
-        cli = JenkinsCLI(config)
+        cli = self.open_transport(config)
         result = cli.run("copy-job", source_job, dest_job)
 
         if result.returncode != 0:
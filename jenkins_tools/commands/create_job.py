@@ -2,7 +2,7 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.core import Command
 
 
 class CreateJobCommand(Command):
@@ -20,7 +20,7 @@ class CreateJobCommand(Command):
 
     def execute(self) -> int:
         """Execute create-job command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -52,7 +52,7 @@ class CreateJobCommand(Command):
             return 1
 
         # Execute create-job command
-        cli = JenkinsCLI(config)
+        cli = self.open_transport(config)
         result = cli.run("create-job", job_name, stdin_input=xml_config)
 
         if result.returncode == 0:
@@ -2,7 +2,7 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.core import Command
 
 
 class DeleteBuildsCommand(Command):
@@ -21,7 +21,7 @@ class DeleteBuildsCommand(Command):
 
     def execute(self) -> int:
         """Execute delete-builds command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -43,7 +43,7 @@ class DeleteBuildsCommand(Command):
         build_range = self.args[1]
 
         # Execute delete-builds command
-        cli = JenkinsCLI(config)
+        cli = self.open_transport(config)
         result = cli.run("delete-builds", job_name, build_range)
 
         if result.returncode == 0:
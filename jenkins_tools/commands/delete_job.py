@@ -2,7 +2,8 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.cache import ConfigCache
+from jenkins_tools.core import Command, fan_out, parse_fan_out_options
 
 
 class DeleteJobCommand(Command):
@@ -15,12 +16,13 @@ class DeleteJobCommand(Command):
         Args:
             args: List of command arguments (sys.argv[2:])
                   One or more job names to delete
+                  Optional flags: --parallel N, --rate R
         """
         self.args = args or []
 
     def execute(self) -> int:
         """Execute delete-job command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -29,25 +31,34 @@ class DeleteJobCommand(Command):
             return 1
 
         # Parse arguments
-        if not self.args:
-            print("Error: Missing job name(s)", file=sys.stderr)
-            print("Usage: jenkee delete-job <job-name> [job-name ...]", file=sys.stderr)
+        try:
+            job_names, parallel, rate = parse_fan_out_options(self.args)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
             return 1
 
-        job_names = self.args
+        if not job_names:
+            print("Error: Missing job name(s)", file=sys.stderr)
+            print(
+                "Usage: jenkee delete-job <job-name> [job-name ...] [--parallel N] [--rate R]",
+                file=sys.stderr,
+            )
+            return 1
 
         # Delete each job
-        cli = JenkinsCLI(config)
+        cli = self.open_transport(config)
+        cache = ConfigCache(config)
         failed_jobs = []
 
-        for job_name in job_names:
-            result = cli.run("delete-job", job_name)
-
+        results = fan_out(lambda job: cli.run("delete-job", job), job_names, parallel, rate)
+        for job_name, result in results:
             if result.returncode != 0:
                 failed_jobs.append(job_name)
                 print(f"Error: Failed to delete job '{job_name}'", file=sys.stderr)
                 if result.stderr:
                     print(result.stderr, file=sys.stderr)
+            else:
+                cache.invalidate(job_name)
 
         # Print success message
         if len(failed_jobs) == 0:
@@ -3,12 +3,38 @@
 import sys
 import xml.etree.ElementTree as ET
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.cache import (
+    CACHE_REFRESH,
+    CredentialIndex,
+    credential_element,
+    fetch_credential_index,
+    parse_cache_options,
+)
+from jenkins_tools.core import OUTPUT_FORMATS, Command
 from jenkins_tools.credential_describers import CREDENTIAL_DESCRIBERS
+from jenkins_tools.credential_describers.bulk_secrets import (
+    build_secrets_script,
+    new_marker,
+    split_secret_output,
+)
 
 
 class DescribeCredentialsCommand(Command):
-    """Describe a specific Jenkins credential with full details"""
+    """Describe one or more Jenkins credentials with full details"""
+
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
+    # Record fields, in tsv column order
+    RECORD_FIELDS = [
+        "domain",
+        "domainDescription",
+        "id",
+        "type",
+        "scope",
+        "description",
+        "details",
+        "secret",
+    ]
 
     def __init__(self, args):
         """
@@ -16,13 +42,15 @@ class DescribeCredentialsCommand(Command):
 
         Args:
             args: List of command arguments (sys.argv[2:])
+                  One or more credential IDs, or --all
+                  Optional flags: --store STORE, --show-secret, --refresh, --no-cache
         """
         self.args = args
         self.show_secret = False
 
     def execute(self) -> int:
         """Execute describe-credentials command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -31,83 +59,169 @@ class DescribeCredentialsCommand(Command):
             return 1
 
         # Parse arguments
-        if len(self.args) < 1:
-            print("Error: Credential ID is required.", file=sys.stderr)
-            print(
-                "Usage: jks describe-credentials <credential-id> [--store STORE] [--show-secret]",
-                file=sys.stderr,
-            )
-            return 1
-
-        credential_id = self.args[0]
+        args, cache_mode = parse_cache_options(self.args)
+        credential_ids = []
+        describe_all = False
         store_id = "system::system::jenkins"  # Default store
 
-        # Check for --store and --show-secret parameters
-        i = 1
-        while i < len(self.args):
-            if self.args[i] == "--store" and i + 1 < len(self.args):
-                store_id = self.args[i + 1]
+        i = 0
+        while i < len(args):
+            if args[i] == "--store" and i + 1 < len(args):
+                store_id = args[i + 1]
                 i += 2
-            elif self.args[i] == "--show-secret":
+            elif args[i] == "--show-secret":
                 self.show_secret = True
                 i += 1
+            elif args[i] == "--all":
+                describe_all = True
+                i += 1
             else:
+                credential_ids.append(args[i])
                 i += 1
 
-        # Use Jenkins CLI to get credentials as XML
-        cli = JenkinsCLI(config)
-        result = cli.run("list-credentials-as-xml", store_id)
+        if not credential_ids and not describe_all:
+            print("Error: Credential ID is required.", file=sys.stderr)
+            print(
+                "Usage: jks describe-credentials <credential-id> [credential-id ...] "
+                "[--store STORE] [--show-secret]",
+                file=sys.stderr,
+            )
+            print(
+                "       jks describe-credentials --all [--store STORE] [--show-secret]",
+                file=sys.stderr,
+            )
+            return 1
 
-        if result.returncode != 0:
-            print("Error: Failed to list credentials", file=sys.stderr)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
+        # Get the credential index, from the local cache when still fresh
+        cli = self.open_transport(config)
+        cache = CredentialIndex(config)
+        index = self._fetch_index(cli, cache, store_id, cache_mode)
+        if index is None:
             return 1
 
-        # Parse XML
+        # A cached index may predate a newly created credential: refetch once
+        if index["cached"] and any(c not in index["credentials"] for c in credential_ids):
+            index = self._fetch_index(cli, cache, store_id, CACHE_REFRESH)
+            if index is None:
+                return 1
+
+        # Index every credential by ID: (domain name, domain description, index entry)
+        domain_descriptions = {d["name"]: d["description"] for d in index["domains"]}
+        entries = {
+            cred_id: (entry["domain"], domain_descriptions.get(entry["domain"], ""), entry)
+            for cred_id, entry in index["credentials"].items()
+        }
+
+        exit_code = 0
+        if describe_all:
+            credential_ids = list(entries)
+        else:
+            for credential_id in credential_ids:
+                if credential_id not in entries:
+                    print(
+                        f"Error: Credential '{credential_id}' not found in store '{store_id}'",
+                        file=sys.stderr,
+                    )
+                    exit_code = 1
+            credential_ids = [
+                cred_id for cred_id in dict.fromkeys(credential_ids) if cred_id in entries
+            ]
+
+        if not credential_ids:
+            return exit_code
+
+        # Get secret content of every requested credential in one script
+        secrets = {}
+        if self.show_secret:
+            secrets = self._fetch_secrets(cli, credential_ids, entries, describe_all)
+            if secrets is None:
+                return 1
+
+        if self.wants_records():
+            single = len(credential_ids) == 1 and not describe_all
+            writer = self.record_writer(self.RECORD_FIELDS, single=single)
+            for credential_id in credential_ids:
+                writer.write(self._build_record(entries[credential_id], secrets.get(credential_id)))
+            writer.close()
+            return exit_code
+
+        for index, credential_id in enumerate(credential_ids):
+            if index > 0:
+                print("-" * 60)
+                print()
+            self._print_credential(entries[credential_id], secrets.get(credential_id))
+
+        return exit_code
+
+    def _fetch_index(self, cli, cache, store_id, cache_mode):
+        """
+        Get the credential index of a store
+
+        Returns:
+            The index, or None after reporting the error
+        """
         try:
-            root = ET.fromstring(result.stdout)
+            index, result = fetch_credential_index(cli, cache, store_id, cache_mode)
         except ET.ParseError as e:
             print(f"Error: Failed to parse XML: {e}", file=sys.stderr)
-            return 1
+            return None
 
-        # Search for the credential in all domains
-        found = False
-        cred_elem = None
-        domain_name = None
-        domain_desc_text = ""
-
-        for domain_creds in root.findall(
-            ".//com.cloudbees.plugins.credentials.domains.DomainCredentials"
-        ):
-            domain_elem = domain_creds.find("domain")
-            domain_name = domain_elem.find("name")
-            domain_name = domain_name.text if domain_name is not None else "(global)"
-
-            # Process credentials in this domain
-            credentials_elem = domain_creds.find("credentials")
-            if credentials_elem is None:
-                continue
+        if index is None:
+            print("Error: Failed to list credentials", file=sys.stderr)
+            if result.stderr:
+                print(result.stderr, file=sys.stderr)
+        return index
 
-            for cred in credentials_elem:
-                cred_id = cred.find("id")
-                if cred_id is not None and cred_id.text == credential_id:
-                    # Found the credential
-                    domain_desc = domain_elem.find("description")
-                    domain_desc_text = domain_desc.text if domain_desc is not None else ""
-                    cred_elem = cred
-                    found = True
-                    break
+    def _fetch_secrets(self, cli, credential_ids, entries, describe_all):
+        """
+        Retrieve secrets with a single Groovy call
 
-            if found:
-                break
+        Returns:
+            Credential ID -> parsed secret data, or None if the script failed
+        """
+        requested = []
+        for credential_id in credential_ids:
+            cred_type = entries[credential_id][2]["type"]
+            describer = CREDENTIAL_DESCRIBERS.get(cred_type)
+            if describer is not None and describer.get_secret_fragment():
+                requested.append(credential_id)
+            elif describer is not None and not describe_all:
+                # Describer does not support secret retrieval
+                print(
+                    f"Note: Secret retrieval is not supported for credential type '{cred_type}'",
+                    file=sys.stderr,
+                )
 
-        if not found:
-            print(
-                f"Error: Credential '{credential_id}' not found in store '{store_id}'",
-                file=sys.stderr,
-            )
-            return 1
+        if not requested:
+            return {}
+
+        marker = new_marker()
+        # Name every ID (even with --all): the server would otherwise print the
+        # secrets of credentials in other stores too
+        script = build_secrets_script(requested, CREDENTIAL_DESCRIBERS, marker)
+        with cli.stream("groovy", "=", stdin_input=script) as output:
+            text = "".join(output)
+
+        if output.returncode != 0:
+            print("Error: Failed to retrieve credential secrets", file=sys.stderr)
+            if output.stderr:
+                print(output.stderr, file=sys.stderr)
+            return None
+
+        secrets = {}
+        for credential_id, output_slice in split_secret_output(text, marker).items():
+            if credential_id not in entries:
+                continue
+            cred_type = entries[credential_id][2]["type"]
+            describer = CREDENTIAL_DESCRIBERS.get(cred_type)
+            if describer is not None:
+                secrets[credential_id] = describer.parse_secret_output(output_slice)
+        return secrets
+
+    def _print_credential(self, entry, secret_data) -> None:
+        """Print one credential in the human-readable format"""
+        domain_name, domain_desc_text, index_entry = entry
+        cred_elem = credential_element(index_entry)
 
         # Print domain info
         print(f"=== Domain: {domain_name} ===")
@@ -142,22 +256,29 @@ class DescribeCredentialsCommand(Command):
             print("Details:")
             print(f"  (Unknown credential type: {cred_type})")
             print()
-            return 0
-
-        # Get secret content if requested
-        secret_data = None
-        if self.show_secret:
-            groovy_script = describer.get_groovy_script(credential_id)
-            if groovy_script:
-                result = cli.run("groovy", "=", stdin_input=groovy_script)
-                if result.returncode == 0:
-                    secret_data = describer.parse_secret_output(result.stdout)
-            else:
-                # Describer does not support secret retrieval
-                print(f"Note: Secret retrieval is not supported for credential type '{cred_type}'")
-                print()
+            return
 
         # Print credential details using describer
         describer.print_details(cred_elem, secret_data)
 
-        return 0
+    def _build_record(self, entry, secret_data) -> dict:
+        """Build the typed record of one credential"""
+        domain_name, domain_desc_text, index_entry = entry
+        cred_elem = credential_element(index_entry)
+        cred_type = cred_elem.tag.split(".")[-1]
+        describer = CREDENTIAL_DESCRIBERS.get(cred_type)
+
+        def text(path):
+            elem = cred_elem.find(path)
+            return elem.text if elem is not None and elem.text else None
+
+        return {
+            "domain": domain_name,
+            "domainDescription": domain_desc_text or None,
+            "id": text("id"),
+            "type": cred_type,
+            "scope": text("scope"),
+            "description": text("description"),
+            "details": describer.get_details(cred_elem) if describer else None,
+            "secret": secret_data,
+        }
@@ -0,0 +1,77 @@
+"""Find jobs in the local inventory command"""
+
+import re
+import sys
+
+from jenkins_tools.core import OUTPUT_FORMATS, Command
+from jenkins_tools.inventory import QUERY_FIELDS, JobInventory
+
+
+class FindCommand(Command):
+    """Search the local job inventory by name, folder, type, view, SCM URL or label"""
+
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
+    # Record fields, in tsv column order
+    RECORD_FIELDS = ["name", "folder", "type", "views", "scmUrls", "labels", "configHash"]
+
+    def __init__(self, args=None):
+        """
+        Initialize with command line arguments
+
+        Args:
+            args: List of command arguments (sys.argv[2:])
+                  Query terms: TEXT (name contains TEXT) or FIELD:VALUE
+                  Optional flags: --regex, -r
+        """
+        self.args = args or []
+
+    def execute(self) -> int:
+        """Execute find command"""
+        regex = False
+        terms = []
+        for arg in self.args:
+            if arg in ("--regex", "-r"):
+                regex = True
+                continue
+
+            field, sep, value = arg.partition(":")
+            if sep and field in QUERY_FIELDS:
+                terms.append((field, value))
+            else:
+                terms.append(("name", arg))
+
+        if regex:
+            for _, value in terms:
+                try:
+                    re.compile(value)
+                except re.error as e:
+                    print(f"Error: Invalid regular expression '{value}': {e}", file=sys.stderr)
+                    return 1
+
+        config = self.load_config()
+        inventory = JobInventory(config)
+        if not inventory.exists():
+            print("Error: Job index not found.", file=sys.stderr)
+            print("Run 'jenkee index build' first.", file=sys.stderr)
+            return 1
+
+        try:
+            records = inventory.find(terms, regex=regex)
+        finally:
+            inventory.close()
+
+        if self.wants_records():
+            writer = self.record_writer(self.RECORD_FIELDS)
+            for record in records:
+                writer.write(record)
+            writer.close()
+            return 0
+
+        if not records:
+            print("No matching jobs found")
+            return 0
+
+        for record in records:
+            print(record["name"])
+        return 0
@@ -2,7 +2,8 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.cache import ConfigCache, fetch_job_config, parse_cache_options
+from jenkins_tools.core import Command
 
 
 class GetJobCommand(Command):
@@ -14,12 +15,13 @@ class GetJobCommand(Command):
 
         Args:
             args: List of command arguments (sys.argv[2:])
+                  Job name, optional flags: --no-cache, --refresh
         """
         self.args = args
 
     def execute(self) -> int:
         """Execute get-job-config command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -28,16 +30,17 @@ class GetJobCommand(Command):
             return 1
 
         # Parse arguments
-        if not self.args:
+        args, cache_mode = parse_cache_options(self.args)
+        if not args:
             print("Error: Missing job name", file=sys.stderr)
-            print("Usage: jks get-job <job-name>", file=sys.stderr)
+            print("Usage: jks get-job <job-name> [--no-cache|--refresh]", file=sys.stderr)
             return 1
 
-        job_name = self.args[0]
+        job_name = args[0]
 
-        # Execute get-job command
-        cli = JenkinsCLI(config)
-        result = cli.run("get-job", job_name)
+        # Execute get-job command (served from the local cache when fresh)
+        cli = self.open_transport(config)
+        result = fetch_job_config(cli, ConfigCache(config), job_name, cache_mode)
 
         if result.returncode == 0:
             print(result.stdout)
@@ -3,7 +3,7 @@
 import sys
 from pathlib import Path
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.core import Command
 
 
 class GroovyCommand(Command):
@@ -21,7 +21,7 @@ class GroovyCommand(Command):
 
     def execute(self) -> int:
         """Execute groovy command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -54,7 +54,7 @@ class GroovyCommand(Command):
 
         # Execute groovy command via Jenkins CLI
         # The '=' argument tells Jenkins CLI to read script from stdin
-        cli = JenkinsCLI(config)
+        cli = self.open_transport(config)
         result = cli.run("groovy", "=", stdin_input=script_content)
 
         if result.returncode == 0:
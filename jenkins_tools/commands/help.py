@@ -17,7 +17,10 @@ class HelpCommand(Command):
         "get-job": "Get job XML configuration",
         "list-builds": "List build history for a job",
         "console": "Get console output of a build",
+        "console-grep": "Search console logs of many builds",
         "job-status": "Show job status and triggers",
+        "build-stats": "Build duration percentiles, failure rates and flakiness",
+        "watch": "Watch jobs and report builds as they start and finish",
         "job-diff": "Compare two job configurations",
         "list-credentials": "List Jenkins credentials metadata",
         "describe-credentials": "Describe a specific credential",
@@ -25,6 +28,7 @@ class HelpCommand(Command):
         "copy-job": "Copy a job to a new job",
         "update-job": "Update job configuration from XML",
         "build": "Trigger a Jenkins job build",
+        "wait": "Wait for queued items and builds to start and finish",
         "stop-builds": "Stop all running builds for job(s)",
         "create-job": "Create a new job from XML configuration",
         "delete-job": "Delete one or more jobs (IRREVERSIBLE)",
@@ -32,6 +36,11 @@ class HelpCommand(Command):
         "enable-job": "Enable one or more jobs",
         "delete-builds": "Delete build records (IRREVERSIBLE)",
         "groovy": "Execute a Groovy script on the server",
+        "batch": "Run many commands in one process",
+        "snapshot": "Show the state of every job in one call",
+        "index": "Build or update the local job inventory",
+        "find": "Search jobs in the local inventory",
+        "search-config": "Full-text search across all job configs",
         "prompt": "Display AI agent guide for using jenkee",
         "help": "Show help information",
     }
@@ -0,0 +1,61 @@
+"""Job inventory index command"""
+
+import sys
+import time
+
+from jenkins_tools.core import Command
+from jenkins_tools.inventory import JobInventory
+
+
+class IndexCommand(Command):
+    """Build or update the local job inventory used by `find`"""
+
+    def __init__(self, args=None):
+        """
+        Initialize with command line arguments
+
+        Args:
+            args: List of command arguments (sys.argv[2:])
+                  Subcommand: build | update
+        """
+        self.args = args or []
+
+    def execute(self) -> int:
+        """Execute index command"""
+        if len(self.args) != 1 or self.args[0] not in ("build", "update"):
+            print("Error: Expected 'build' or 'update'", file=sys.stderr)
+            print("Usage: jenkee index build", file=sys.stderr)
+            print("       jenkee index update", file=sys.stderr)
+            return 1
+
+        config = self.load_config()
+
+        # Check if credentials are configured
+        if not config.is_configured():
+            print("Error: Jenkins credentials not configured.", file=sys.stderr)
+            print(f"Run 'jenkee auth' to configure credentials.", file=sys.stderr)
+            return 1
+
+        inventory = JobInventory(config)
+        rebuild = self.args[0] == "build" or not inventory.exists()
+        cli = self.open_transport(config)
+
+        started = time.monotonic()
+        try:
+            stats, result = inventory.refresh(cli, rebuild=rebuild)
+        finally:
+            inventory.close()
+
+        if stats is None:
+            print("Error: Failed to index jobs", file=sys.stderr)
+            if result.stderr:
+                print(result.stderr, file=sys.stderr)
+            return 1
+
+        total = stats["added"] + stats["updated"] + stats["unchanged"]
+        print(
+            f"Indexed {total} job(s) in {time.monotonic() - started:.1f}s: "
+            f"{stats['added']} added, {stats['updated']} updated, "
+            f"{stats['removed']} removed, {stats['unchanged']} unchanged"
+        )
+        return 0
@@ -2,25 +2,53 @@
 
 import sys
 import difflib
+import fnmatch
+import xml.etree.ElementTree as ET
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.cache import ConfigCache, fetch_job_config, parse_cache_options
+from jenkins_tools.config_diff import (
+    DEFAULT_IGNORE,
+    MinHasher,
+    canonical_lines,
+    cluster_jobs,
+    estimate_similarity,
+    semantic_diff,
+    shingles,
+)
+from jenkins_tools.core import OUTPUT_FORMATS, Command, fan_out, parse_fan_out_options
+from jenkins_tools.groovy_scripts import ALL_JOB_NAMES_SCRIPT, JOB_NAME_PREFIX
+
+# Defaults for --many
+MANY_PARALLEL = 8
+MANY_THRESHOLD = 0.8
 
 
 class JobDiffCommand(Command):
     """Compare configuration of two Jenkins jobs"""
 
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
+    # Record fields of a semantic diff, in tsv column order
+    RECORD_FIELDS = ["change", "path", "old", "new"]
+
     def __init__(self, args):
         """
         Initialize with command line arguments
 
         Args:
             args: List of command arguments (sys.argv[2:])
+                  Two job names, or --many PATTERN
+                  Optional flags: --no-cache, --refresh, --semantic,
+                  --ignore PATTERN (repeatable), --no-default-ignore
+                  With --many: --threshold T, --summary, --parallel N
         """
         self.args = args
+        self.semantic = False
+        self.ignore = list(DEFAULT_IGNORE)
 
     def execute(self) -> int:
         """Execute job-diff command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -29,31 +57,78 @@ class JobDiffCommand(Command):
             return 1
 
         # Parse arguments
-        if len(self.args) < 2:
+        args, cache_mode = parse_cache_options(self.args)
+        try:
+            args = self._parse_semantic_options(args)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        if "--many" in args:
+            if self.wants_records():
+                print("Error: --format is not supported with --many", file=sys.stderr)
+                return 1
+            return self._diff_many(config, args, cache_mode)
+
+        if len(args) < 2:
             print("Error: Missing job names", file=sys.stderr)
-            print("Usage: jks job-diff <job-name-1> <job-name-2>", file=sys.stderr)
+            print(
+                "Usage: jks job-diff <job-name-1> <job-name-2> [--semantic] [--ignore PATTERN] "
+                "[--no-cache|--refresh]",
+                file=sys.stderr,
+            )
+            print(
+                "       jks job-diff --many <pattern> [--threshold T] [--summary] [--parallel N]",
+                file=sys.stderr,
+            )
             return 1
 
-        job1_name = self.args[0]
-        job2_name = self.args[1]
+        job1_name = args[0]
+        job2_name = args[1]
 
-        # Get both job configurations
-        cli = JenkinsCLI(config)
+        # Get both job configurations concurrently, through the local cache
+        cli = self.open_transport(config)
+        cache = ConfigCache(config)
+        results = fan_out(
+            lambda job: fetch_job_config(cli, cache, job, cache_mode), [job1_name, job2_name], 2
+        )
+        (_, result1), (_, result2) = results
 
-        result1 = cli.run("get-job", job1_name)
         if result1.returncode != 0:
             print(f"Error: Failed to get job '{job1_name}'", file=sys.stderr)
             if result1.stderr:
                 print(result1.stderr, file=sys.stderr)
             return 1
 
-        result2 = cli.run("get-job", job2_name)
         if result2.returncode != 0:
             print(f"Error: Failed to get job '{job2_name}'", file=sys.stderr)
             if result2.stderr:
                 print(result2.stderr, file=sys.stderr)
             return 1
 
+        # Structured records always come from the semantic diff
+        if self.semantic or self.wants_records():
+            try:
+                changes = semantic_diff(result1.stdout, result2.stdout, self.ignore)
+            except ET.ParseError as e:
+                print(f"Error: Failed to parse job config: {e}", file=sys.stderr)
+                return 1
+
+            if self.wants_records():
+                writer = self.record_writer(self.RECORD_FIELDS)
+                for change in changes:
+                    writer.write(change)
+                writer.close()
+                return 0
+
+            if not changes:
+                print(f"No differences found between '{job1_name}' and '{job2_name}'")
+                return 0
+            print(f"--- {job1_name}")
+            print(f"+++ {job2_name}")
+            self._print_changes(changes)
+            return 0
+
         # Split into lines for diff
         lines1 = result1.stdout.splitlines(keepends=True)
         lines2 = result2.stdout.splitlines(keepends=True)
@@ -73,3 +148,217 @@ class JobDiffCommand(Command):
             print(line)
 
         return 0
+
+    def _parse_semantic_options(self, args):
+        """
+        Split --semantic, --ignore PATTERN and --no-default-ignore off the arguments
+
+        Raises:
+            ValueError: If --ignore has no value
+        """
+        remaining = []
+        extra_ignore = []
+        default_ignore = True
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if arg == "--semantic":
+                self.semantic = True
+            elif arg == "--no-default-ignore":
+                default_ignore = False
+            elif arg == "--ignore":
+                if i + 1 >= len(args):
+                    raise ValueError("Missing value for --ignore")
+                extra_ignore.append(args[i + 1])
+                i += 1
+            else:
+                remaining.append(arg)
+            i += 1
+
+        self.ignore = (list(DEFAULT_IGNORE) if default_ignore else []) + extra_ignore
+        return remaining
+
+    def _print_changes(self, changes) -> None:
+        """Print semantic diff entries as XPath-addressed lines"""
+        counts = {"added": 0, "removed": 0, "changed": 0}
+        for change in changes:
+            counts[change["change"]] += 1
+            old, new = change["old"], change["new"]
+
+            if change["change"] == "changed" and "\n" not in old and "\n" not in new:
+                print(f"~ {change['path']}: {old!r} -> {new!r}")
+            elif change["change"] == "changed":
+                print(f"~ {change['path']}")
+                diff = difflib.unified_diff(old.splitlines(), new.splitlines(), n=1, lineterm="")
+                for line in list(diff)[2:]:
+                    print(f"    {line}")
+            else:
+                sign, value = ("+", new) if change["change"] == "added" else ("-", old)
+                if "\n" not in value:
+                    print(f"{sign} {change['path']}" + (f": {value!r}" if value else ""))
+                else:
+                    print(f"{sign} {change['path']}")
+                    for line in value.splitlines():
+                        print(f"    {sign} {line}")
+
+        print(
+            f"{len(changes)} change(s): {counts['added']} added, "
+            f"{counts['removed']} removed, {counts['changed']} changed"
+        )
+
+    def _diff_many(self, config, args, cache_mode) -> int:
+        """Cluster every job matching a pattern and diff each one against its cluster's medoid"""
+        pattern = None
+        threshold = MANY_THRESHOLD
+        summary = False
+        try:
+            args, parallel, rate = parse_fan_out_options(args)
+            if "--parallel" not in self.args:
+                parallel = MANY_PARALLEL
+            i = 0
+            while i < len(args):
+                arg = args[i]
+                if arg in ("--many", "--threshold") and i + 1 < len(args):
+                    if arg == "--many":
+                        pattern = args[i + 1]
+                    else:
+                        threshold = float(args[i + 1])
+                        if not 0 < threshold <= 1:
+                            raise ValueError(f"Invalid value for --threshold: '{args[i + 1]}'")
+                    i += 2
+                elif arg == "--summary":
+                    summary = True
+                    i += 1
+                else:
+                    raise ValueError(f"Unknown option '{arg}'")
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            print(
+                "Usage: jks job-diff --many <pattern> [--threshold T] [--summary] [--parallel N]",
+                file=sys.stderr,
+            )
+            return 1
+
+        if pattern is None:
+            print("Error: Missing pattern for --many", file=sys.stderr)
+            return 1
+
+        # Select jobs in every folder by full name: glob pattern, or substring
+        # when it has no wildcards
+        cli = self.open_transport(config)
+        all_names = []
+        errors = []
+        with cli.stream("groovy", "=", stdin_input=ALL_JOB_NAMES_SCRIPT) as output:
+            for line in output:
+                if line.startswith(JOB_NAME_PREFIX):
+                    all_names.append(line[len(JOB_NAME_PREFIX) :].strip())
+                elif line.strip():
+                    # Anything that is not a job name is a script error reported by the server
+                    errors.append(line.rstrip("\n"))
+        if output.returncode != 0 or errors:
+            print("Error: Failed to list jobs", file=sys.stderr)
+            detail = output.stderr or "\n".join(errors)
+            if detail:
+                print(detail, file=sys.stderr)
+            return 1
+
+        is_glob = any(char in pattern for char in "*?[")
+        job_names = [
+            name
+            for name in all_names
+            if (fnmatch.fnmatchcase(name, pattern) if is_glob else pattern in name)
+        ]
+        if len(job_names) < 2:
+            print(
+                f"Error: Need at least 2 jobs matching '{pattern}', found {len(job_names)}",
+                file=sys.stderr,
+            )
+            return 1
+
+        # Fetch configs in parallel, then reduce each one to a MinHash signature
+        cache = ConfigCache(config)
+        hasher = MinHasher()
+        configs = {}
+        lines = {}
+        signatures = {}
+        exit_code = 0
+        for job_name, result in fan_out(
+            lambda job: fetch_job_config(cli, cache, job, cache_mode), job_names, parallel, rate
+        ):
+            if result.returncode != 0:
+                print(f"Error: Failed to get job '{job_name}'", file=sys.stderr)
+                if result.stderr:
+                    print(result.stderr, file=sys.stderr)
+                exit_code = 1
+                continue
+            try:
+                lines[job_name] = canonical_lines(result.stdout)
+                configs[job_name] = result.stdout
+            except ET.ParseError as e:
+                print(f"Error: Failed to parse config of '{job_name}': {e}", file=sys.stderr)
+                exit_code = 1
+                continue
+            signatures[job_name] = hasher.signature(shingles(lines[job_name]))
+
+        if len(signatures) < 2:
+            return 1
+
+        clusters = cluster_jobs(signatures, threshold)
+        groups = [cluster for cluster in clusters if len(cluster["members"]) > 1]
+        outliers = [cluster["medoid"] for cluster in clusters if len(cluster["members"]) == 1]
+
+        print(
+            f"Compared {len(signatures)} job(s) matching '{pattern}': "
+            f"{len(groups)} cluster(s), {len(outliers)} outlier(s) (threshold {threshold:.2f})"
+        )
+
+        for number, cluster in enumerate(groups, 1):
+            medoid = cluster["medoid"]
+            print()
+            print(f"=== Cluster {number}: {len(cluster['members'])} job(s), medoid '{medoid}' ===")
+            width = max(len(name) for name, _ in cluster["members"])
+            for name, similarity in cluster["members"]:
+                if name == medoid:
+                    print(f"  {name:{width}s}  (medoid)")
+                elif lines[name] == lines[medoid]:
+                    print(f"  {name:{width}s}  {similarity:.2f}  identical")
+                else:
+                    print(f"  {name:{width}s}  {similarity:.2f}")
+
+            if summary:
+                continue
+            for name, _ in cluster["members"][1:]:
+                if self.semantic:
+                    changes = semantic_diff(configs[medoid], configs[name], self.ignore)
+                    if changes:
+                        print()
+                        print(f"--- {medoid}")
+                        print(f"+++ {name}")
+                        self._print_changes(changes)
+                    continue
+                diff = list(
+                    difflib.unified_diff(
+                        lines[medoid], lines[name], fromfile=medoid, tofile=name, lineterm=""
+                    )
+                )
+                if diff:
+                    print()
+                    for line in diff:
+                        print(line)
+
+        if outliers:
+            # Nearest medoid, so an outlier can still be compared by hand
+            medoids = [cluster["medoid"] for cluster in clusters]
+            print()
+            print("=== Outliers ===")
+            width = max(len(name) for name in outliers)
+            for name in outliers:
+                others = [medoid for medoid in medoids if medoid != name]
+                closest = max(
+                    others,
+                    key=lambda other: estimate_similarity(signatures[name], signatures[other]),
+                )
+                similarity = estimate_similarity(signatures[name], signatures[closest])
+                print(f"  {name:{width}s}  closest: '{closest}' ({similarity:.2f})")
+
+        return exit_code
@@ -2,12 +2,32 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.api import JenkinsClient, JenkinsError, JobStatus
+from jenkins_tools.core import OUTPUT_FORMATS, Command
 
 
 class JobStatusCommand(Command):
     """Display job status including builds and triggers"""
 
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
+    # Record fields, in tsv column order
+    RECORD_FIELDS = [
+        "name",
+        "type",
+        "enabled",
+        "buildable",
+        "health",
+        "lastBuild",
+        "lastStableBuild",
+        "lastSuccessfulBuild",
+        "lastFailedBuild",
+        "lastUnsuccessfulBuild",
+        "lastCompletedBuild",
+        "upstream",
+        "downstream",
+    ]
+
     def __init__(self, args):
         """
         Initialize with command line arguments
@@ -19,7 +39,7 @@ class JobStatusCommand(Command):
 
     def execute(self) -> int:
         """Execute job-status command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -35,91 +55,61 @@ class JobStatusCommand(Command):
 
         job_name = self.args[0]
 
-        # Use groovy script to get job status
-        cli = JenkinsCLI(config)
-        groovy_script = f"""
-def job = hudson.model.Hudson.instance.getItemByFullName('{job_name}')
-
-if (!job) {{
-    println "ERROR: Job not found"
-    return
-}}
-
-// Basic info
-println "=== Job: " + job.fullName + " ==="
-println ""
-println "Status: " + (job.disabled ? "DISABLED" : "ENABLED")
-println "Buildable: " + job.buildable
-println ""
-
-// Health report
-if (job.buildHealth && job.buildHealth.score != null) {{
-    def health = job.buildHealth
-    println "=== Health ==="
-    println "Score: " + health.score + "%"
-    println "Description: " + health.description
-    println ""
-}}
-
-// Last builds (permalinks)
-println "=== Last Builds ==="
-if (job.lastBuild) {{
-    println "Last Build: #" + job.lastBuild.number
-}}
-if (job.lastStableBuild) {{
-    println "Last Stable Build: #" + job.lastStableBuild.number
-}}
-if (job.lastSuccessfulBuild) {{
-    println "Last Successful Build: #" + job.lastSuccessfulBuild.number
-}}
-if (job.lastFailedBuild) {{
-    println "Last Failed Build: #" + job.lastFailedBuild.number
-}}
-if (job.lastUnsuccessfulBuild) {{
-    println "Last Unsuccessful Build: #" + job.lastUnsuccessfulBuild.number
-}}
-if (job.lastCompletedBuild) {{
-    println "Last Completed Build: #" + job.lastCompletedBuild.number
-}}
-println ""
-
-// Downstream projects (this job triggers)
-println "=== Downstream Projects ==="
-if (job.downstreamProjects && job.downstreamProjects.size() > 0) {{
-    job.downstreamProjects.each {{ downstream ->
-        println "  - " + downstream.fullName
-    }}
-}} else {{
-    println "  (none)"
-}}
-println ""
-
-// Upstream projects (triggered by)
-println "=== Upstream Projects ==="
-if (job.upstreamProjects && job.upstreamProjects.size() > 0) {{
-    job.upstreamProjects.each {{ upstream ->
-        println "  - " + upstream.fullName
-    }}
-}} else {{
-    println "  (none)"
-}}
-"""
-
-        result = cli.run("groovy", "=", stdin_input=groovy_script)
-
-        if result.returncode == 0:
-            output = result.stdout.strip()
-            if output and not output.startswith("ERROR:"):
-                print(output)
-                return 0
-            elif output.startswith("ERROR:"):
-                print(f"Error: Job '{job_name}' not found", file=sys.stderr)
-                return 1
-            else:
-                print(f"Error: Failed to get status for job '{job_name}'", file=sys.stderr)
-                return 1
-        else:
-            print(f"Error: Failed to get status for job '{job_name}'", file=sys.stderr)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
+        client = JenkinsClient(config, self.open_transport(config))
+        try:
+            status = client.job_status(job_name)
+        except JenkinsError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            if e.detail:
+                print(e.detail, file=sys.stderr)
             return 1
+
+        if self.wants_records():
+            writer = self.record_writer(self.RECORD_FIELDS, single=True)
+            writer.write(status.to_record())
+            writer.close()
+            return 0
+
+        self._print_status(status)
+        return 0
+
+    def _print_status(self, status: JobStatus) -> None:
+        """Print the status in sections: state, health, permalinks and relations"""
+        print(f"=== Job: {status.name} ===")
+        print()
+        print(f"Status: {'ENABLED' if status.enabled else 'DISABLED'}")
+        print(f"Buildable: {str(status.buildable).lower()}")
+        print()
+
+        if status.health:
+            print("=== Health ===")
+            print(f"Score: {status.health.score}%")
+            print(f"Description: {status.health.description}")
+            print()
+
+        print("=== Last Builds ===")
+        permalinks = [
+            ("Last Build", status.last_build),
+            ("Last Stable Build", status.last_stable_build),
+            ("Last Successful Build", status.last_successful_build),
+            ("Last Failed Build", status.last_failed_build),
+            ("Last Unsuccessful Build", status.last_unsuccessful_build),
+            ("Last Completed Build", status.last_completed_build),
+        ]
+        for label, number in permalinks:
+            if number is not None:
+                print(f"{label}: #{number}")
+        print()
+
+        # Downstream: jobs this job triggers; upstream: jobs that trigger it
+        self._print_projects("Downstream Projects", status.downstream)
+        print()
+        self._print_projects("Upstream Projects", status.upstream)
+
+    @staticmethod
+    def _print_projects(title: str, names) -> None:
+        print(f"=== {title} ===")
+        for name in names:
+            print(f"  - {name}")
+        if not names:
+            print("  (none)")
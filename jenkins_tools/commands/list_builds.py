@@ -2,24 +2,35 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.api import Build, JenkinsClient, JenkinsError
+from jenkins_tools.build_history import (
+    RECORD_FIELDS,
+    format_duration,
+    format_timestamp,
+    parse_history_options,
+)
+from jenkins_tools.core import OUTPUT_FORMATS, Command
 
 
 class ListBuildsCommand(Command):
     """List build history for a Jenkins job"""
 
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
     def __init__(self, args):
         """
         Initialize with command line arguments
 
         Args:
             args: List of command arguments (sys.argv[2:])
+                  Job name
+                  Optional flags: --limit N, --since WHEN, --range SPEC
         """
         self.args = args
 
     def execute(self) -> int:
         """Execute list-builds command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -28,41 +39,52 @@ class ListBuildsCommand(Command):
             return 1
 
         # Parse arguments
-        if not self.args:
-            print("Error: Missing job name", file=sys.stderr)
-            print("Usage: jks list-builds <job-name>", file=sys.stderr)
+        try:
+            args, limit, since, build_range = parse_history_options(self.args)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
             return 1
 
-        job_name = self.args[0]
-
-        # Use groovy script to list builds
-        cli = JenkinsCLI(config)
-        groovy_script = f"""
-def job = hudson.model.Hudson.instance.getItemByFullName('{job_name}')
-if (job) {{
-  job.builds.each {{ build ->
-    println "${{build.number}}"
-  }}
-}} else {{
-  println "ERROR: Job not found"
-}}
-"""
+        if len(args) != 1:
+            print(
+                "Error: Missing job name" if not args else "Error: Too many arguments",
+                file=sys.stderr,
+            )
+            print(
+                "Usage: jks list-builds <job-name> [--limit N] [--since WHEN] [--range SPEC]",
+                file=sys.stderr,
+            )
+            return 1
 
-        result = cli.run("groovy", "=", stdin_input=groovy_script)
+        job_name = args[0]
 
-        if result.returncode == 0:
-            output = result.stdout.strip()
-            if output and not output.startswith("ERROR:"):
-                print(output)
-                return 0
-            elif output.startswith("ERROR:"):
-                print(f"Error: Job '{job_name}' not found", file=sys.stderr)
-                return 1
-            else:
-                print(f"No builds found for job '{job_name}'")
-                return 0
-        else:
-            print(f"Error: Failed to list builds for job '{job_name}'", file=sys.stderr)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
+        # Builds are printed as they arrive instead of after the whole history
+        client = JenkinsClient(config, self.open_transport(config))
+        writer = self.record_writer(RECORD_FIELDS) if self.wants_records() else None
+        count = 0
+        try:
+            for build in client.list_builds(job_name, limit, since, build_range):
+                if writer:
+                    writer.write(build.to_record())
+                else:
+                    self._print_build(build)
+                count += 1
+        except JenkinsError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            if e.detail:
+                print(e.detail, file=sys.stderr)
             return 1
+
+        if writer:
+            writer.close()
+        elif count == 0:
+            print(f"No builds found for job '{job_name}'")
+        return 0
+
+    def _print_build(self, build: Build) -> None:
+        """Print one build as a single line, build number first"""
+        result = "BUILDING" if build.building else (build.result or "-")
+        print(
+            f"{build.number}  {result:<9}  {format_timestamp(build.timestamp)}  "
+            f"{format_duration(build.duration):>8}  {build.node or '-'}  {build.cause or '-'}"
+        )
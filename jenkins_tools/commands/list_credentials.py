@@ -3,24 +3,48 @@
 import sys
 import xml.etree.ElementTree as ET
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.api import Credential
+from jenkins_tools.cache import (
+    CredentialIndex,
+    credential_element,
+    fetch_credential_index,
+    parse_cache_options,
+)
+from jenkins_tools.core import OUTPUT_FORMATS, Command
 
 
 class ListCredentialsCommand(Command):
     """List Jenkins credentials with metadata"""
 
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
+    # Record fields, in tsv column order
+    RECORD_FIELDS = [
+        "domain",
+        "id",
+        "type",
+        "scope",
+        "description",
+        "username",
+        "fileName",
+        "projectId",
+        "storageAccount",
+    ]
+
     def __init__(self, args):
         """
         Initialize with command line arguments
 
         Args:
             args: List of command arguments (sys.argv[2:])
+                  Optional domain name filter
+                  Optional flags: --store STORE, --type TYPE, --refresh, --no-cache
         """
         self.args = args
 
     def execute(self) -> int:
         """Execute list-credentials command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -29,75 +53,90 @@ class ListCredentialsCommand(Command):
             return 1
 
         # Parse arguments
+        args, cache_mode = parse_cache_options(self.args)
         store_id = "system::system::jenkins"  # Default store
         domain_filter = None
+        type_filter = None
 
-        # Check for --store parameter
+        # Check for --store and --type parameters
         i = 0
-        while i < len(self.args):
-            if self.args[i] == "--store" and i + 1 < len(self.args):
-                store_id = self.args[i + 1]
+        while i < len(args):
+            if args[i] == "--store" and i + 1 < len(args):
+                store_id = args[i + 1]
+                i += 2
+            elif args[i] == "--type" and i + 1 < len(args):
+                type_filter = args[i + 1]
                 i += 2
             else:
                 # First positional argument is domain filter
                 if domain_filter is None:
-                    domain_filter = self.args[i]
+                    domain_filter = args[i]
                 i += 1
 
-        # Use Jenkins CLI to get credentials as XML
-        cli = JenkinsCLI(config)
-        result = cli.run("list-credentials-as-xml", store_id)
-
-        if result.returncode != 0:
-            print("Error: Failed to list credentials", file=sys.stderr)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
-            return 1
+        self.domain_filter = domain_filter
+        self.type_filter = type_filter
+        self.writer = self.record_writer(self.RECORD_FIELDS) if self.wants_records() else None
+        self.current_domain = None
+        self.domain_count = 0
 
-        # Parse XML
+        # Credentials are printed while the store's XML is still being parsed
+        cli = self.open_transport(config)
         try:
-            root = ET.fromstring(result.stdout)
+            index, result = fetch_credential_index(
+                cli, CredentialIndex(config), store_id, cache_mode, on_event=self._on_event
+            )
         except ET.ParseError as e:
             print(f"Error: Failed to parse XML: {e}", file=sys.stderr)
             return 1
 
-        # Process domains
-        for domain_creds in root.findall(
-            ".//com.cloudbees.plugins.credentials.domains.DomainCredentials"
-        ):
-            domain_elem = domain_creds.find("domain")
-            domain_name = domain_elem.find("name")
-            domain_name = domain_name.text if domain_name is not None else "(global)"
-
-            # Filter by domain if specified
-            if domain_filter and domain_name != domain_filter:
-                continue
-
-            domain_desc = domain_elem.find("description")
-            domain_desc_text = domain_desc.text if domain_desc is not None else ""
-
-            # Print domain header
-            print(f"\n=== Domain: {domain_name} ===")
-            if domain_desc_text:
-                print(f"Description: {domain_desc_text}")
-            print()
-
-            # Process credentials in this domain
-            credentials_elem = domain_creds.find("credentials")
-            if credentials_elem is None:
-                print("  (no credentials)")
-                continue
-
-            cred_count = 0
-            for cred in credentials_elem:
-                cred_count += 1
-                self._print_credential(cred)
-
-            if cred_count == 0:
-                print("  (no credentials)")
+        if index is None:
+            print("Error: Failed to list credentials", file=sys.stderr)
+            if result.stderr:
+                print(result.stderr, file=sys.stderr)
+            return 1
 
+        self._finish_domain()
+        if self.writer is not None:
+            self.writer.close()
         return 0
 
+    def _on_event(self, kind: str, item: dict) -> None:
+        """Output one domain or credential as soon as it has been parsed"""
+        if kind == "domain":
+            self._finish_domain()
+            # Filter by domain if specified
+            if self.domain_filter and item["name"] != self.domain_filter:
+                self.current_domain = None
+                return
+
+            self.current_domain = item["name"]
+            self.domain_count = 0
+            if self.writer is None:
+                # Print domain header
+                print(f"\n=== Domain: {item['name']} ===")
+                if item["description"]:
+                    print(f"Description: {item['description']}")
+                print()
+            return
+
+        if self.current_domain is None or item["domain"] != self.current_domain:
+            return
+        if self.type_filter and item["type"] != self.type_filter:
+            return
+
+        self.domain_count += 1
+        if self.writer is not None:
+            credential = Credential.from_element(item["domain"], credential_element(item))
+            self.writer.write(credential.to_record())
+        else:
+            self._print_credential(credential_element(item))
+
+    def _finish_domain(self) -> None:
+        """Close the current domain's section"""
+        if self.current_domain is not None and self.writer is None and self.domain_count == 0:
+            print("  (no credentials)")
+        self.current_domain = None
+
     def _print_credential(self, cred_elem):
         """Print credential information"""
         # Get credential type from tag name
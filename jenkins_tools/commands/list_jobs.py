@@ -2,12 +2,15 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.api import JenkinsClient, JenkinsError
+from jenkins_tools.core import OUTPUT_FORMATS, Command
 
 
 class ListJobsCommand(Command):
     """List Jenkins jobs in a specific view or all jobs"""
 
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
     def __init__(self, args):
         """
         Initialize with command line arguments
@@ -19,7 +22,7 @@ class ListJobsCommand(Command):
 
     def execute(self) -> int:
         """Execute list-jobs command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -41,30 +44,27 @@ class ListJobsCommand(Command):
             view_name = self.args[0]
 
         # Execute list-jobs command
-        cli = JenkinsCLI(config)
-
-        if view_name:
-            # List jobs in specific view
-            result = cli.run("list-jobs", view_name)
-        else:
-            # List all jobs
-            result = cli.run("list-jobs")
-
-        if result.returncode == 0:
-            output = result.stdout.strip()
-            if output:
-                print(output)
-            else:
-                if view_name:
-                    print(f"No jobs found in view '{view_name}'")
+        client = JenkinsClient(config, self.open_transport(config))
+        writer = self.record_writer(["name", "view"]) if self.wants_records() else None
+        count = 0
+        try:
+            for job in client.list_jobs(view_name):
+                if writer:
+                    writer.write(job.to_record())
                 else:
-                    print("No jobs found")
-            return 0
-        else:
+                    print(job.name)
+                count += 1
+        except JenkinsError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            if e.detail:
+                print(e.detail, file=sys.stderr)
+            return 1
+
+        if writer:
+            writer.close()
+        elif count == 0:
             if view_name:
-                print(f"Error: Failed to list jobs in view '{view_name}'", file=sys.stderr)
+                print(f"No jobs found in view '{view_name}'")
             else:
-                print("Error: Failed to list jobs", file=sys.stderr)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
-            return 1
+                print("No jobs found")
+        return 0
@@ -2,15 +2,24 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.core import Command
 
 
 class ListViewsCommand(Command):
     """List all Jenkins views"""
 
+    def __init__(self, args=None):
+        """
+        Initialize with command line arguments
+
+        Args:
+            args: List of command arguments (sys.argv[2:]), unused
+        """
+        self.args = args or []
+
     def execute(self) -> int:
         """Execute list-views command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -19,7 +28,7 @@ class ListViewsCommand(Command):
             return 1
 
         # Use groovy script to list views
-        cli = JenkinsCLI(config)
+        cli = self.open_transport(config)
         groovy_script = r"println hudson.model.Hudson.instance.views*.name.sort().join('\n')"
 
         result = cli.run("groovy", "=", stdin_input=groovy_script)
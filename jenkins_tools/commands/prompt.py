@@ -87,8 +87,15 @@ Commands:
   list-jobs <view>                  列出 view 中的 jobs
   get-job <job>                     取得 job XML 配置
   job-status <job>                  查看 job 狀態與觸發關係
-  list-builds <job>                 列出 job 的 build 歷史
-  console <job> [build]             取得 build console 輸出
+  list-builds <job> [--limit N]     列出 job 的 build 歷史（結果、時間、cause、node）
+  build-stats <job|view>            build 耗時百分位數、失敗率、flakiness 與趨勢
+  watch <job...> [--until-idle]     監看 jobs，build 排入佇列、開始、結束時輸出事件
+  snapshot [--folder F]             一次取得所有 jobs 的狀態摘要
+  index build|update                建立 / 更新本機 job 索引
+  find <text> [field:value]...      從本機索引搜尋 jobs（不連線伺服器）
+  search-config <pattern>           全文搜尋所有 job 的 config.xml（本機索引）
+  console <job> [build] [-f]        取得 build console 輸出（-f 即時追蹤）
+  console-grep <job> <regex>        在多個 builds 的 console 中搜尋
   job-diff <job1> <job2>            比較兩個 job 配置差異
   list-credentials [domain]         列出 credentials metadata
   describe-credentials <id>         查看 credential 詳細資訊
@@ -96,6 +103,7 @@ Commands:
   update-job <job>                  更新 job 配置 (從 stdin)
   groovy <script>                   執行 Groovy script
   add-job-to-view <view> <job>...   將 jobs 加入 view
+  batch [file]                      在同一個 process 中執行多個命令（JSON Lines 輸出）
 
 範例:
   jenkee help                          # 顯示所有命令
@@ -133,8 +141,8 @@ jenkee get-job <job-name>
 # 5. 查看 job 狀態與觸發關係
 jenkee job-status <job-name>
 
-# 6. 列出 build 歷史
-jenkee list-builds <job-name>
+# 6. 列出最近的 build 歷史
+jenkee list-builds <job-name> --limit 20
 
 # 7. 查看特定 build 的 console 輸出
 jenkee console <job-name> <build-number>
@@ -218,7 +226,9 @@ jenkee add-job-to-view <view-name> <job-name>
 - 列出 jobs → `jenkee list-jobs --all`
 - 取得 job 配置 → `jenkee get-job <job>`
 - 列出 credentials → `jenkee list-credentials`
-- 觸發 build → `jenkee build <job>`
+- 觸發 build → `jenkee build <job>`（輸出 queue item ID）
+- 以不同參數觸發同一 job 的大量 builds → `jenkee build <job> --matrix params.csv`
+- 等待多個 builds 開始 / 完成 → `jenkee wait <queue-id ...>`
 - 查看 build 歷史 → `jenkee list-builds <job>`
 - 停止 builds → `jenkee stop-builds <job>`
 - 建立 job → `jenkee create-job <job>`
@@ -298,6 +308,15 @@ AI: 這個需求沒有專用命令可以完成。我需要使用 groovy script 
 4. **使用 `job-status` 可以看到 job 之間的觸發關係（upstream/downstream）**
 5. **`console` 命令不帶 build number 時會顯示最新的 build**
 6. **`job-diff` 輸出是 unified diff 格式，可以用標準工具處理**
+7. **需要大量 jobs 的狀態時，使用 `jenkee snapshot` 一次取得，不要逐一執行 `job-status`**
+8. **需要連續執行大量查詢命令時，使用 `jenkee batch` 一次送出，避免重複啟動**
+9. **要找出哪些 builds 出現特定錯誤時，使用 `jenkee console-grep`，不要逐一下載 console 再 grep**
+10. **要依名稱、folder、類型、SCM URL 或 label 找 jobs 時，先 `jenkee index update` 再用 `jenkee find`，不要逐一 `get-job` 再 grep**
+11. **要找出哪些 jobs 使用某個 credential、label 或 shared library 時，使用 `jenkee search-config <pattern> --update`**
+12. **要評估 build 耗時、失敗率或 flaky 程度時，使用 `jenkee build-stats <job|view>`，不要逐一 `list-builds` 再自行計算**
+13. **要等待 builds 完成時，使用 `jenkee watch <job...> --until-idle`，不要在迴圈中反覆執行 `job-status`**
+14. **觸發大量 builds 並等待結果時，先 `jenkee build`（不加 `-s`/`-f`）取得 queue item ID，再用一個 `jenkee wait` 一起等待**
+15. **以多組參數觸發同一個 job 時，把參數寫成 CSV / JSON Lines 檔案交給 `jenkee build <job> --matrix`，不要在迴圈中逐一執行 `jenkee build`**
 
 ## 快速參考
 
@@ -306,12 +325,14 @@ AI: 這個需求沒有專用命令可以完成。我需要使用 groovy script 
 jenkee list-views
 jenkee list-jobs <view>
 jenkee job-status <job>
+jenkee index update && jenkee find scm:<repo> type:WorkflowJob
 ```
 
 除錯 build:
 ```bash
-jenkee list-builds <job>
+jenkee list-builds <job> --since 1d
 jenkee console <job> [build]
+jenkee console-grep <job> "<regex>" --builds 100-150
 ```
 
 管理 credentials:
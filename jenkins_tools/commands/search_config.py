@@ -0,0 +1,112 @@
+"""Search job configurations command"""
+
+import re
+import sys
+
+from jenkins_tools.core import OUTPUT_FORMATS, Command
+from jenkins_tools.inventory import JobInventory
+
+
+class SearchConfigCommand(Command):
+    """Full-text search across every job's config.xml using the local index"""
+
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
+    # Record fields, in tsv column order
+    RECORD_FIELDS = ["name", "path", "line", "text"]
+
+    def __init__(self, args=None):
+        """
+        Initialize with command line arguments
+
+        Args:
+            args: List of command arguments (sys.argv[2:])
+                  Search pattern
+                  Optional flags: --regex, -r, --case-sensitive, -s, --update
+        """
+        self.args = args or []
+
+    def execute(self) -> int:
+        """Execute search-config command"""
+        regex = False
+        ignore_case = True
+        update = False
+        patterns = []
+        for arg in self.args:
+            if arg in ("--regex", "-r"):
+                regex = True
+            elif arg in ("--case-sensitive", "-s"):
+                ignore_case = False
+            elif arg == "--update":
+                update = True
+            else:
+                patterns.append(arg)
+
+        if len(patterns) != 1 or not patterns[0]:
+            print("Error: Expected exactly one search pattern", file=sys.stderr)
+            print(
+                "Usage: jenkee search-config <pattern> [--regex] [--case-sensitive] [--update]",
+                file=sys.stderr,
+            )
+            return 1
+        pattern = patterns[0]
+
+        if regex:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                print(f"Error: Invalid regular expression '{pattern}': {e}", file=sys.stderr)
+                return 1
+
+        config = self.load_config()
+        inventory = JobInventory(config)
+        try:
+            if update:
+                # Re-index only the jobs whose config hash changed
+                if not config.is_configured():
+                    print("Error: Jenkins credentials not configured.", file=sys.stderr)
+                    print(f"Run 'jenkee auth' to configure credentials.", file=sys.stderr)
+                    return 1
+                stats, result = inventory.refresh(
+                    self.open_transport(config), rebuild=not inventory.exists()
+                )
+                if stats is None:
+                    print("Error: Failed to update job index", file=sys.stderr)
+                    if result.stderr:
+                        print(result.stderr, file=sys.stderr)
+                    return 1
+            elif not inventory.exists():
+                print("Error: Job index not found.", file=sys.stderr)
+                print(
+                    "Run 'jenkee index build' first, or add --update to build it now.",
+                    file=sys.stderr,
+                )
+                return 1
+
+            results = inventory.search_config(pattern, regex=regex, ignore_case=ignore_case)
+        finally:
+            inventory.close()
+
+        if self.wants_records():
+            writer = self.record_writer(self.RECORD_FIELDS)
+            for name, hits in results:
+                for hit in hits:
+                    writer.write({"name": name, **hit})
+            writer.close()
+            return 0
+
+        if not results:
+            print("No matches found")
+            return 0
+
+        total = 0
+        for name, hits in results:
+            total += len(hits)
+            print(f"{name} ({len(hits)} match{'es' if len(hits) != 1 else ''})")
+            for hit in hits:
+                location = hit["path"] if hit["line"] is None else f"{hit['path']}:{hit['line']}"
+                print(f"  {location}: {hit['text']}")
+            print()
+
+        print(f"Total: {total} match(es) in {len(results)} job(s)")
+        return 0
@@ -0,0 +1,178 @@
+"""Snapshot command"""
+
+import json
+import sys
+
+from jenkins_tools.core import OUTPUT_FORMATS, Command
+from jenkins_tools.groovy_scripts import JOB_RECORD_FUNCTION, groovy_string
+
+# Prefix of each job record line in the script output
+RECORD_PREFIX = "JOB "
+
+# Permalinks shown on the second text line, with their labels
+OTHER_PERMALINKS = [
+    ("lastStableBuild", "stable"),
+    ("lastSuccessfulBuild", "successful"),
+    ("lastFailedBuild", "failed"),
+    ("lastUnsuccessfulBuild", "unsuccessful"),
+    ("lastCompletedBuild", "completed"),
+]
+
+
+class SnapshotCommand(Command):
+    """Show the state of every job with one server-side script"""
+
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
+    # Record fields, in tsv column order
+    RECORD_FIELDS = [
+        "name",
+        "type",
+        "enabled",
+        "buildable",
+        "health",
+        "lastBuild",
+        "lastStableBuild",
+        "lastSuccessfulBuild",
+        "lastFailedBuild",
+        "lastUnsuccessfulBuild",
+        "lastCompletedBuild",
+        "upstream",
+        "downstream",
+        "builds",
+    ]
+
+    def __init__(self, args=None):
+        """
+        Initialize with command line arguments
+
+        Args:
+            args: List of command arguments (sys.argv[2:])
+                  Optional flags: --folder PATH, --builds N
+        """
+        self.args = args or []
+
+    def execute(self) -> int:
+        """Execute snapshot command"""
+        config = self.load_config()
+
+        # Check if credentials are configured
+        if not config.is_configured():
+            print("Error: Jenkins credentials not configured.", file=sys.stderr)
+            print(f"Run 'jenkee auth' to configure credentials.", file=sys.stderr)
+            return 1
+
+        # Parse arguments
+        folder = None
+        build_limit = 5
+        i = 0
+        while i < len(self.args):
+            arg = self.args[i]
+            if arg == "--folder" and i + 1 < len(self.args):
+                folder = self.args[i + 1]
+                i += 2
+            elif arg == "--builds" and i + 1 < len(self.args):
+                try:
+                    build_limit = int(self.args[i + 1])
+                except ValueError:
+                    print(
+                        f"Error: Invalid value for --builds: '{self.args[i + 1]}'", file=sys.stderr
+                    )
+                    return 1
+                i += 2
+            else:
+                print(f"Error: Unknown option '{arg}'", file=sys.stderr)
+                print("Usage: jenkee snapshot [--folder PATH] [--builds N]", file=sys.stderr)
+                return 1
+
+        cli = self.open_transport(config)
+        output = cli.stream("groovy", "=", stdin_input=self._build_script(folder, build_limit))
+
+        # Parse records as they arrive instead of waiting for the whole fleet
+        writer = self.record_writer(self.RECORD_FIELDS) if self.wants_records() else None
+        count = 0
+        other_lines = []
+        with output:
+            for line in output:
+                if line.startswith(RECORD_PREFIX):
+                    record = json.loads(line[len(RECORD_PREFIX) :])
+                    if writer:
+                        writer.write(record)
+                    else:
+                        self._print_record(record)
+                    count += 1
+                elif line.strip():
+                    other_lines.append(line.rstrip("\n"))
+        if writer:
+            writer.close()
+
+        if output.returncode != 0:
+            print("Error: Failed to take job snapshot", file=sys.stderr)
+            if output.stderr:
+                print(output.stderr, file=sys.stderr)
+            return 1
+
+        if other_lines and other_lines[0].startswith("ERROR:"):
+            print(f"Error: Folder '{folder}' not found", file=sys.stderr)
+            return 1
+        if other_lines:
+            # Anything that is not a record is a script error reported by the server
+            print("\n".join(other_lines), file=sys.stderr)
+            return 1
+
+        if not writer:
+            print(f"Total: {count} job(s)")
+        return 0
+
+    def _build_script(self, folder, build_limit: int) -> str:
+        """Build the Groovy script that walks all jobs"""
+        if folder:
+            root = f"jenkins.model.Jenkins.instance.getItemByFullName({groovy_string(folder)})"
+        else:
+            root = "jenkins.model.Jenkins.instance"
+
+        return f"""
+import groovy.json.JsonOutput
+{JOB_RECORD_FUNCTION}
+def root = {root}
+if (!(root instanceof hudson.model.ItemGroup)) {{
+    println "ERROR: Folder not found"
+    return
+}}
+
+def count = 0
+hudson.model.Items.getAllItems(root, hudson.model.Job).each {{ job ->
+    println "{RECORD_PREFIX}" + JsonOutput.toJson(jobRecord(job, {build_limit}))
+    if (++count % 100 == 0) {{
+        out.flush()
+    }}
+}}
+"""
+
+    def _print_record(self, record: dict) -> None:
+        """
+        Print one job: a summary line, then its other permalinks and relations
+
+        The summary line keeps the same columns for every job so that it can
+        be filtered with grep or awk; detail lines are indented.
+        """
+        status = "ENABLED" if record.get("enabled") else "DISABLED"
+        health = record.get("health")
+        health_text = f"{health['score']}%" if health else "-"
+        last_build = record.get("lastBuild")
+        last_text = f"#{last_build}" if last_build is not None else "-"
+        builds = " ".join(str(number) for number in record.get("builds", []))
+
+        print(f"{record['name']}  {status}  health {health_text}  last {last_text}", end="")
+        print(f"  builds: {builds}" if builds else "")
+
+        permalinks = [
+            f"{label} #{record[key]}"
+            for key, label in OTHER_PERMALINKS
+            if record.get(key) is not None
+        ]
+        if permalinks:
+            print(f"    {'  '.join(permalinks)}")
+        for key in ("upstream", "downstream"):
+            if record.get(key):
+                print(f"    {key}: {', '.join(record[key])}")
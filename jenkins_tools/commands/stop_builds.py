@@ -2,7 +2,7 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.core import Command, fan_out, parse_fan_out_options
 
 
 class StopBuildsCommand(Command):
@@ -15,12 +15,13 @@ class StopBuildsCommand(Command):
         Args:
             args: List of command arguments (sys.argv[2:])
                   One or more job names
+                  Optional flags: --parallel N, --rate R
         """
         self.args = args or []
 
     def execute(self) -> int:
         """Execute stop-builds command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -29,15 +30,26 @@ class StopBuildsCommand(Command):
             return 1
 
         # Parse arguments
-        if not self.args:
+        try:
+            job_names, parallel, rate = parse_fan_out_options(self.args)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        if not job_names:
             print("Error: Missing job name(s)", file=sys.stderr)
-            print("Usage: jenkee stop-builds <job-name> [job-name ...]", file=sys.stderr)
+            print(
+                "Usage: jenkee stop-builds <job-name> [job-name ...] [--parallel N] [--rate R]",
+                file=sys.stderr,
+            )
             return 1
 
-        job_names = self.args
+        cli = self.open_transport(config)
+
+        if parallel > 1 and len(job_names) > 1:
+            return self._stop_each(cli, job_names, parallel, rate)
 
         # Execute stop-builds command
-        cli = JenkinsCLI(config)
         result = cli.run("stop-builds", *job_names)
 
         if result.returncode == 0:
@@ -63,3 +75,26 @@ class StopBuildsCommand(Command):
             if result.stderr:
                 print(result.stderr, file=sys.stderr)
             return 1
+
+    def _stop_each(self, cli, job_names, parallel, rate) -> int:
+        """Stop builds job by job with bounded concurrency, reporting each job"""
+        failed_jobs = []
+
+        results = fan_out(lambda job: cli.run("stop-builds", job), job_names, parallel, rate)
+        for job_name, result in results:
+            if result.returncode == 0:
+                print(f"✓ Stopped all running builds for job '{job_name}'")
+            else:
+                failed_jobs.append(job_name)
+                print(f"Error: Failed to stop builds for job '{job_name}'", file=sys.stderr)
+                if result.stderr:
+                    print(result.stderr, file=sys.stderr)
+
+        if failed_jobs:
+            success_count = len(job_names) - len(failed_jobs)
+            print(
+                f"Warning: {success_count} job(s) stopped, {len(failed_jobs)} failed",
+                file=sys.stderr,
+            )
+            return 1
+        return 0
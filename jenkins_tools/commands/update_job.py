@@ -2,7 +2,8 @@
 
 import sys
 
-from jenkins_tools.core import Command, JenkinsConfig, JenkinsCLI
+from jenkins_tools.cache import ConfigCache
+from jenkins_tools.core import Command
 
 
 class UpdateJobCommand(Command):
@@ -20,7 +21,7 @@ class UpdateJobCommand(Command):
 
     def execute(self) -> int:
         """Execute update-job command"""
-        config = JenkinsConfig()
+        config = self.load_config()
 
         # Check if credentials are configured
         if not config.is_configured():
@@ -50,7 +51,7 @@ class UpdateJobCommand(Command):
             return 1
 
         # Use Jenkins CLI to update job
-        cli = JenkinsCLI(config)
+        cli = self.open_transport(config)
         result = cli.run("update-job", job_name, stdin_input=xml_content)
 
         if result.returncode != 0:
@@ -59,7 +60,8 @@ class UpdateJobCommand(Command):
                 print(result.stderr, file=sys.stderr)
             return 1
 
-        # Success
+        # Success: the cached config.xml is now outdated
+        ConfigCache(config).invalidate(job_name)
         print(f"✓ Successfully updated job '{job_name}'")
 
         return 0
@@ -0,0 +1,338 @@
+"""Wait command"""
+
+import json
+import re
+import sys
+import time
+from datetime import datetime
+from http.client import HTTPException
+
+from jenkins_tools.build_history import format_duration
+from jenkins_tools.build_queue import poll_queue_items, url_path
+from jenkins_tools.core import OUTPUT_FORMATS, Command, get_http_backend
+
+# Constants
+WAIT_MIN_INTERVAL = 2.0  # Seconds between polls right after a change
+WAIT_MAX_INTERVAL = 15.0  # Upper bound while nothing changes
+WAIT_BACKOFF = 1.5  # Interval growth per quiet poll
+WAIT_RETRIES = 10  # Consecutive failed polls before giving up
+
+EXECUTORS_TREE = (
+    "computer[executors[currentExecutable[url]],oneOffExecutors[currentExecutable[url]]]"
+)
+BUILD_TREE = "building,result,duration"
+
+# A build reference: JOB#NUMBER
+BUILD_REF_PATTERN = re.compile(r"^(.+)#(\d+)$")
+
+
+class WaitCommand(Command):
+    """Wait for many queued items and builds to start and finish"""
+
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
+    # Record fields, in tsv column order
+    RECORD_FIELDS = ["time", "queueId", "job", "event", "number", "result", "duration"]
+
+    def __init__(self, args=None):
+        """
+        Initialize with command line arguments
+
+        Args:
+            args: List of command arguments (sys.argv[2:])
+                  Queue item IDs and/or JOB#NUMBER build references, or '-'
+                  to read them from stdin
+                  Optional flags: --started, --timeout S
+        """
+        self.args = args or []
+        self.writer = None
+
+    def execute(self) -> int:
+        """Execute wait command"""
+        config = self.load_config()
+
+        # Check if credentials are configured
+        if not config.is_configured():
+            print("Error: Jenkins credentials not configured.", file=sys.stderr)
+            print(f"Run 'jenkee auth' to configure credentials.", file=sys.stderr)
+            return 1
+
+        # Parse arguments
+        try:
+            queue_ids, builds, started_only, timeout = self._parse_args(self.args)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        if not queue_ids and not builds:
+            print("Error: Nothing to wait for", file=sys.stderr)
+            print(
+                "Usage: jenkee wait <queue-id|job#number ...|-> [--started] [--timeout S]",
+                file=sys.stderr,
+            )
+            return 1
+
+        http = get_http_backend(self.open_transport(config))
+        if http is None:
+            print(
+                "Error: wait requires the HTTP transport (JENKINS_TRANSPORT=auto or http)",
+                file=sys.stderr,
+            )
+            return 1
+
+        if self.wants_records():
+            self.writer = self.record_writer(self.RECORD_FIELDS)
+        try:
+            return self._wait(http, queue_ids, builds, started_only, timeout)
+        except KeyboardInterrupt:
+            return 130
+        finally:
+            if self.writer:
+                self.writer.close()
+
+    def _parse_args(self, args):
+        """
+        Split flags from the items to wait for
+
+        Returns:
+            Tuple of (queue IDs, list of (job, number), started only, timeout or None)
+
+        Raises:
+            ValueError: If an item or option value is invalid
+        """
+        tokens = []
+        started_only = False
+        timeout = None
+
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if arg == "--started":
+                started_only = True
+            elif arg == "--timeout":
+                if i + 1 >= len(args):
+                    raise ValueError("Missing value for --timeout")
+                try:
+                    timeout = float(args[i + 1])
+                except ValueError:
+                    timeout = -1
+                if timeout <= 0:
+                    raise ValueError(f"Invalid value for --timeout: '{args[i + 1]}'")
+                i += 1
+            elif arg == "-":
+                tokens.extend(self._read_stdin())
+            else:
+                tokens.append(arg)
+            i += 1
+
+        queue_ids = []
+        builds = []
+        for token in tokens:
+            match = BUILD_REF_PATTERN.match(token)
+            if token.isdigit():
+                if int(token) not in queue_ids:
+                    queue_ids.append(int(token))
+            elif match:
+                build = (match.group(1), int(match.group(2)))
+                if build not in builds:
+                    builds.append(build)
+            else:
+                raise ValueError(f"Invalid queue item or build '{token}' (use 42 or job#12)")
+        return queue_ids, builds, started_only, timeout
+
+    @staticmethod
+    def _read_stdin():
+        """
+        Read items from stdin
+
+        Accepts whitespace-separated queue IDs, one JOB#NUMBER reference per
+        line, and ndjson records with a `queueId` field (as printed by
+        `build --format ndjson`).
+        """
+        tokens = []
+        for line in sys.stdin:
+            line = line.strip()
+            if line.startswith("{"):
+                record = json.loads(line)
+                if record.get("queueId") is not None:
+                    tokens.append(str(record["queueId"]))
+            elif BUILD_REF_PATTERN.match(line):
+                # Job names may contain spaces
+                tokens.append(line)
+            elif line:
+                tokens.extend(line.split())
+        return tokens
+
+    def _wait(self, http, queue_ids, builds, started_only, timeout) -> int:
+        """
+        Poll until every item has resolved
+
+        Each tick costs one `/queue/api/json` request while items are queued
+        and one `/computer/api/json` request while builds run, however many
+        are tracked. Only items that left the queue and builds that left their
+        executor are looked up individually, once each.
+        """
+        pending = {queue_id: None for queue_id in queue_ids}  # queue ID -> job name
+        running = {}  # build path -> {"queueId", "job", "number"}
+        for job_name, number in builds:
+            path = f"{http.item_path(job_name)}/{number}/"
+            running[path] = {"queueId": None, "job": job_name, "number": number}
+
+        failed = False
+        interval = WAIT_MIN_INTERVAL
+        errors = 0
+        deadline = time.monotonic() + timeout if timeout else None
+
+        # Builds given directly may already be finished
+        check_builds = list(running)
+
+        while True:
+            try:
+                changed, tick_failed = self._tick(
+                    http, pending, running, check_builds, started_only
+                )
+            except (OSError, HTTPException, ValueError) as e:
+                errors += 1
+                if errors > WAIT_RETRIES:
+                    print(f"Error: Failed to poll Jenkins: {e}", file=sys.stderr)
+                    return 1
+                delay = min(WAIT_MIN_INTERVAL * 2**errors, WAIT_MAX_INTERVAL)
+                print(f"Warning: Poll failed ({e}), retrying in {delay:.0f}s", file=sys.stderr)
+                if not self._sleep(delay, deadline):
+                    return self._timed_out(pending, running)
+                continue
+            errors = 0
+            failed = failed or tick_failed
+            check_builds = []
+
+            if not pending and (started_only or not running):
+                return 1 if failed else 0
+
+            interval = (
+                WAIT_MIN_INTERVAL if changed else min(interval * WAIT_BACKOFF, WAIT_MAX_INTERVAL)
+            )
+            if not self._sleep(interval, deadline):
+                return self._timed_out(pending, running)
+
+    def _tick(self, http, pending, running, check_builds, started_only):
+        """
+        Poll once, emitting events and updating `pending` and `running`
+
+        Returns:
+            Tuple of (whether anything changed, whether anything failed)
+        """
+        changed = False
+        failed = False
+
+        if pending:
+            for queue_id, item in poll_queue_items(http, pending).items():
+                if item["state"] == "queued":
+                    pending[queue_id] = item["job"]
+                    continue
+                if item["state"] == "leaving":
+                    # Between leaving the queue and getting an executor
+                    changed = True
+                    continue
+
+                changed = True
+                known_name = pending.pop(queue_id)
+                job_name = item["job"] or known_name
+                if item["state"] != "started":
+                    # Cancelled, or forgotten a few minutes after leaving the queue
+                    failed = True
+                    self._emit(self._event(queue_id, job_name, item["state"]))
+                    continue
+                self._emit(self._event(queue_id, job_name, "started", item["number"]))
+                if not started_only:
+                    running[item["url"]] = {
+                        "queueId": queue_id,
+                        "job": job_name,
+                        "number": item["number"],
+                    }
+
+        if running and not started_only:
+            status, data = http.get_json("/computer", tree=EXECUTORS_TREE)
+            if status != 200:
+                raise ValueError(f"HTTP {status} from /computer")
+            active = set()
+            for computer in (data or {}).get("computer", []):
+                for executor in computer.get("executors", []) + computer.get("oneOffExecutors", []):
+                    executable = executor.get("currentExecutable") or {}
+                    if executable.get("url"):
+                        active.add(url_path(http, executable["url"]))
+
+            for path in list(running):
+                if path in active and path not in check_builds:
+                    continue
+                status, build = http.get_json(path.rstrip("/"), tree=BUILD_TREE)
+                info = running[path]
+                if status == 404 or not build:
+                    failed = changed = True
+                    del running[path]
+                    self._emit(self._event(info["queueId"], info["job"], "lost", info["number"]))
+                    continue
+                if status != 200:
+                    raise ValueError(f"HTTP {status} from {info['job']} #{info['number']}")
+                if build["building"]:
+                    continue
+                changed = True
+                del running[path]
+                failed = failed or build["result"] != "SUCCESS"
+                self._emit(
+                    self._event(
+                        info["queueId"],
+                        info["job"],
+                        "finished",
+                        info["number"],
+                        result=build["result"],
+                        duration=build["duration"],
+                    )
+                )
+
+        return changed, failed
+
+    def _event(self, queue_id, job_name, event: str, number=None, **fields) -> dict:
+        """Build an event record"""
+        record = {field: None for field in self.RECORD_FIELDS}
+        record.update(
+            time=datetime.now().isoformat(timespec="seconds"),
+            queueId=queue_id,
+            job=job_name,
+            event=event,
+            number=number,
+            **fields,
+        )
+        return record
+
+    def _emit(self, event: dict) -> None:
+        """Write an event as a record or a text line"""
+        if self.writer:
+            self.writer.write(event)
+            return
+
+        source = f"[queue {event['queueId']}] " if event["queueId"] is not None else ""
+        build = f" #{event['number']}" if event["number"] is not None else ""
+        line = f"{event['time']}  {source}{event['job'] or '?'}{build} {event['event']}"
+        if event["event"] == "finished":
+            line += f": {event['result']} in {format_duration(event['duration'])}"
+        print(line)
+        sys.stdout.flush()
+
+    def _timed_out(self, pending, running) -> int:
+        """Report what is still unresolved at the deadline"""
+        print(
+            f"Error: Timed out with {len(pending)} queued item(s) and "
+            f"{len(running)} running build(s) left",
+            file=sys.stderr,
+        )
+        return 1
+
+    @staticmethod
+    def _sleep(seconds: float, deadline) -> bool:
+        """Sleep, stopping at the deadline; returns False once the deadline has passed"""
+        if deadline is not None:
+            seconds = min(seconds, deadline - time.monotonic())
+            if seconds <= 0:
+                return False
+        time.sleep(seconds)
+        return True
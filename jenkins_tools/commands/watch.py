@@ -0,0 +1,347 @@
+"""Watch command"""
+
+import sys
+import time
+from datetime import datetime
+from http.client import HTTPException
+
+from jenkins_tools.build_history import format_duration
+from jenkins_tools.core import OUTPUT_FORMATS, Command, get_http_backend
+
+# Constants
+WATCH_MIN_INTERVAL = 2.0  # Seconds between polls right after a change
+WATCH_MAX_INTERVAL = 30.0  # Upper bound while nothing changes
+WATCH_BACKOFF = 1.5  # Interval growth per quiet poll
+WATCH_RETRIES = 10  # Consecutive failed polls before giving up
+
+# Fields of each watched job's folder listing, and of one build
+BUILD_TREE = "number,building,result,timestamp,duration,estimatedDuration"
+FOLDER_TREE = f"jobs[name,inQueue,lastBuild[{BUILD_TREE}]]"
+
+
+class WatchCommand(Command):
+    """Watch jobs and report builds as they are queued, start and finish"""
+
+    SUPPORTED_FORMATS = OUTPUT_FORMATS
+
+    # Record fields, in tsv column order
+    RECORD_FIELDS = ["time", "job", "event", "number", "result", "previousResult", "duration"]
+
+    def __init__(self, args=None):
+        """
+        Initialize with command line arguments
+
+        Args:
+            args: List of command arguments (sys.argv[2:])
+                  Job names
+                  Optional flags: --interval S, --max-interval S, --timeout S, --until-idle
+        """
+        self.args = args or []
+        self.writer = None
+
+    def execute(self) -> int:
+        """Execute watch command"""
+        config = self.load_config()
+
+        # Check if credentials are configured
+        if not config.is_configured():
+            print("Error: Jenkins credentials not configured.", file=sys.stderr)
+            print(f"Run 'jenkee auth' to configure credentials.", file=sys.stderr)
+            return 1
+
+        # Parse arguments
+        try:
+            job_names, min_interval, max_interval, timeout, until_idle = self._parse_args(self.args)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+        if not job_names:
+            print("Error: Missing job name", file=sys.stderr)
+            print(
+                "Usage: jenkee watch <job-name> [job-name ...] [--interval S] [--max-interval S] "
+                "[--timeout S] [--until-idle]",
+                file=sys.stderr,
+            )
+            return 1
+
+        http = get_http_backend(self.open_transport(config))
+        if http is None:
+            print(
+                "Error: watch requires the HTTP transport (JENKINS_TRANSPORT=auto or http)",
+                file=sys.stderr,
+            )
+            return 1
+
+        if self.wants_records():
+            self.writer = self.record_writer(self.RECORD_FIELDS)
+        try:
+            return self._watch(http, job_names, min_interval, max_interval, timeout, until_idle)
+        except KeyboardInterrupt:
+            return 0
+        finally:
+            if self.writer:
+                self.writer.close()
+
+    def _parse_args(self, args):
+        """
+        Split flags from job names
+
+        Returns:
+            Tuple of (job names, min interval, max interval, timeout or None, until idle)
+        """
+        job_names = []
+        values = {"--interval": WATCH_MIN_INTERVAL, "--max-interval": WATCH_MAX_INTERVAL}
+        timeout = None
+        until_idle = False
+
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if arg in ("--interval", "--max-interval", "--timeout"):
+                if i + 1 >= len(args):
+                    raise ValueError(f"Missing value for {arg}")
+                try:
+                    value = float(args[i + 1])
+                except ValueError:
+                    value = -1
+                if value <= 0:
+                    raise ValueError(f"Invalid value for {arg}: '{args[i + 1]}'")
+                if arg == "--timeout":
+                    timeout = value
+                else:
+                    values[arg] = value
+                i += 1
+            elif arg == "--until-idle":
+                until_idle = True
+            elif arg not in job_names:
+                job_names.append(arg)
+            i += 1
+
+        min_interval = values["--interval"]
+        return (
+            job_names,
+            min_interval,
+            max(values["--max-interval"], min_interval),
+            timeout,
+            until_idle,
+        )
+
+    def _watch(self, http, job_names, min_interval, max_interval, timeout, until_idle) -> int:
+        """
+        Poll until interrupted, timed out or (with --until-idle) idle
+
+        Each tick issues one request per folder holding watched jobs, over the
+        transport's keep-alive connection. The interval resets to the minimum
+        after a change and grows by WATCH_BACKOFF while nothing changes; while
+        a build runs it is capped at the time Jenkins estimates is left.
+        Failed polls back off exponentially.
+        """
+        folders = {}
+        for name in job_names:
+            folder, _, short_name = name.rpartition("/")
+            folders.setdefault(folder, {})[short_name] = name
+
+        states = {}
+        failed = False
+        interval = min_interval
+        errors = 0
+        deadline = time.monotonic() + timeout if timeout else None
+
+        while True:
+            try:
+                snapshot = self._poll(http, folders)
+                recent = {
+                    name: self._recent_builds(http, name, states[name], snapshot[name])
+                    for name in job_names
+                    if name in snapshot and name in states
+                }
+            except (OSError, HTTPException, ValueError) as e:
+                errors += 1
+                if errors > WATCH_RETRIES:
+                    print(f"Error: Failed to poll Jenkins: {e}", file=sys.stderr)
+                    return 1
+                delay = min(min_interval * 2**errors, max_interval)
+                print(f"Warning: Poll failed ({e}), retrying in {delay:.0f}s", file=sys.stderr)
+                if not self._sleep(delay, deadline):
+                    print("Error: Timed out", file=sys.stderr)
+                    return 1
+                continue
+            errors = 0
+
+            missing = [name for name in job_names if name not in snapshot]
+            if missing and not states:
+                for name in missing:
+                    print(f"Error: Job '{name}' not found", file=sys.stderr)
+                return 1
+
+            changed = False
+            for name in job_names:
+                if name not in snapshot:
+                    continue
+                if name not in states:
+                    states[name] = self._initial_state(name, snapshot[name])
+                    continue
+                for event in self._diff(name, states[name], snapshot[name], recent[name]):
+                    changed = True
+                    if event["event"] == "finished" and event["result"] != "SUCCESS":
+                        failed = True
+                    self._emit(event)
+
+            running = [state for state in states.values() if state["running"] or state["queued"]]
+            if until_idle and not running:
+                return 1 if failed else 0
+
+            if changed:
+                interval = min_interval
+            else:
+                interval = min(interval * WATCH_BACKOFF, max_interval)
+            remaining = [
+                build["timestamp"] + build["estimatedDuration"] - time.time() * 1000
+                for build in (snapshot[name].get("lastBuild") or {} for name in snapshot)
+                if build.get("building") and (build.get("estimatedDuration") or -1) > 0
+            ]
+            if remaining:
+                interval = min(interval, max(min_interval, min(remaining) / 1000))
+
+            if not self._sleep(interval, deadline):
+                print("Error: Timed out", file=sys.stderr)
+                return 1
+
+    def _poll(self, http, folders):
+        """
+        Fetch the queue state and last build of every watched job
+
+        Returns:
+            Job full name -> {"inQueue", "lastBuild"} for the jobs that exist
+        """
+        snapshot = {}
+        for folder, short_names in folders.items():
+            status, data = http.get_json(http.item_path(folder), tree=FOLDER_TREE)
+            if status == 404:
+                continue
+            if status != 200:
+                raise ValueError(f"HTTP {status}")
+            for job in (data or {}).get("jobs", []):
+                if job.get("name") in short_names:
+                    snapshot[short_names[job["name"]]] = job
+        return snapshot
+
+    def _initial_state(self, name: str, job: dict) -> dict:
+        """Record a job's state on the first poll, printing it in text mode"""
+        build = job.get("lastBuild")
+        state = {
+            "queued": bool(job.get("inQueue")),
+            "last": build["number"] if build else 0,
+            "running": {build["number"]} if build and build["building"] else set(),
+            "result": build["result"] if build and not build["building"] else None,
+        }
+        if not self.writer:
+            if build is None:
+                status = "no builds"
+            elif build["building"]:
+                status = f"#{build['number']} running"
+            else:
+                status = f"idle, #{build['number']} {build['result']}"
+            queued = ", queued" if state["queued"] else ""
+            print(f"{self._now()}  {name}: {status}{queued}")
+            sys.stdout.flush()
+        return state
+
+    def _recent_builds(self, http, name: str, state: dict, job: dict) -> list:
+        """
+        Get the builds of a job that may have changed since the last poll
+
+        Builds that started (or finished) between two polls, and earlier builds
+        still running next to a newer one, are looked up with one extra request
+        for the job's recent builds; otherwise the snapshot's last build is
+        enough.
+
+        Returns:
+            List of build dicts (empty if the job has no builds)
+        """
+        build = job.get("lastBuild")
+        if build is None:
+            return []
+
+        oldest = min(state["running"] | {state["last"] + 1})
+        if build["number"] <= oldest:
+            return [build]
+        count = build["number"] - oldest + 1
+        status, data = http.get_json(
+            http.item_path(name), tree=f"builds[{BUILD_TREE}]{{0,{count}}}"
+        )
+        if status != 200 or not data:
+            return [build]
+        return [b for b in data.get("builds", []) if b["number"] >= oldest]
+
+    def _diff(self, name: str, state: dict, job: dict, builds: list):
+        """
+        Compare a job's new snapshot and recent builds with its state and
+        update the state
+
+        Returns:
+            List of event records, oldest first
+        """
+        events = []
+        queued = bool(job.get("inQueue"))
+        if queued and not state["queued"]:
+            events.append(self._event(name, "queued"))
+        state["queued"] = queued
+
+        for build in sorted(builds, key=lambda b: b["number"]):
+            number = build["number"]
+            if number > state["last"]:
+                events.append(self._event(name, "started", number))
+                state["last"] = number
+                state["running"].add(number)
+            if number in state["running"] and not build["building"]:
+                state["running"].discard(number)
+                events.append(
+                    self._event(
+                        name,
+                        "finished",
+                        number,
+                        result=build["result"],
+                        previousResult=state["result"],
+                        duration=build["duration"],
+                    )
+                )
+                state["result"] = build["result"]
+        return events
+
+    def _event(self, name: str, event: str, number=None, **fields) -> dict:
+        """Build an event record"""
+        record = {field: None for field in self.RECORD_FIELDS}
+        record.update(time=self._now(), job=name, event=event, number=number, **fields)
+        return record
+
+    def _emit(self, event: dict) -> None:
+        """Write an event as a record or a text line"""
+        if self.writer:
+            self.writer.write(event)
+            return
+
+        build = f" #{event['number']}" if event["number"] is not None else ""
+        line = f"{event['time']}  {event['job']}{build} {event['event']}"
+        if event["event"] == "finished":
+            line += f": {event['result']}"
+            if event["previousResult"] and event["previousResult"] != event["result"]:
+                line += f" (was {event['previousResult']})"
+            line += f" in {format_duration(event['duration'])}"
+        print(line)
+        sys.stdout.flush()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat(timespec="seconds")
+
+    @staticmethod
+    def _sleep(seconds: float, deadline) -> bool:
+        """Sleep, stopping at the deadline; returns False once the deadline has passed"""
+        if deadline is not None:
+            seconds = min(seconds, deadline - time.monotonic())
+            if seconds <= 0:
+                return False
+        time.sleep(seconds)
+        return True
@@ -0,0 +1,332 @@
+"""Canonical config.xml rendering, structural diff and near-duplicate clustering of jobs
+
+Configs are rendered as canonical lines (sorted attributes, normalized
+whitespace, one element per line), so two jobs only differ where their
+settings differ. `semantic_diff` compares two parsed configs node by node,
+matching repeated elements by a key child (such as a parameter's `<name>`)
+instead of by line, and reports XPath-addressed changes in linear time.
+
+For fleet-wide comparison each job is reduced to a MinHash signature of its
+line shingles; locality-sensitive hashing over signature bands proposes
+candidate pairs, so similar jobs are found without diffing every pair of
+configs.
+"""
+
+import fnmatch
+import hashlib
+import random
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+# Constants
+SHINGLE_SIZE = 3  # Consecutive canonical lines per shingle
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16  # Bands of MINHASH_PERMUTATIONS // LSH_BANDS rows each
+MINHASH_SEED = 1
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+# Nodes left out of semantic diffs unless --no-default-ignore is given:
+# free-form descriptions, plugin version attributes and per-copy random UUIDs
+DEFAULT_IGNORE = ["description", "@plugin", "uuid"]
+
+# Child elements identifying one of several same-tag siblings, in order of preference
+KEY_FIELDS = ["name", "id", "key", "credentialsId", "url"]
+
+
+def canonical_lines(xml_text: str) -> List[str]:
+    """
+    Render config.xml as canonical, indented lines
+
+    The XML declaration and whitespace-only text are dropped, attributes are
+    sorted and multi-line text (scripts, shell steps) keeps one line per
+    source line.
+
+    Raises:
+        ET.ParseError: If the XML is malformed
+    """
+    return canonical_element_lines(ET.fromstring(xml_text))
+
+
+def canonical_element_lines(root: ET.Element) -> List[str]:
+    """Render a parsed element and its subtree as canonical, indented lines"""
+    lines = []
+
+    def add_text(text: str, indent: str) -> None:
+        for line in text.strip().splitlines():
+            lines.append(indent + escape(line.rstrip()))
+
+    def walk(elem: ET.Element, depth: int) -> None:
+        indent = "  " * depth
+        attrs = "".join(
+            f" {name}={quoteattr(value)}" for name, value in sorted(elem.attrib.items())
+        )
+        text = (elem.text or "").strip()
+        children = list(elem)
+
+        if not children and "\n" not in text:
+            if text:
+                lines.append(f"{indent}<{elem.tag}{attrs}>{escape(text)}</{elem.tag}>")
+            else:
+                lines.append(f"{indent}<{elem.tag}{attrs}/>")
+            return
+
+        lines.append(f"{indent}<{elem.tag}{attrs}>")
+        if text:
+            add_text(text, indent + "  ")
+        for child in children:
+            walk(child, depth + 1)
+            if child.tail and child.tail.strip():
+                add_text(child.tail, indent + "  ")
+        lines.append(f"{indent}</{elem.tag}>")
+
+    walk(root, 0)
+    return lines
+
+
+def semantic_diff(xml_a: str, xml_b: str, ignore: Optional[List[str]] = None) -> List[dict]:
+    """
+    Compare two configs as trees
+
+    Elements are matched by path; among same-tag siblings by the text of
+    their first KEY_FIELDS child when that is unique, otherwise by position.
+    An added or removed element is reported once for its whole subtree.
+
+    Args:
+        xml_a: Old config.xml
+        xml_b: New config.xml
+        ignore: Node patterns to skip. A pattern starting with '/' is matched
+                (fnmatch) against the full path, anything else against the
+                element tag or '@attribute' name. Defaults to DEFAULT_IGNORE.
+
+    Returns:
+        List of {change: added|removed|changed, path, old, new} in document
+        order; old/new are text values, or canonical lines of a subtree
+        joined with newlines
+
+    Raises:
+        ET.ParseError: If either XML is malformed
+    """
+    patterns = DEFAULT_IGNORE if ignore is None else ignore
+    name_patterns = [pattern for pattern in patterns if not pattern.startswith("/")]
+    path_patterns = [pattern for pattern in patterns if pattern.startswith("/")]
+
+    def ignored(name: str, path: str) -> bool:
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in name_patterns) or any(
+            fnmatch.fnmatchcase(path, pattern) for pattern in path_patterns
+        )
+
+    def render(elem: ET.Element) -> str:
+        if len(elem) == 0 and not elem.attrib:
+            return (elem.text or "").strip()
+        return "\n".join(canonical_element_lines(elem))
+
+    changes = []
+
+    def compare(elem_a: ET.Element, elem_b: ET.Element, path: str) -> None:
+        for attr in sorted(set(elem_a.attrib) | set(elem_b.attrib)):
+            attr_path = f"{path}/@{attr}"
+            if ignored(f"@{attr}", attr_path):
+                continue
+            old, new = elem_a.attrib.get(attr), elem_b.attrib.get(attr)
+            if old != new:
+                change = "changed" if old is not None and new is not None else None
+                change = change or ("added" if old is None else "removed")
+                changes.append({"change": change, "path": attr_path, "old": old, "new": new})
+
+        old_text, new_text = (elem_a.text or "").strip(), (elem_b.text or "").strip()
+        if old_text != new_text:
+            changes.append({"change": "changed", "path": path, "old": old_text, "new": new_text})
+
+        children_a, children_b = _match_children(elem_a, elem_b, path)
+        for key, (child_path, child_a) in children_a.items():
+            if ignored(child_a.tag, child_path):
+                continue
+            if key not in children_b:
+                changes.append(
+                    {"change": "removed", "path": child_path, "old": render(child_a), "new": None}
+                )
+            else:
+                compare(child_a, children_b[key][1], child_path)
+        for key, (child_path, child_b) in children_b.items():
+            if key not in children_a and not ignored(child_b.tag, child_path):
+                changes.append(
+                    {"change": "added", "path": child_path, "old": None, "new": render(child_b)}
+                )
+
+    root_a, root_b = ET.fromstring(xml_a), ET.fromstring(xml_b)
+    if root_a.tag != root_b.tag:
+        return [
+            {
+                "change": "changed",
+                "path": "/",
+                "old": "\n".join(canonical_element_lines(root_a)),
+                "new": "\n".join(canonical_element_lines(root_b)),
+            }
+        ]
+    compare(root_a, root_b, f"/{root_a.tag}")
+    return changes
+
+
+def _match_children(
+    elem_a: ET.Element, elem_b: ET.Element, path: str
+) -> Tuple[Dict[tuple, Tuple[str, ET.Element]], Dict[tuple, Tuple[str, ET.Element]]]:
+    """
+    Map the children of two matched elements to match keys and XPaths
+
+    A key field is used for a tag only when it identifies every same-tag
+    sibling on both sides, so the two sides always key a tag the same way.
+
+    Returns:
+        Tuple of (children of elem_a, children of elem_b), each mapping
+        key -> (XPath, child) in document order
+    """
+    tags_a, tags_b = {}, {}
+    for elem, by_tag in ((elem_a, tags_a), (elem_b, tags_b)):
+        for child in elem:
+            by_tag.setdefault(child.tag, []).append(child)
+
+    def key_field(tag: str) -> Optional[str]:
+        siblings_a, siblings_b = tags_a.get(tag, []), tags_b.get(tag, [])
+        if len(siblings_a) <= 1 and len(siblings_b) <= 1:
+            return None
+        for field in KEY_FIELDS:
+            usable = True
+            for siblings in (siblings_a, siblings_b):
+                values = [(child.findtext(field) or "").strip() for child in siblings]
+                if not all(values) or len(set(values)) != len(values):
+                    usable = False
+                    break
+            if usable:
+                return field
+        return None
+
+    fields = {tag: key_field(tag) for tag in set(tags_a) | set(tags_b)}
+
+    def keyed(by_tag: Dict[str, List[ET.Element]]) -> Dict[tuple, Tuple[str, ET.Element]]:
+        children = {}
+        for tag, siblings in by_tag.items():
+            field = fields[tag]
+            single = len(tags_a.get(tag, [])) <= 1 and len(tags_b.get(tag, [])) <= 1
+            for position, child in enumerate(siblings, 1):
+                if field is not None:
+                    value = child.findtext(field).strip()
+                    quote = "'" if "'" not in value else '"'
+                    key = (tag, field, value)
+                    child_path = f"{path}/{tag}[{field}={quote}{value}{quote}]"
+                else:
+                    key = (tag, position)
+                    child_path = f"{path}/{tag}" if single else f"{path}/{tag}[{position}]"
+                children[key] = (child_path, child)
+        return children
+
+    return keyed(tags_a), keyed(tags_b)
+
+
+def shingles(lines: List[str], size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hash every run of `size` consecutive lines into a set of 64-bit shingles"""
+    if len(lines) < size:
+        runs = ["\n".join(lines)]
+    else:
+        runs = ["\n".join(lines[i : i + size]) for i in range(len(lines) - size + 1)]
+    return {
+        int.from_bytes(hashlib.blake2b(run.encode("utf-8"), digest_size=8).digest(), "big")
+        for run in runs
+    }
+
+
+class MinHasher:
+    """Compute MinHash signatures with a fixed family of universal hash functions"""
+
+    def __init__(self, num_perm: int = MINHASH_PERMUTATIONS, seed: int = MINHASH_SEED):
+        rng = random.Random(seed)
+        self.params = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingle_set: Iterable[int]) -> Tuple[int, ...]:
+        """Get the MinHash signature of a shingle set"""
+        values = [value % _MERSENNE_PRIME for value in shingle_set]
+        if not values:
+            return tuple(_MERSENNE_PRIME for _ in self.params)
+        return tuple(
+            min((a * value + b) % _MERSENNE_PRIME for value in values) for a, b in self.params
+        )
+
+
+def estimate_similarity(sig1: Tuple[int, ...], sig2: Tuple[int, ...]) -> float:
+    """Estimate the Jaccard similarity of two shingle sets from their signatures"""
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+def candidate_pairs(signatures: Dict[str, Tuple[int, ...]], bands: int = LSH_BANDS):
+    """
+    Propose pairs of likely similar jobs with LSH banding
+
+    Two jobs become candidates when any band of their signatures is equal.
+
+    Yields:
+        (name1, name2) pairs, possibly repeated across bands
+    """
+    rows = len(next(iter(signatures.values()))) // bands
+    for band in range(bands):
+        buckets = {}
+        for name, signature in signatures.items():
+            key = signature[band * rows : (band + 1) * rows]
+            buckets.setdefault(key, []).append(name)
+        for members in buckets.values():
+            for i in range(1, len(members)):
+                for j in range(i):
+                    yield members[j], members[i]
+
+
+def cluster_jobs(signatures: Dict[str, Tuple[int, ...]], threshold: float) -> List[dict]:
+    """
+    Group jobs whose estimated similarity reaches `threshold`
+
+    Candidate pairs above the threshold are linked (single linkage); each
+    cluster's medoid is the member with the highest total similarity to the
+    others.
+
+    Returns:
+        Clusters sorted by size (largest first), each a dict with 'medoid' and
+        'members' (list of (name, similarity to medoid), medoid first, then by
+        decreasing similarity)
+    """
+    parent = {name: name for name in signatures}
+
+    def find(name: str) -> str:
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    for name1, name2 in candidate_pairs(signatures):
+        root1, root2 = find(name1), find(name2)
+        if root1 == root2:
+            continue
+        if estimate_similarity(signatures[name1], signatures[name2]) >= threshold:
+            parent[root2] = root1
+
+    groups = {}
+    for name in sorted(signatures):
+        groups.setdefault(find(name), []).append(name)
+
+    clusters = []
+    for names in groups.values():
+        medoid = max(
+            names,
+            key=lambda candidate: sum(
+                estimate_similarity(signatures[candidate], signatures[other]) for other in names
+            ),
+        )
+        members = [
+            (name, estimate_similarity(signatures[medoid], signatures[name])) for name in names
+        ]
+        members.sort(key=lambda member: (member[0] != medoid, -member[1], member[0]))
+        clusters.append({"medoid": medoid, "members": members})
+
+    clusters.sort(key=lambda cluster: (-len(cluster["members"]), cluster["medoid"]))
+    return clusters
@@ -1,23 +1,105 @@
 """Core components for Jenkins CLI tools"""
 
+import base64
+import json
 import os
+import queue
+import re
 import subprocess
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
-from urllib.request import urlretrieve
-
-from dotenv import load_dotenv
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from urllib.parse import quote, urlencode, urlsplit
 
+# http.client, urllib.request, concurrent.futures and dotenv are imported where
+# they are used: together they dominate import time, and commands such as
+# `help` never need them.
 
 # Constants
 JENKINS_CLI_JAR_PATH = Path("/tmp/jenkins-inspector/jenkins-cli.jar")
+HTTP_TIMEOUT = 60
+HTTP_POOL_SIZE = 8
+HTTP_READ_SIZE = 64 * 1024
+OUTPUT_FORMATS = ("text", "json", "ndjson", "tsv")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _env_flag(name: str) -> bool:
+    """Read a boolean flag from the environment"""
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
 
 
 class Command(ABC):
     """Abstract base class for all commands"""
 
+    # Config/transport injected with bind(); None means use the process-wide session
+    _config = None
+    _transport = None
+
+    # Formats accepted by the global --format option; commands that emit
+    # records override this with OUTPUT_FORMATS
+    SUPPORTED_FORMATS = ("text",)
+    output_format = "text"
+
+    @classmethod
+    def from_args(cls, args: List[str]) -> "Command":
+        """
+        Create the command from its arguments, handling global options
+
+        `--format FORMAT` (or `--format=FORMAT`) may appear anywhere in the
+        arguments and is removed before they reach the command.
+
+        Raises:
+            ValueError: If the format is unknown or not supported by the command
+        """
+        remaining = []
+        output_format = "text"
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if arg == "--format":
+                if i + 1 >= len(args):
+                    raise ValueError("--format requires a value")
+                output_format = args[i + 1]
+                i += 2
+                continue
+            if arg.startswith("--format="):
+                output_format = arg.split("=", 1)[1]
+            else:
+                remaining.append(arg)
+            i += 1
+
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unknown format '{output_format}' (choose from {', '.join(OUTPUT_FORMATS)})"
+            )
+        if output_format not in cls.SUPPORTED_FORMATS:
+            raise ValueError(f"This command does not support --format {output_format}")
+
+        command = cls(remaining)
+        command.output_format = output_format
+        return command
+
+    def wants_records(self) -> bool:
+        """Check whether output should be structured records instead of text"""
+        return self.output_format != "text"
+
+    def record_writer(self, fields: List[str], single: bool = False) -> "RecordWriter":
+        """
+        Create a writer emitting records to stdout in the selected format
+
+        Args:
+            fields: Column order for tsv output
+            single: The command emits exactly one record (json prints the
+                    object itself instead of a list)
+        """
+        return RecordWriter(self.output_format, fields, single=single)
+
     @abstractmethod
     def execute(self) -> int:
         """
@@ -28,6 +110,87 @@ class Command(ABC):
         """
         pass
 
+    def bind(self, config: "JenkinsConfig", transport: "Transport") -> "Command":
+        """
+        Use a given config and transport instead of the session's
+
+        Commands already share the process-wide `JenkinsSession`; binding is
+        for callers that manage their own config or transport (e.g. tests).
+
+        Returns:
+            The command itself
+        """
+        self._config = config
+        self._transport = transport
+        return self
+
+    def load_config(self) -> "JenkinsConfig":
+        """Get the bound config, or the session's (loaded from ~/.jenkins-inspector/.env)"""
+        if self._config is not None:
+            return self._config
+        return get_session().config
+
+    def open_transport(self, config: "JenkinsConfig") -> "Transport":
+        """Get the bound transport, or the session's transport for the config"""
+        if self._transport is not None:
+            return self._transport
+        return get_session().transport(config)
+
+
+class RecordWriter:
+    """
+    Write records (dicts) to a stream as json, ndjson or tsv
+
+    Records are written as they are produced, so large listings never have to
+    be held in memory: json streams the array element by element, ndjson writes
+    one object per line and tsv one row per line after a header row.
+    """
+
+    def __init__(self, output_format: str, fields: List[str], stream=None, single: bool = False):
+        self.output_format = output_format
+        self.fields = fields
+        self.stream = stream if stream is not None else sys.stdout
+        self.single = single
+        self.count = 0
+
+    def write(self, record: dict) -> None:
+        """Write one record"""
+        if self.output_format == "ndjson":
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        elif self.output_format == "tsv":
+            if self.count == 0:
+                self.stream.write("\t".join(self.fields) + "\n")
+            values = [self._tsv_value(record.get(field)) for field in self.fields]
+            self.stream.write("\t".join(values) + "\n")
+        elif self.single:
+            self.stream.write(json.dumps(record, ensure_ascii=False, indent=2) + "\n")
+        else:
+            prefix = "[\n  " if self.count == 0 else ",\n  "
+            self.stream.write(prefix + json.dumps(record, ensure_ascii=False))
+        self.count += 1
+        self.stream.flush()
+
+    def close(self) -> None:
+        """Finish the output (closes the json array)"""
+        if self.output_format == "json" and not self.single:
+            self.stream.write("[]\n" if self.count == 0 else "\n]\n")
+        elif self.output_format == "tsv" and self.count == 0:
+            self.stream.write("\t".join(self.fields) + "\n")
+        self.stream.flush()
+
+    @staticmethod
+    def _tsv_value(value) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, list):
+            value = ",".join(str(item) for item in value)
+        elif isinstance(value, dict):
+            value = json.dumps(value, ensure_ascii=False)
+        text = str(value)
+        return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
 
 class JenkinsConfig:
     """Manage Jenkins configuration"""
@@ -36,14 +199,27 @@ class JenkinsConfig:
         # Load .env from ~/.jenkins-inspector/ only.
         # If a legacy file exists at ~/.jenkins-studio/.env, we intentionally do NOT load it.
         legacy_env_path = Path.home() / ".jenkins-studio" / ".env"
-        env_path = Path.home() / ".jenkins-inspector" / ".env"
+        env_path = self.default_env_path()
+        from dotenv import load_dotenv
+
         load_dotenv(env_path, override=True)
         self.jenkins_url = os.getenv("JENKINS_URL")
         self.username = os.getenv("JENKINS_USER_ID")
         self.api_token = os.getenv("JENKINS_API_TOKEN")
+        self.cli_daemon = _env_flag("JENKINS_CLI_DAEMON")
+        self.cli_daemon_idle_timeout = int(os.getenv("JENKINS_CLI_DAEMON_IDLE", "600"))
+        self.transport = os.getenv("JENKINS_TRANSPORT", "auto").strip().lower()
+        self.cache_ttl = int(os.getenv("JENKINS_CACHE_TTL", "60"))
+        self.cache_max_bytes = int(os.getenv("JENKINS_CACHE_MAX_MB", "100")) * 1024 * 1024
+        self.credential_cache_ttl = int(os.getenv("JENKINS_CREDENTIAL_CACHE_TTL", "300"))
         self.env_path = env_path
         self.legacy_env_path = legacy_env_path
 
+    @staticmethod
+    def default_env_path() -> Path:
+        """Get the path of the .env file holding the configuration"""
+        return Path.home() / ".jenkins-inspector" / ".env"
+
     @property
     def jenkins_cli_jar_url(self) -> str:
         """Get Jenkins CLI JAR download URL"""
@@ -60,7 +236,79 @@ class JenkinsConfig:
         return ["-auth", f"{self.username}:{self.api_token}"]
 
 
-class JenkinsCLI:
+class Transport(ABC):
+    """
+    Interface for executing Jenkins CLI commands
+
+    Every transport follows the jenkins-cli.jar output contract: `run()` returns
+    a CompletedProcess with returncode/stdout/stderr as the jar would, so
+    commands do not need to know which backend served them.
+    """
+
+    @abstractmethod
+    def run(
+        self, command: str, *args: str, stdin_input: Optional[str] = None
+    ) -> subprocess.CompletedProcess:
+        """Run a Jenkins CLI command"""
+        pass
+
+    def supports(self, command: str, *args: str) -> bool:
+        """Check whether this transport can serve the given command"""
+        return True
+
+    def close(self) -> None:
+        """Release connections held by the transport"""
+        pass
+
+    def stream(self, command: str, *args: str, stdin_input: Optional[str] = None):
+        """
+        Run a Jenkins CLI command and iterate over its stdout line by line
+
+        The default implementation buffers the whole output with `run()`;
+        transports that can deliver output incrementally override it.
+
+        Returns:
+            StreamedOutput object
+        """
+
+        def produce(output):
+            result = self.run(command, *args, stdin_input=stdin_input)
+            output.returncode = result.returncode
+            output.stderr = result.stderr or ""
+            yield from (result.stdout or "").splitlines(keepends=True)
+
+        return StreamedOutput(produce)
+
+
+class StreamedOutput:
+    """
+    Line iterator over a command's stdout
+
+    `returncode` and `stderr` are available once iteration has finished. Call
+    `close()` (or use it as a context manager) to stop early; the underlying
+    process or connection is released.
+    """
+
+    def __init__(self, producer: Callable[["StreamedOutput"], Iterator[str]]):
+        self.returncode = None
+        self.stderr = ""
+        self._lines = producer(self)
+
+    def __iter__(self) -> Iterator[str]:
+        return self._lines
+
+    def __enter__(self) -> "StreamedOutput":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the stream and release its resources"""
+        self._lines.close()
+
+
+class JenkinsCLI(Transport):
     """Wrapper for jenkins-cli.jar"""
 
     def __init__(self, config: JenkinsConfig):
@@ -75,6 +323,8 @@ class JenkinsCLI:
         # Silent download
         self.jar_path.parent.mkdir(parents=True, exist_ok=True)
 
+        from urllib.request import urlretrieve
+
         try:
             urlretrieve(self.config.jenkins_cli_jar_url, self.jar_path)
         except Exception as e:
@@ -87,6 +337,10 @@ class JenkinsCLI:
         """
         Run a jenkins-cli command
 
+        When `JENKINS_CLI_DAEMON` is enabled the command is handed to the local
+        jenkins-cli daemon, falling back to a direct `java -jar` run if the
+        daemon cannot be reached.
+
         Args:
             command: Jenkins CLI command (e.g., 'whoami', 'list-jobs')
             *args: Additional arguments for the command
@@ -95,26 +349,905 @@ class JenkinsCLI:
         Returns:
             CompletedProcess object
         """
+        if self.config.cli_daemon:
+            from jenkins_tools.cli_daemon import run_via_daemon
+
+            result = run_via_daemon(self.config, [command, *args], stdin_input)
+            if result is not None:
+                return result
+
         self.ensure_cli_jar()
+        cmd = self._build_command(command, args)
+        return subprocess.run(cmd, input=stdin_input, capture_output=True, text=True)
 
-        cmd = [
-            "java",
-            "-jar",
-            str(self.jar_path),
-            "-s",
-            self.config.jenkins_url,
-        ]
+    def stream(self, command: str, *args: str, stdin_input: Optional[str] = None):
+        """
+        Run a jenkins-cli command and iterate over its stdout as it is produced
+
+        Returns:
+            StreamedOutput object
+        """
+        if self.config.cli_daemon:
+            return super().stream(command, *args, stdin_input=stdin_input)
+
+        def produce(output):
+            self.ensure_cli_jar()
+            proc = subprocess.Popen(
+                self._build_command(command, args),
+                stdin=subprocess.PIPE if stdin_input is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+
+            # Feed stdin and drain stderr in the background so the pipes never block
+            stderr_chunks = []
+            threads = [threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()))]
+            if stdin_input is not None:
+                threads.append(threading.Thread(target=self._feed, args=(proc, stdin_input)))
+            for thread in threads:
+                thread.start()
+
+            try:
+                yield from proc.stdout
+                proc.wait()
+            finally:
+                if proc.returncode is None:
+                    proc.kill()
+                    proc.wait()
+                for thread in threads:
+                    thread.join()
+                output.returncode = proc.returncode
+                output.stderr = "".join(stderr_chunks)
+
+        return StreamedOutput(produce)
+
+    @staticmethod
+    def _feed(proc: subprocess.Popen, stdin_input: str) -> None:
+        try:
+            proc.stdin.write(stdin_input)
+            proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+    def _build_command(self, command: str, args) -> List[str]:
+        """Build the full java command line"""
+        cmd = ["java", "-jar", str(self.jar_path)] + self.get_server_args()
+
+        # Add the command and its arguments
+        cmd.append(command)
+        cmd.extend(args)
+        return cmd
+
+    def get_server_args(self) -> list[str]:
+        """Get server and authentication arguments for jenkins-cli"""
+        server_args = ["-s", self.config.jenkins_url]
 
         # Add authentication if configured
         auth_args = self.config.get_auth_args()
         if auth_args:
-            cmd.append("-http")
-            cmd.extend(auth_args)
+            server_args.append("-http")
+            server_args.extend(auth_args)
         else:
-            cmd.append("-webSocket")
+            server_args.append("-webSocket")
 
-        # Add the command and its arguments
-        cmd.append(command)
-        cmd.extend(args)
+        return server_args
 
-        return subprocess.run(cmd, input=stdin_input, capture_output=True, text=True)
+
+class JenkinsHTTP(Transport):
+    """
+    Pure-Python backend serving CLI commands from plain Jenkins HTTP endpoints
+
+    Requests share a small pool of keep-alive connections and authenticate with
+    JENKINS_USER_ID/JENKINS_API_TOKEN via HTTP basic auth. Only commands that map
+    onto REST endpoints are supported; see `supports()`.
+    """
+
+    SUPPORTED_COMMANDS = {
+        "who-am-i",
+        "list-jobs",
+        "get-job",
+        "console",
+        "copy-job",
+        "update-job",
+        "build",
+        "disable-job",
+        "enable-job",
+        "delete-job",
+        "stop-builds",
+        "add-job-to-view",
+    }
+
+    def __init__(self, config: JenkinsConfig, pool_size: int = HTTP_POOL_SIZE):
+        self.config = config
+        url = urlsplit(config.jenkins_url or "")
+        self.scheme = url.scheme or "http"
+        self.host = url.hostname or ""
+        self.port = url.port
+        self.base_path = url.path.rstrip("/")
+        self.pool = queue.LifoQueue(maxsize=pool_size)
+        self.crumb = None
+        self.identity = None
+
+        self.headers = {"Connection": "keep-alive"}
+        if config.is_configured():
+            token = f"{config.username}:{config.api_token}".encode("utf-8")
+            self.headers["Authorization"] = "Basic " + base64.b64encode(token).decode("ascii")
+
+    def supports(self, command: str, *args: str) -> bool:
+        """Check whether the command maps onto plain HTTP endpoints"""
+        if command not in self.SUPPORTED_COMMANDS:
+            return False
+        if command == "console":
+            # Follow (-f) and tail (-n) modes need the jar
+            return 1 <= len(args) <= 2 and not any(arg.startswith("-") for arg in args)
+        if command == "build":
+            # Waiting for completion (-s/-f/-v/-w) needs the jar
+            return all(arg not in ("-s", "-f", "-v", "-w", "-c") for arg in args)
+        return True
+
+    def streams(self, command: str, *args: str) -> bool:
+        """Check whether `stream()` can serve the command incrementally over HTTP"""
+        return command == "groovy" and list(args) == ["="]
+
+    def stream(self, command: str, *args: str, stdin_input: Optional[str] = None):
+        """
+        Stream a command's output over HTTP
+
+        `groovy =` is served by POSTing the script to /scriptText and reading the
+        response line by line; other commands use the buffered default.
+
+        Returns:
+            StreamedOutput object
+        """
+        if not self.streams(command, *args):
+            return super().stream(command, *args, stdin_input=stdin_input)
+
+        body = urlencode({"script": stdin_input or ""}).encode("utf-8")
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        return self.stream_lines("POST", "/scriptText", body, headers)
+
+    def stream_lines(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> StreamedOutput:
+        """
+        Iterate over an HTTP response body line by line
+
+        Returns:
+            StreamedOutput object; returncode is 0 for a fully read 200 response
+        """
+
+        import http.client
+
+        def produce(output):
+            try:
+                conn, response = self.open_response(method, path, body, headers)
+            except (OSError, http.client.HTTPException) as e:
+                output.returncode, output.stderr = 1, f"ERROR: {e}\n"
+                return
+
+            complete = False
+            try:
+                if response.status != 200:
+                    data = response.read()
+                    output.stderr = f"ERROR: HTTP {response.status}\n" + data.decode(
+                        "utf-8", errors="replace"
+                    )
+                    output.returncode = 3 if response.status == 404 else 1
+                    complete = True
+                    return
+
+                for raw in response:
+                    yield raw.decode("utf-8", errors="replace")
+                complete = True
+                output.returncode = 0
+            finally:
+                if complete:
+                    self.release(conn, response)
+                else:
+                    conn.close()
+                    if output.returncode is None:
+                        output.returncode = 1
+
+        return StreamedOutput(produce)
+
+    def _new_connection(self) -> "http.client.HTTPConnection":
+        import http.client
+
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=HTTP_TIMEOUT)
+        return http.client.HTTPConnection(self.host, self.port, timeout=HTTP_TIMEOUT)
+
+    def _checkout(self) -> "http.client.HTTPConnection":
+        """Borrow a keep-alive connection from the pool"""
+        try:
+            return self.pool.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def release(self, conn: "http.client.HTTPConnection", response) -> None:
+        """Return a connection to the pool once its response has been fully read"""
+        if not response.isclosed() or response.will_close:
+            conn.close()
+            return
+        try:
+            self.pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        while not self.pool.empty():
+            self.pool.get_nowait().close()
+
+    def open_response(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple["http.client.HTTPConnection", "http.client.HTTPResponse"]:
+        """
+        Send an HTTP request relative to JENKINS_URL without reading the body
+
+        The caller must read the response and pass both objects to `release()`.
+
+        Args:
+            method: HTTP method
+            path: Path starting with '/', relative to the Jenkins root
+            body: Optional request body
+            headers: Optional extra headers
+
+        Returns:
+            Tuple of (connection, response)
+        """
+        import http.client
+
+        request_headers = dict(self.headers)
+        if method == "POST":
+            request_headers.update(self._get_crumb())
+        if headers:
+            request_headers.update(headers)
+
+        for attempt in range(2):
+            conn = self._checkout()
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=request_headers)
+                return conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # Stale keep-alive connection; retry once on a fresh one
+                conn.close()
+                if attempt > 0:
+                    raise
+            except Exception:
+                conn.close()
+                raise
+        raise ConnectionError("unreachable")
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send an HTTP request relative to JENKINS_URL
+
+        Args:
+            method: HTTP method
+            path: Path starting with '/', relative to the Jenkins root
+            body: Optional request body
+            headers: Optional extra headers
+
+        Returns:
+            Tuple of (status, response headers, response body)
+        """
+        crumb = self.crumb
+        conn, response = self.open_response(method, path, body, headers)
+        try:
+            data = response.read()
+        finally:
+            self.release(conn, response)
+
+        if response.status == 403 and method == "POST" and crumb and b"crumb" in data.lower():
+            # Crumbs can expire in long-lived sessions; fetch a new one and retry once
+            if self.crumb == crumb:
+                self.crumb = None
+            conn, response = self.open_response(method, path, body, headers)
+            try:
+                data = response.read()
+            finally:
+                self.release(conn, response)
+        return response.status, dict(response.getheaders()), data
+
+    def whoami(self) -> Tuple[int, Optional[dict]]:
+        """
+        Get the authenticated identity (`name`, `authorities`) from /whoAmI
+
+        A successful answer is kept for the lifetime of the transport.
+
+        Returns:
+            Tuple of (status, identity or None)
+        """
+        if self.identity is None:
+            status, data = self.get_json("/whoAmI")
+            if status != 200:
+                return status, None
+            self.identity = data
+        return 200, self.identity
+
+    def _get_crumb(self) -> Dict[str, str]:
+        """Fetch the CSRF crumb once; servers without a crumb issuer get {}"""
+        if self.crumb is None:
+            self.crumb = {}
+            status, _, data = self.request("GET", "/crumbIssuer/api/json")
+            if status == 200:
+                crumb = json.loads(data)
+                self.crumb = {crumb["crumbRequestField"]: crumb["crumb"]}
+        return self.crumb
+
+    @staticmethod
+    def item_path(full_name: str) -> str:
+        """Convert an item full name ('folder/job') to its URL path"""
+        parts = [part for part in full_name.split("/") if part]
+        return "".join(f"/job/{quote(part, safe='')}" for part in parts)
+
+    def get_job_config(self, job_name: str) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        GET a job's config.xml
+
+        Returns:
+            Tuple of (status, response headers, body)
+        """
+        return self.request("GET", f"{self.item_path(job_name)}/config.xml")
+
+    def read_progressive_text(
+        self, job_name: str, build: str, start: int, write: Callable[[bytes], None]
+    ) -> Tuple[int, int, bool]:
+        """
+        Read a build's console log from a byte offset via logText/progressiveText
+
+        The body is handed to `write` in fixed-size chunks as it arrives, so
+        memory use does not grow with the size of the log. If the read fails
+        midway, resume from `start` plus the length of the chunks already
+        written; the offset returned below is only known once the read ends.
+
+        Args:
+            job_name: Job full name
+            build: Build number or permalink (e.g. 'lastBuild')
+            start: Byte offset to start from
+            write: Callback receiving each chunk of the log
+
+        Returns:
+            Tuple of (status, offset to resume from, whether more data is expected
+            because the build is still running)
+        """
+        path = (
+            f"{self.item_path(job_name)}/{quote(build, safe='')}"
+            f"/logText/progressiveText?start={start}"
+        )
+        import http.client
+
+        conn, response = self.open_response("GET", path)
+        complete = False
+        try:
+            if response.status != 200:
+                response.read()
+                complete = True
+                return response.status, start, False
+
+            received = 0
+            while True:
+                chunk = response.read(HTTP_READ_SIZE)
+                if not chunk:
+                    break
+                received += len(chunk)
+                write(chunk)
+
+            # Partial reads end quietly when the server hangs up early
+            expected = response.getheader("Content-Length")
+            if expected and received < int(expected):
+                raise http.client.IncompleteRead(b"", int(expected) - received)
+            complete = True
+        finally:
+            if complete:
+                self.release(conn, response)
+            else:
+                conn.close()
+
+        next_start = int(response.getheader("X-Text-Size") or start)
+        more_data = (response.getheader("X-More-Data") or "").lower() == "true"
+        return response.status, next_start, more_data
+
+    def get_json(self, path: str, tree: Optional[str] = None) -> Tuple[int, Optional[dict]]:
+        """GET a `/api/json` document, optionally filtered with `tree`"""
+        query = f"?tree={quote(tree, safe='[],{}')}" if tree else ""
+        status, _, data = self.request("GET", f"{path}/api/json{query}")
+        if status != 200:
+            return status, None
+        return status, json.loads(data)
+
+    def run(
+        self, command: str, *args: str, stdin_input: Optional[str] = None
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a Jenkins CLI command over HTTP
+
+        Args:
+            command: Jenkins CLI command (e.g., 'get-job', 'list-jobs')
+            *args: Additional arguments for the command
+            stdin_input: Optional input, used as the request body where the CLI reads stdin
+
+        Returns:
+            CompletedProcess object mimicking jenkins-cli.jar output
+        """
+        argv = [command, *args]
+        if not self.supports(command, *args):
+            return self._result(argv, 1, "", f"ERROR: '{command}' is not supported over HTTP")
+
+        import http.client
+
+        handler = getattr(self, "_" + command.replace("-", "_"))
+        try:
+            return handler(argv, list(args), stdin_input)
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            return self._result(argv, 1, "", f"ERROR: {e}")
+
+    @staticmethod
+    def _result(argv: List[str], returncode: int, stdout: str, stderr: str = ""):
+        return subprocess.CompletedProcess(argv, returncode, stdout=stdout, stderr=stderr)
+
+    def _error(self, argv: List[str], status: int, data: bytes, not_found: str):
+        """Map an HTTP error status onto the CLI error contract"""
+        if status == 404:
+            return self._result(argv, 3, "", f"ERROR: {not_found}\n")
+        message = data.decode("utf-8", errors="replace").strip()
+        return self._result(argv, 1, "", f"ERROR: HTTP {status}\n{message}\n")
+
+    def _who_am_i(self, argv, args, stdin_input):
+        status, data = self.whoami()
+        if status != 200:
+            return self._error(argv, status, b"", "Failed to query /whoAmI")
+        lines = [f"Authenticated as: {data.get('name')}", "Authorities:"]
+        lines.extend(f"  {authority}" for authority in data.get("authorities", []))
+        return self._result(argv, 0, "\n".join(lines) + "\n")
+
+    def _list_jobs(self, argv, args, stdin_input):
+        if args:
+            name = args[0]
+            status, data = self.get_json(f"/view/{quote(name, safe='')}", tree="jobs[name]")
+            if status == 404:
+                status, data = self.get_json(self.item_path(name), tree="jobs[name]")
+            if status != 200 or data is None or "jobs" not in data:
+                return self._error(
+                    argv, 404, b"", f"No view or item group with the given name '{name}' found"
+                )
+        else:
+            status, data = self.get_json("", tree="jobs[name]")
+            if status != 200:
+                return self._error(argv, status, b"", "Failed to list jobs")
+
+        names = [job["name"] for job in data.get("jobs", [])]
+        return self._result(argv, 0, "".join(f"{name}\n" for name in names))
+
+    def _get_job(self, argv, args, stdin_input):
+        job_name = args[0]
+        status, _, data = self.get_job_config(job_name)
+        if status != 200:
+            return self._error(argv, status, data, f"No such job '{job_name}'")
+        return self._result(argv, 0, data.decode("utf-8"))
+
+    def _console(self, argv, args, stdin_input):
+        job_name = args[0]
+        build = args[1] if len(args) > 1 else "lastBuild"
+        path = f"{self.item_path(job_name)}/{quote(build, safe='')}/consoleText"
+        status, _, data = self.request("GET", path)
+        if status != 200:
+            return self._error(argv, status, data, f"No such job '{job_name}' or build {build}")
+        return self._result(argv, 0, data.decode("utf-8", errors="replace"))
+
+    def _copy_job(self, argv, args, stdin_input):
+        source, dest = args[0], args[1]
+        parent, _, leaf = dest.rstrip("/").rpartition("/")
+        query = urlencode({"name": leaf, "mode": "copy", "from": "/" + source.strip("/")})
+        status, _, data = self.request("POST", f"{self.item_path(parent)}/createItem?{query}")
+        if status >= 400:
+            return self._error(argv, status, data, f"No such job '{source}'")
+        return self._result(argv, 0, "")
+
+    def _update_job(self, argv, args, stdin_input):
+        job_name = args[0]
+        status, _, data = self.request(
+            "POST",
+            f"{self.item_path(job_name)}/config.xml",
+            body=(stdin_input or "").encode("utf-8"),
+            headers={"Content-Type": "application/xml; charset=UTF-8"},
+        )
+        if status >= 400:
+            return self._error(argv, status, data, f"No such job '{job_name}'")
+        return self._result(argv, 0, "")
+
+    def trigger_build(
+        self, job_name: str, params: List[Tuple[str, str]]
+    ) -> Tuple[int, Optional[int], bytes]:
+        """
+        Queue a build, with parameters if given
+
+        Returns:
+            Tuple of (status, queue item ID from the Location header or None,
+            response body)
+        """
+        job_path = self.item_path(job_name)
+        if params:
+            status, headers, data = self.request(
+                "POST",
+                f"{job_path}/buildWithParameters",
+                body=urlencode(params).encode("utf-8"),
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+        else:
+            status, headers, data = self.request("POST", f"{job_path}/build")
+            if status == 400:
+                # Parameterized job: trigger with default parameter values
+                status, headers, data = self.request("POST", f"{job_path}/buildWithParameters")
+
+        location = next((v for k, v in headers.items() if k.lower() == "location"), "")
+        match = re.search(r"/queue/item/(\d+)/?$", location)
+        return status, int(match.group(1)) if match else None, data
+
+    def _build(self, argv, args, stdin_input):
+        job_name = args[0]
+        params = []
+        i = 1
+        while i < len(args):
+            if args[i] == "-p" and i + 1 < len(args):
+                key, _, value = args[i + 1].partition("=")
+                params.append((key, value))
+                i += 2
+            else:
+                i += 1
+
+        status, queue_id, data = self.trigger_build(job_name, params)
+        if status >= 400:
+            return self._error(argv, status, data, f"No such job '{job_name}'")
+        return self._result(argv, 0, "")
+
+    def _post_each(self, argv, job_names: List[str], action: str):
+        """POST `action` on each job, stopping at the first failure"""
+        for job_name in job_names:
+            status, _, data = self.request("POST", f"{self.item_path(job_name)}/{action}")
+            if status >= 400:
+                return self._error(argv, status, data, f"No such job '{job_name}'")
+        return self._result(argv, 0, "")
+
+    def _disable_job(self, argv, args, stdin_input):
+        return self._post_each(argv, args, "disable")
+
+    def _enable_job(self, argv, args, stdin_input):
+        return self._post_each(argv, args, "enable")
+
+    def _delete_job(self, argv, args, stdin_input):
+        return self._post_each(argv, args, "doDelete")
+
+    def _stop_builds(self, argv, args, stdin_input):
+        failures = []
+        for job_name in args:
+            job_path = self.item_path(job_name)
+            status, data = self.get_json(job_path, tree="builds[number,building]")
+            if status != 200:
+                return self._error(argv, status, b"", f"No such job '{job_name}'")
+            for build in data.get("builds", []):
+                if not build.get("building"):
+                    continue
+                status, _, _ = self.request("POST", f"{job_path}/{build['number']}/stop")
+                if status >= 400:
+                    failures.append(
+                        f"ERROR: Failed to stop {job_name} #{build['number']}: HTTP {status}\n"
+                    )
+        if failures:
+            return self._result(argv, 1, "", "".join(failures))
+        return self._result(argv, 0, "")
+
+    def _add_job_to_view(self, argv, args, stdin_input):
+        view_name, job_names = args[0], args[1:]
+        view_path = f"/view/{quote(view_name, safe='')}"
+        for job_name in job_names:
+            query = urlencode({"name": job_name})
+            status, _, data = self.request("POST", f"{view_path}/addJobToView?{query}")
+            if status >= 400:
+                return self._error(argv, status, data, f"No view named {view_name} exists")
+        return self._result(argv, 0, "")
+
+
+class AutoTransport(Transport):
+    """Serve commands over HTTP when possible, fall back to jenkins-cli.jar otherwise"""
+
+    def __init__(self, config: JenkinsConfig):
+        self.config = config
+        self.http = JenkinsHTTP(config)
+        self.cli = JenkinsCLI(config)
+
+    def run(
+        self, command: str, *args: str, stdin_input: Optional[str] = None
+    ) -> subprocess.CompletedProcess:
+        """Run a command on the HTTP backend if it supports it, else on the jar"""
+        if self.http.supports(command, *args):
+            return self.http.run(command, *args, stdin_input=stdin_input)
+        return self.cli.run(command, *args, stdin_input=stdin_input)
+
+    def stream(self, command: str, *args: str, stdin_input: Optional[str] = None):
+        """Stream a command from the HTTP backend if it can serve it, else from the jar"""
+        if self.http.supports(command, *args) or self.http.streams(command, *args):
+            return self.http.stream(command, *args, stdin_input=stdin_input)
+        return self.cli.stream(command, *args, stdin_input=stdin_input)
+
+    def close(self) -> None:
+        """Close the HTTP backend's pooled connections"""
+        self.http.close()
+
+
+def get_http_backend(transport: Transport) -> Optional[JenkinsHTTP]:
+    """Get the HTTP backend behind a transport, or None for jar-only transports"""
+    if isinstance(transport, JenkinsHTTP):
+        return transport
+    if isinstance(transport, AutoTransport):
+        return transport.http
+    return None
+
+
+def open_transport(config: JenkinsConfig) -> Transport:
+    """
+    Create the transport selected by JENKINS_TRANSPORT
+
+    Args:
+        config: Jenkins configuration
+
+    Returns:
+        AutoTransport for 'auto' (default), JenkinsHTTP for 'http',
+        JenkinsCLI for 'cli'
+    """
+    if config.transport == "http":
+        return JenkinsHTTP(config)
+    if config.transport == "cli":
+        return JenkinsCLI(config)
+    return AutoTransport(config)
+
+
+class JenkinsSession:
+    """
+    Process-wide config and transport shared by every command
+
+    Commands run in one process (`batch`, library use, tests) parse `.env`
+    once and share one transport: one HTTP connection pool, one CSRF crumb
+    and one authenticated identity. The config is re-read when `.env` changes
+    on disk; the transport, which holds the old URL and credentials, is then
+    closed and reopened on next use. Transports opened for other configs
+    (e.g. one loaded before a reload) are kept per config and closed with the
+    session.
+
+    Callbacks registered with `on()` receive the session:
+        open:   a transport was opened
+        reload: `.env` changed and the config was re-read
+        close:  the transport is about to be closed
+    """
+
+    EVENTS = ("open", "reload", "close")
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.hooks = {event: [] for event in self.EVENTS}
+        self._config = None
+        self._env_stamp = None
+        self._transport = None
+        self._config_transports = {}  # Other config -> its own transport
+
+    def __enter__(self) -> "JenkinsSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def on(self, event: str, callback: Callable[["JenkinsSession"], None]) -> None:
+        """
+        Register a lifecycle callback
+
+        Raises:
+            ValueError: If the event is unknown
+        """
+        if event not in self.hooks:
+            raise ValueError(
+                f"Unknown session event '{event}' (choose from {', '.join(self.EVENTS)})"
+            )
+        self.hooks[event].append(callback)
+
+    @property
+    def config(self) -> JenkinsConfig:
+        """Get the config, re-reading it if `.env` changed since it was loaded"""
+        with self.lock:
+            stamp = self._stat_env()
+            if self._config is not None and stamp == self._env_stamp:
+                return self._config
+
+            reload = self._config is not None
+            if reload:
+                self._close_transport()
+            self._env_stamp = stamp
+            self._config = JenkinsConfig()
+            if reload:
+                self._fire("reload")
+            return self._config
+
+    def transport(self, config: Optional[JenkinsConfig] = None) -> Transport:
+        """
+        Get the shared transport, opening it on first use
+
+        Args:
+            config: Config the caller loaded; a config other than the session's
+                    current one gets a transport of its own, reused for that
+                    config and closed by `close()`
+        """
+        with self.lock:
+            current = self.config
+            if config is not None and config is not current:
+                if config not in self._config_transports:
+                    self._config_transports[config] = open_transport(config)
+                return self._config_transports[config]
+            if self._transport is None:
+                self._transport = open_transport(current)
+                self._fire("open")
+            return self._transport
+
+    def identity(self) -> Optional[dict]:
+        """Get the authenticated identity (`name`, `authorities`), or None over the jar"""
+        http = get_http_backend(self.transport())
+        if http is None:
+            return None
+        return http.whoami()[1]
+
+    def close(self) -> None:
+        """Close every transport; the next command opens a new one"""
+        with self.lock:
+            self._close_transport()
+            transports, self._config_transports = self._config_transports, {}
+        for transport in transports.values():
+            transport.close()
+
+    def _close_transport(self) -> None:
+        if self._transport is not None:
+            self._fire("close")
+            self._transport.close()
+            self._transport = None
+
+    def _fire(self, event: str) -> None:
+        for callback in self.hooks[event]:
+            callback(self)
+
+    @staticmethod
+    def _stat_env() -> Optional[Tuple[int, int]]:
+        """Get the modification time and size of `.env`, or None if it is missing"""
+        try:
+            stat = JenkinsConfig.default_env_path().stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> JenkinsSession:
+    """Get the process-wide session, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = JenkinsSession()
+        return _session
+
+
+def close_session() -> None:
+    """Close the process-wide session; the next `get_session()` starts a new one"""
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
+
+
+class RateLimiter:
+    """Space out calls so that at most `rate` of them start per second"""
+
+    def __init__(self, rate: float = 0.0):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_start = 0.0
+
+    def wait(self) -> None:
+        """Block until the next call is allowed to start"""
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def fan_out(
+    func: Callable[[T], R], items: Iterable[T], parallel: int = 1, rate: float = 0.0
+) -> Iterator[Tuple[T, R]]:
+    """
+    Apply `func` to every item with bounded concurrency
+
+    Args:
+        func: Function to call for each item
+        items: Items to process
+        parallel: Maximum number of concurrent calls
+        rate: Maximum number of calls started per second (0 for unlimited)
+
+    Yields:
+        (item, result) pairs in input order, as soon as each one is available
+    """
+    items = list(items)
+    limiter = RateLimiter(rate)
+
+    def call(item: T) -> R:
+        limiter.wait()
+        return func(item)
+
+    if parallel <= 1 or len(items) <= 1:
+        for item in items:
+            yield item, call(item)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(parallel, len(items))) as executor:
+        yield from zip(items, executor.map(call, items))
+
+
+def parse_fan_out_options(args: List[str]) -> Tuple[List[str], int, float]:
+    """
+    Split `--parallel N` and `--rate R` off an argument list
+
+    Args:
+        args: Command arguments
+
+    Returns:
+        Tuple of (remaining args, parallel, rate)
+
+    Raises:
+        ValueError: If an option value is missing or invalid
+    """
+    remaining = []
+    parallel = 1
+    rate = 0.0
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ("--parallel", "--rate"):
+            if i + 1 >= len(args):
+                raise ValueError(f"Missing value for {arg}")
+            value = args[i + 1]
+            try:
+                if arg == "--parallel":
+                    parallel = int(value)
+                else:
+                    rate = float(value)
+            except ValueError:
+                raise ValueError(f"Invalid value for {arg}: '{value}'")
+            if parallel < 1 or rate < 0:
+                raise ValueError(f"Invalid value for {arg}: '{value}'")
+            i += 2
+        else:
+            remaining.append(arg)
+            i += 1
+
+    return remaining, parallel, rate
@@ -31,6 +31,19 @@ class CredentialDescriber(ABC):
         """
         pass
 
+    def get_secret_fragment(self) -> Optional[str]:
+        """
+        Groovy statements printing the secret of `cred`, a credential of this type
+
+        Used to assemble the bulk retrieval script (see `bulk_secrets`), so
+        the credential store is looked up once for any number of credentials.
+        The printed lines must be understood by `parse_secret_output`.
+
+        Returns:
+            Groovy code, or None if secret retrieval is not supported
+        """
+        return None
+
     @abstractmethod
     def parse_secret_output(self, output: str) -> Dict[str, Any]:
         """
@@ -55,6 +68,34 @@ class CredentialDescriber(ABC):
         """
         pass
 
+    def get_details(self, cred_elem: ET.Element) -> Dict[str, Any]:
+        """
+        Get credential-specific metadata as a dictionary
+
+        Used for structured (--format) output. The default implementation
+        collects the element's fields, skipping the common id/scope/description
+        and any value Jenkins has redacted.
+
+        Args:
+            cred_elem: XML element containing credential metadata
+
+        Returns:
+            Dictionary of field name to text (nested elements become dictionaries)
+        """
+        details = {}
+        for child in cred_elem:
+            if child.tag in ("id", "scope", "description"):
+                continue
+            if child.find("secret-redacted") is not None:
+                continue
+            if len(child):
+                nested = self.get_details(child)
+                if nested:
+                    details[child.tag] = nested
+            elif child.text and child.text.strip():
+                details[child.tag] = child.text.strip()
+        return details
+
     def _get_xml_text(self, elem: ET.Element, path: str, default: str = "") -> str:
         """
         Helper method to safely get text from XML element
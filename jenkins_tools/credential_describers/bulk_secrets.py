@@ -0,0 +1,99 @@
+"""Bulk secret retrieval for credential describers"""
+
+import base64
+import secrets
+from typing import Dict, Iterable
+
+from jenkins_tools.credential_describers.base import CredentialDescriber
+from jenkins_tools.groovy_scripts import groovy_string
+
+# Frame marker for single-credential scripts, whose output needs no splitting
+SINGLE_MARKER = "@@SECRET"
+
+
+def build_secrets_script(
+    credential_ids: Iterable[str],
+    describers: Dict[str, CredentialDescriber],
+    marker: str,
+) -> str:
+    """
+    Build one Groovy script returning the secrets of many credentials
+
+    The script looks the credentials up once, indexes them by ID on the server
+    and prints each requested credential's secret between
+    `<marker> BEGIN <base64 id>` and `<marker> END <base64 id>` lines, using
+    the describer fragment registered for its type.
+
+    Args:
+        credential_ids: IDs to retrieve; only these secrets leave the server
+        describers: Credential type -> describer
+        marker: Unique frame marker (see `new_marker()`)
+
+    Returns:
+        Groovy script string
+    """
+    # One if-block per type, so each fragment gets its own variable scope
+    branches = []
+    for cred_type, describer in describers.items():
+        fragment = describer.get_secret_fragment()
+        if fragment:
+            branches.append(f"if (type == '{cred_type}') {{\n{fragment.strip(chr(10))}\n    }}")
+    dispatch = " else ".join(branches) if branches else "// No describer supports secrets"
+
+    ids = "[" + ", ".join(groovy_string(cred_id) for cred_id in credential_ids) + "]"
+
+    return f"""
+def allCreds = com.cloudbees.plugins.credentials.CredentialsProvider.lookupCredentials(
+    com.cloudbees.plugins.credentials.Credentials.class,
+    jenkins.model.Jenkins.instance
+)
+
+def byId = [:]
+allCreds.each {{ c ->
+    if (c.hasProperty('id') && !byId.containsKey(c.id)) {{
+        byId[c.id] = c
+    }}
+}}
+
+{ids}.each {{ credId ->
+    def cred = byId[credId]
+    if (cred == null) {{
+        return
+    }}
+    def frameId = credId.getBytes('UTF-8').encodeBase64().toString()
+    println "{marker} BEGIN " + frameId
+    def type = cred.class.simpleName
+    {dispatch}
+    println "{marker} END " + frameId
+}}
+"""
+
+
+def new_marker() -> str:
+    """Create a frame marker that cannot collide with secret content"""
+    return "@@SECRETS-" + secrets.token_hex(8)
+
+
+def split_secret_output(output: str, marker: str) -> Dict[str, str]:
+    """
+    Split the bulk script output into one slice per credential
+
+    Returns:
+        Credential ID -> that credential's output, to be passed to its
+        describer's `parse_secret_output`
+    """
+    slices = {}
+    current_id = None
+    lines = []
+
+    for line in output.splitlines():
+        if line.startswith(f"{marker} BEGIN "):
+            current_id = base64.b64decode(line.split(" ", 2)[2]).decode("utf-8")
+            lines = []
+        elif line.startswith(f"{marker} END ") and current_id is not None:
+            slices[current_id] = "\n".join(lines)
+            current_id = None
+        elif current_id is not None:
+            lines.append(line)
+
+    return slices
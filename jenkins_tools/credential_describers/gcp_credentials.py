@@ -4,6 +4,7 @@ from typing import Optional, Dict, Any
 import xml.etree.ElementTree as ET
 
 from jenkins_tools.credential_describers.base import CredentialDescriber
+from jenkins_tools.credential_describers.bulk_secrets import SINGLE_MARKER, build_secrets_script
 
 
 class GCPCredentialsDescriber(CredentialDescriber):
@@ -12,39 +13,26 @@ class GCPCredentialsDescriber(CredentialDescriber):
     def get_credential_type(self) -> str:
         return "GoogleRobotPrivateKeyCredentials"
 
-    def get_groovy_script(self, credential_id: str) -> Optional[str]:
-        return f"""
-import com.google.jenkins.plugins.credentials.oauth.*
-
-def credId = '{credential_id}'
-def cred = null
-
-def allCreds = com.cloudbees.plugins.credentials.CredentialsProvider.lookupCredentials(
-    com.cloudbees.plugins.credentials.Credentials.class,
-    jenkins.model.Jenkins.instance
-)
-
-allCreds.each {{ c ->
-    if (c.id == credId) {{
-        cred = c
-    }}
-}}
-
-if (cred != null && cred instanceof GoogleRobotPrivateKeyCredentials) {{
-    println "PROJECT_ID:${{cred.projectId}}"
-    def config = cred.serviceAccountConfig
-    if (config != null) {{
-        def secretKey = config.secretJsonKey
-        if (secretKey != null) {{
-            def keyContent = new String(secretKey.plainData)
-            println "SERVICE_ACCOUNT_KEY_START"
-            println keyContent
-            println "SERVICE_ACCOUNT_KEY_END"
-        }}
-    }}
-}}
+    def get_secret_fragment(self) -> Optional[str]:
+        return """
+        println "PROJECT_ID:${cred.projectId}"
+        def config = cred.serviceAccountConfig
+        if (config != null) {
+            def secretKey = config.secretJsonKey
+            if (secretKey != null) {
+                def keyContent = new String(secretKey.plainData)
+                println "SERVICE_ACCOUNT_KEY_START"
+                println keyContent
+                println "SERVICE_ACCOUNT_KEY_END"
+            }
+        }
 """
 
+    def get_groovy_script(self, credential_id: str) -> Optional[str]:
+        return build_secrets_script(
+            [credential_id], {"GoogleRobotPrivateKeyCredentials": self}, SINGLE_MARKER
+        )
+
     def parse_secret_output(self, output: str) -> Dict[str, Any]:
         lines = output.strip().split("\n")
         secret_data = {}
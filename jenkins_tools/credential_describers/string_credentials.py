@@ -4,6 +4,7 @@ from typing import Optional, Dict, Any
 import xml.etree.ElementTree as ET
 
 from jenkins_tools.credential_describers.base import CredentialDescriber
+from jenkins_tools.credential_describers.bulk_secrets import SINGLE_MARKER, build_secrets_script
 
 
 class StringCredentialsDescriber(CredentialDescriber):
@@ -12,29 +13,14 @@ class StringCredentialsDescriber(CredentialDescriber):
     def get_credential_type(self) -> str:
         return "StringCredentialsImpl"
 
-    def get_groovy_script(self, credential_id: str) -> Optional[str]:
-        return f"""
-import org.jenkinsci.plugins.plaincredentials.impl.*
-
-def credId = '{credential_id}'
-def cred = null
-
-def allCreds = com.cloudbees.plugins.credentials.CredentialsProvider.lookupCredentials(
-    com.cloudbees.plugins.credentials.Credentials.class,
-    jenkins.model.Jenkins.instance
-)
-
-allCreds.each {{ c ->
-    if (c.id == credId) {{
-        cred = c
-    }}
-}}
-
-if (cred != null && cred instanceof StringCredentialsImpl) {{
-    println "SECRET:${{cred.secret}}"
-}}
+    def get_secret_fragment(self) -> Optional[str]:
+        return """
+        println "SECRET:${cred.secret}"
 """
 
+    def get_groovy_script(self, credential_id: str) -> Optional[str]:
+        return build_secrets_script([credential_id], {"StringCredentialsImpl": self}, SINGLE_MARKER)
+
     def parse_secret_output(self, output: str) -> Dict[str, Any]:
         lines = output.strip().split("\n")
         secret_data = {}
@@ -0,0 +1,81 @@
+"""Shared Groovy snippets for server-side scripts"""
+
+import base64
+
+
+def groovy_string(value: str) -> str:
+    """
+    Embed an arbitrary string in a Groovy script
+
+    The value is transported as base64 so quotes, backslashes and `$` in job
+    names or patterns cannot break (or inject into) the script.
+
+    Args:
+        value: String to embed
+
+    Returns:
+        Groovy expression evaluating to the original string
+    """
+    encoded = base64.b64encode(value.encode("utf-8")).decode("ascii")
+    return f"new String('{encoded}'.decodeBase64(), 'UTF-8')"
+
+
+# Defines jobRecord(job, buildLimit): a JSON-serializable map describing a job's
+# enabled state, health, permalinks, upstream/downstream and recent build numbers.
+JOB_RECORD_FUNCTION = """
+def buildNumber(build) {
+    return build ? build.number : null
+}
+
+def jobRecord(job, int buildLimit) {
+    def health = job.buildHealth
+    def hasRelations = job.respondsTo('getUpstreamProjects')
+    return [
+        name: job.fullName,
+        type: job.class.simpleName,
+        enabled: !(job.hasProperty('disabled') && job.disabled),
+        buildable: job.buildable,
+        health: (health && health.score != null)
+            ? [score: health.score, description: health.description?.toString()]
+            : null,
+        lastBuild: buildNumber(job.lastBuild),
+        lastStableBuild: buildNumber(job.lastStableBuild),
+        lastSuccessfulBuild: buildNumber(job.lastSuccessfulBuild),
+        lastFailedBuild: buildNumber(job.lastFailedBuild),
+        lastUnsuccessfulBuild: buildNumber(job.lastUnsuccessfulBuild),
+        lastCompletedBuild: buildNumber(job.lastCompletedBuild),
+        upstream: hasRelations ? job.upstreamProjects.collect { it.fullName } : [],
+        downstream: hasRelations ? job.downstreamProjects.collect { it.fullName } : [],
+        builds: buildLimit > 0 ? job.builds.limit(buildLimit).collect { it.number } : [],
+    ]
+}
+"""
+
+
+# Defines buildRecord(build): a JSON-serializable map with a build's number,
+# result, start time and duration (epoch / milliseconds), causes and node.
+# `node` is null for builds without a single executor node (e.g. Pipeline runs).
+BUILD_RECORD_FUNCTION = """
+def buildRecord(build) {
+    return [
+        number: build.number,
+        result: build.building ? null : build.result?.toString(),
+        building: build.building,
+        timestamp: build.timeInMillis,
+        duration: build.building ? null : build.duration,
+        cause: build.causes.collect { it.shortDescription }.join('; '),
+        node: build.hasProperty('builtOnStr') ? (build.builtOnStr ?: 'built-in') : null,
+    ]
+}
+"""
+
+
+# Prefix of each line printed by ALL_JOB_NAMES_SCRIPT
+JOB_NAME_PREFIX = "JOB "
+
+# Prints the full name of every job in every folder, one per line
+ALL_JOB_NAMES_SCRIPT = f"""
+hudson.model.Items.getAllItems(jenkins.model.Jenkins.instance, hudson.model.Job).each {{ job ->
+    println "{JOB_NAME_PREFIX}" + job.fullName
+}}
+"""
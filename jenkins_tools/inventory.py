@@ -0,0 +1,539 @@
+"""Local SQLite inventory of every job on a Jenkins server
+
+`jenkee index build` walks all jobs with one server-side Groovy script and
+stores each job's name, folder, type, views, SCM URLs, labels and config hash
+under `~/.jenkins-inspector/cache/inventory/`, together with an inverted index
+of every text and attribute value in its config.xml. `jenkee index update`
+sends the known hashes along with the script, so the server only returns
+config.xml for jobs whose config changed. `jenkee find` and
+`jenkee search-config` answer queries from the database without contacting
+the server.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import subprocess
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from jenkins_tools.cache import CACHE_DIR
+from jenkins_tools.core import JenkinsConfig, Transport
+from jenkins_tools.groovy_scripts import groovy_string
+
+# Constants
+INVENTORY_DIR = CACHE_DIR / "inventory"
+SCHEMA_VERSION = "2"
+
+# Prefix of each job record line in the script output
+RECORD_PREFIX = "JOB "
+
+# Fields `find` can query: field -> (table, column); jobs columns are matched
+# directly, the others through their per-job value tables
+QUERY_FIELDS = {
+    "name": ("jobs", "name"),
+    "folder": ("jobs", "folder"),
+    "type": ("jobs", "type"),
+    "view": ("job_views", "view"),
+    "scm": ("job_scm", "url"),
+    "label": ("job_labels", "label"),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS jobs (
+    name TEXT PRIMARY KEY,
+    folder TEXT NOT NULL,
+    type TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_views (name TEXT NOT NULL, view TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS job_scm (name TEXT NOT NULL, url TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS job_labels (name TEXT NOT NULL, label TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS job_views_name ON job_views (name);
+CREATE INDEX IF NOT EXISTS job_scm_name ON job_scm (name);
+CREATE INDEX IF NOT EXISTS job_labels_name ON job_labels (name);
+CREATE TABLE IF NOT EXISTS config_values (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS config_postings (token TEXT NOT NULL, value_id INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS config_values_name ON config_values (name);
+CREATE INDEX IF NOT EXISTS config_postings_token ON config_postings (token);
+CREATE INDEX IF NOT EXISTS config_postings_value ON config_postings (value_id);
+"""
+
+# Tokens of the config inverted index: lowercase runs of letters and digits
+TOKEN_PATTERN = re.compile(r"[0-9a-z]+")
+
+# Longest snippet shown for a search hit
+SNIPPET_LENGTH = 200
+
+# Elements whose text is a repository location (git, GitHub/Bitbucket branch
+# sources, Subversion module locations)
+SCM_URL_TAGS = {"url", "remote", "repositoryUrl", "serverUrl"}
+SCM_URL_PATTERN = re.compile(r"^(?:[a-z][a-z0-9+.-]*://|git@)\S+$", re.IGNORECASE)
+
+# Agent labels used inside inline Pipeline scripts
+PIPELINE_LABEL_PATTERNS = [
+    re.compile(r"""\blabel\s*[:(]?\s*['"]([^'"]+)['"]"""),
+    re.compile(r"""\bnode\s*\(\s*(?:label\s*:\s*)?['"]([^'"]+)['"]"""),
+]
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into the distinct tokens of the config inverted index"""
+    return list(dict.fromkeys(TOKEN_PATTERN.findall(text.lower())))
+
+
+def iter_config_values(root: ET.Element) -> Iterator[Tuple[str, str]]:
+    """
+    Walk a parsed config.xml and yield (XPath, value) for every non-blank
+    element text and attribute value
+
+    Paths carry a 1-based position only where siblings share a tag, e.g.
+    `/project/builders/hudson.tasks.Shell[2]/command`.
+    """
+    stack = [(root, f"/{root.tag}")]
+    while stack:
+        elem, path = stack.pop()
+        for attr, value in elem.attrib.items():
+            if value.strip():
+                yield f"{path}/@{attr}", value
+        if elem.text and elem.text.strip():
+            yield path, elem.text.strip()
+
+        counts = {}
+        for child in elem:
+            counts[child.tag] = counts.get(child.tag, 0) + 1
+        positions = {}
+        children = []
+        for child in elem:
+            if counts[child.tag] > 1:
+                positions[child.tag] = positions.get(child.tag, 0) + 1
+                children.append((child, f"{path}/{child.tag}[{positions[child.tag]}]"))
+            else:
+                children.append((child, f"{path}/{child.tag}"))
+        # Reversed so that values come out in document order
+        stack.extend(reversed(children))
+
+
+def extract_job_fields(root: ET.Element) -> Tuple[List[str], List[str]]:
+    """
+    Extract SCM URLs and agent labels from a parsed config.xml
+
+    Returns:
+        Tuple of (scm_urls, labels), each de-duplicated in document order
+    """
+    scm_urls = {}
+    labels = {}
+
+    for elem in root.iter():
+        text = (elem.text or "").strip()
+        if not text:
+            continue
+        if elem.tag in SCM_URL_TAGS and SCM_URL_PATTERN.match(text):
+            scm_urls[text] = None
+        elif elem.tag == "assignedNode":
+            labels[text] = None
+        elif elem.tag == "script":
+            for pattern in PIPELINE_LABEL_PATTERNS:
+                for match in pattern.finditer(text):
+                    labels[match.group(1).strip()] = None
+
+    return list(scm_urls), list(labels)
+
+
+def build_inventory_script(known_hashes: Dict[str, str]) -> str:
+    """
+    Build the Groovy script that reports every job
+
+    Each job is printed as one JSON record with its name, folder, type, views
+    and config hash; config.xml is included only when its hash differs from
+    `known_hashes`.
+    """
+    known = groovy_string(json.dumps(known_hashes))
+    return f"""
+import groovy.json.JsonOutput
+import groovy.json.JsonSlurper
+import java.security.MessageDigest
+
+def known = new JsonSlurper().parseText({known})
+def instance = jenkins.model.Jenkins.instance
+
+def views = [:]
+instance.views.each {{ view ->
+    if (view instanceof hudson.model.AllView) {{
+        return
+    }}
+    view.items.each {{ item ->
+        views[item.fullName] = (views[item.fullName] ?: []) + view.viewName
+    }}
+}}
+
+def count = 0
+hudson.model.Items.getAllItems(instance, hudson.model.Job).each {{ job ->
+    def bytes = job.configFile.file.bytes
+    def hash = MessageDigest.getInstance('SHA-256').digest(bytes).encodeHex().toString()
+    def record = [
+        name: job.fullName,
+        folder: job.parent instanceof hudson.model.Item ? job.parent.fullName : '',
+        type: job.class.simpleName,
+        hash: hash,
+        views: views[job.fullName] ?: [],
+    ]
+    if (known[job.fullName] != hash) {{
+        record.config = new String(bytes, 'UTF-8')
+    }}
+    println "{RECORD_PREFIX}" + JsonOutput.toJson(record)
+    if (++count % 100 == 0) {{
+        out.flush()
+    }}
+}}
+"""
+
+
+class JobInventory:
+    """SQLite job inventory of one Jenkins server"""
+
+    def __init__(self, config: JenkinsConfig, inventory_dir: Path = INVENTORY_DIR):
+        digest = hashlib.sha256(config.jenkins_url.encode("utf-8")).hexdigest()[:16]
+        self.path = inventory_dir / f"{digest}.db"
+        self.conn = None
+
+    def exists(self) -> bool:
+        """Check whether the inventory has been built"""
+        return self.path.exists()
+
+    def open(self) -> sqlite3.Connection:
+        """Open (creating if needed) the database"""
+        if self.conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.path))
+            self.conn.executescript(SCHEMA)
+            self.conn.create_function("regexp", 2, _regexp, deterministic=True)
+        return self.conn
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.open().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def known_hashes(self) -> Dict[str, str]:
+        """Get job name -> config hash of every indexed job"""
+        if self.get_meta("schema") != SCHEMA_VERSION:
+            return {}
+        return dict(self.open().execute("SELECT name, config_hash FROM jobs"))
+
+    def refresh(
+        self, transport: Transport, rebuild: bool = False
+    ) -> Tuple[Optional[dict], Optional[subprocess.CompletedProcess]]:
+        """
+        Bring the inventory up to date with the server
+
+        Args:
+            transport: Transport used to run the inventory script
+            rebuild: Re-read every job's config instead of only changed ones
+
+        Returns:
+            Tuple of (stats, None) on success, where stats counts 'added',
+            'updated', 'removed' and 'unchanged' jobs, or (None, failed
+            CompletedProcess). The database is left untouched on failure.
+        """
+        known = {} if rebuild else self.known_hashes()
+        conn = self.open()
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        seen = set()
+        errors = []
+
+        script = build_inventory_script(known)
+        with conn, transport.stream("groovy", "=", stdin_input=script) as output:
+            if rebuild or not known:
+                self._delete(conn, None)
+
+            for line in output:
+                if not line.startswith(RECORD_PREFIX):
+                    if line.strip():
+                        errors.append(line.rstrip("\n"))
+                    continue
+
+                record = json.loads(line[len(RECORD_PREFIX) :])
+                name = record["name"]
+                seen.add(name)
+                if "config" not in record:
+                    stats["unchanged"] += 1
+                    self._replace_values(conn, "job_views", "view", name, record["views"])
+                    continue
+
+                stats["updated" if name in known else "added"] += 1
+                self._store(conn, record)
+
+            if output.returncode == 0 and not errors:
+                removed = [name for name in known if name not in seen]
+                for name in removed:
+                    self._delete(conn, name)
+                stats["removed"] = len(removed)
+
+                for key, value in (("schema", SCHEMA_VERSION), ("updated_at", str(time.time()))):
+                    conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+            else:
+                # Leaving the `with conn` block by exception rolls back the transaction
+                conn.rollback()
+
+        if output.returncode != 0 or errors:
+            # Anything that is not a record is a script error reported by the server
+            stderr = output.stderr or "\n".join(errors)
+            failed = subprocess.CompletedProcess(
+                ["groovy", "="], output.returncode or 1, "", stderr
+            )
+            return None, failed
+        return stats, None
+
+    def _store(self, conn: sqlite3.Connection, record: dict) -> None:
+        """Insert or replace one job, its views, SCM URLs, labels and config values"""
+        name = record["name"]
+        try:
+            root = ET.fromstring(record["config"])
+        except ET.ParseError:
+            root = None
+        scm_urls, labels = extract_job_fields(root) if root is not None else ([], [])
+
+        conn.execute(
+            "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?)",
+            (name, record["folder"], record["type"], record["hash"], time.time()),
+        )
+        self._replace_values(conn, "job_views", "view", name, record["views"])
+        self._replace_values(conn, "job_scm", "url", name, scm_urls)
+        self._replace_values(conn, "job_labels", "label", name, labels)
+
+        self._delete_config_values(conn, name)
+        for path, value in iter_config_values(root) if root is not None else []:
+            cursor = conn.execute(
+                "INSERT INTO config_values (name, path, value) VALUES (?, ?, ?)",
+                (name, path, value),
+            )
+            conn.executemany(
+                "INSERT INTO config_postings VALUES (?, ?)",
+                [(token, cursor.lastrowid) for token in tokenize(value)],
+            )
+
+    @staticmethod
+    def _delete_config_values(conn, name: Optional[str]) -> None:
+        """Remove the indexed config values of one job, or of every job when name is None"""
+        if name is None:
+            conn.execute("DELETE FROM config_postings")
+            conn.execute("DELETE FROM config_values")
+            return
+        conn.execute(
+            "DELETE FROM config_postings WHERE value_id IN "
+            "(SELECT id FROM config_values WHERE name = ?)",
+            (name,),
+        )
+        conn.execute("DELETE FROM config_values WHERE name = ?", (name,))
+
+    @staticmethod
+    def _replace_values(conn, table: str, column: str, name: str, values: List[str]) -> None:
+        conn.execute(f"DELETE FROM {table} WHERE name = ?", (name,))
+        conn.executemany(
+            f"INSERT INTO {table} (name, {column}) VALUES (?, ?)",
+            [(name, value) for value in values],
+        )
+
+    @staticmethod
+    def _delete(conn, name: Optional[str]) -> None:
+        """Remove one job, or every job when name is None"""
+        JobInventory._delete_config_values(conn, name)
+        for table in ("jobs", "job_views", "job_scm", "job_labels"):
+            if name is None:
+                conn.execute(f"DELETE FROM {table}")
+            else:
+                conn.execute(f"DELETE FROM {table} WHERE name = ?", (name,))
+
+    def find(self, terms: List[Tuple[str, str]], regex: bool = False) -> List[dict]:
+        """
+        Find jobs matching every (field, value) term
+
+        Values are case-insensitive substrings, or Python regular expressions
+        when `regex` is set.
+
+        Returns:
+            Job records sorted by name
+        """
+        clauses = []
+        params = []
+        for field, value in terms:
+            table, column = QUERY_FIELDS[field]
+            if regex:
+                match, param = f"{column} REGEXP ?", value
+            else:
+                match, param = f"{column} LIKE ? ESCAPE '\\'", f"%{_escape_like(value)}%"
+
+            if table == "jobs":
+                clauses.append(f"jobs.{match}")
+            else:
+                clauses.append(
+                    f"EXISTS (SELECT 1 FROM {table} WHERE {table}.name = jobs.name AND {match})"
+                )
+            params.append(param)
+
+        where = " AND ".join(clauses) if clauses else "1"
+        conn = self.open()
+        rows = conn.execute(
+            f"SELECT name, folder, type, config_hash FROM jobs WHERE {where} ORDER BY name",
+            params,
+        ).fetchall()
+
+        records = []
+        for name, folder, job_type, config_hash in rows:
+            records.append(
+                {
+                    "name": name,
+                    "folder": folder,
+                    "type": job_type,
+                    "views": self._values(conn, "job_views", "view", name),
+                    "scmUrls": self._values(conn, "job_scm", "url", name),
+                    "labels": self._values(conn, "job_labels", "label", name),
+                    "configHash": config_hash,
+                }
+            )
+        return records
+
+    @staticmethod
+    def _values(conn, table: str, column: str, name: str) -> List[str]:
+        return [
+            row[0] for row in conn.execute(f"SELECT {column} FROM {table} WHERE name = ?", (name,))
+        ]
+
+    def search_config(self, pattern: str, regex: bool = False, ignore_case: bool = True):
+        """
+        Search the indexed config values of every job
+
+        A plain pattern is matched as a substring anywhere in a value, also
+        in the middle of a word. The inverted index narrows the values to
+        check (see `_candidate_query`), then each candidate is checked for the
+        whole pattern. A regular expression is checked against every value.
+
+        Args:
+            pattern: Substring, or Python regular expression when `regex` is set
+            regex: Treat `pattern` as a regular expression
+            ignore_case: Match case-insensitively
+
+        Returns:
+            List of (job name, hits) ranked by number of hits, where each hit is
+            a dict with 'path', 'line' (1-based, None for one-line values) and
+            'text'
+        """
+        conn = self.open()
+        candidates = None if regex else _candidate_query(pattern)
+        if candidates is not None:
+            query, params = candidates
+            rows = conn.execute(
+                f"SELECT name, path, value FROM config_values WHERE id IN ({query}) "
+                f"ORDER BY name, id",
+                params,
+            )
+        else:
+            rows = conn.execute("SELECT name, path, value FROM config_values ORDER BY name, id")
+
+        if regex:
+            compiled = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+            matches = lambda text: compiled.search(text) is not None
+        elif ignore_case:
+            needle = pattern.lower()
+            matches = lambda text: needle in text.lower()
+        else:
+            matches = lambda text: pattern in text
+
+        results = {}
+        for name, path, value in rows:
+            if not matches(value):
+                continue
+            lines = value.splitlines()
+            if len(lines) <= 1:
+                hits = [{"path": path, "line": None, "text": _snippet(value)}]
+            else:
+                hits = [
+                    {"path": path, "line": number, "text": _snippet(line.strip())}
+                    for number, line in enumerate(lines, 1)
+                    if matches(line)
+                ]
+                if not hits:
+                    # The match spans lines; report the value as a whole
+                    hits = [{"path": path, "line": None, "text": _snippet(lines[0].strip())}]
+            results.setdefault(name, []).extend(hits)
+
+        return sorted(results.items(), key=lambda item: (-len(item[1]), item[0]))
+
+
+def _candidate_query(pattern: str) -> Optional[Tuple[str, List[str]]]:
+    """
+    Build a query for the IDs of the values that may contain `pattern`
+
+    Any occurrence of the pattern contains its tokens in order: the first
+    may be the end of a longer token (the pattern starts mid-word), the last
+    may be the start of one, and the ones in between are whole tokens. A
+    single token may sit anywhere inside a token. Conditions that cannot use
+    the token index (a token's end or middle) are only used when nothing
+    else narrows the search; candidates are a superset either way.
+
+    Returns:
+        Tuple of (SQL, parameters), or None if every value must be checked
+    """
+    lowered = pattern.lower()
+    tokens = TOKEN_PATTERN.findall(lowered)
+    if not tokens:
+        return None
+    open_start = TOKEN_PATTERN.match(lowered) is not None
+    open_end = TOKEN_PATTERN.match(lowered[-1]) is not None
+
+    indexed, scanned = [], []
+    for i, token in enumerate(tokens):
+        starts_mid = i == 0 and open_start
+        ends_mid = i == len(tokens) - 1 and open_end
+        if starts_mid and ends_mid:
+            scanned.append(("token LIKE ?", [f"%{token}%"]))
+        elif starts_mid:
+            scanned.append(("token LIKE ?", [f"%{token}"]))
+        elif ends_mid:
+            upper = token[:-1] + chr(ord(token[-1]) + 1)
+            indexed.append(("token >= ? AND token < ?", [token, upper]))
+        else:
+            indexed.append(("token = ?", [token]))
+
+    conditions = indexed or scanned
+    queries = [f"SELECT value_id FROM config_postings WHERE {where}" for where, _ in conditions]
+    params = [param for _, values in conditions for param in values]
+    return " INTERSECT ".join(queries), params
+
+
+_REGEX_CACHE = {}
+
+
+def _regexp(pattern: str, value: Optional[str]) -> bool:
+    """SQLite REGEXP implementation: `value REGEXP pattern`"""
+    if value is None:
+        return False
+    compiled = _REGEX_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _REGEX_CACHE[pattern] = re.compile(pattern)
+    return compiled.search(value) is not None
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _snippet(text: str) -> str:
+    if len(text) <= SNIPPET_LENGTH:
+        return text
+    return text[: SNIPPET_LENGTH - 3] + "..."
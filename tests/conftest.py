@@ -0,0 +1,216 @@
+"""Shared fixtures: a local fake Jenkins served by http.server"""
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pytest
+
+from jenkins_tools.core import JenkinsConfig, JenkinsHTTP
+
+CRUMB = {"crumbRequestField": "Jenkins-Crumb", "crumb": "c0ffee"}
+
+
+class FakeJenkins:
+    """
+    In-memory Jenkins state behind the fake HTTP server
+
+    Jobs are keyed by full name ('folder/job'); a folder is any name that is
+    a prefix of other job names. Every request is recorded in `requests` as
+    (method, path, body).
+    """
+
+    def __init__(self):
+        self.jobs = {}
+        self.views = {}
+        self.requests = []
+        self.next_queue_id = 100
+        self.stop_status = 302
+        self.logs = {}
+        self.drop_log_after = None  # Bytes of the next console read sent before hanging up
+
+    def add_job(self, name, config="<project/>", builds=(), parameters=()):
+        self.jobs[name] = {
+            "config": config,
+            "builds": [dict(build) for build in builds],
+            "parameters": list(parameters),
+            "queued": [],
+        }
+
+    def children(self, folder):
+        prefix = f"{folder}/" if folder else ""
+        names = {name[len(prefix) :].split("/")[0] for name in self.jobs if name.startswith(prefix)}
+        return sorted(names)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    @property
+    def jenkins(self) -> FakeJenkins:
+        return self.server.jenkins
+
+    def _send(self, status, body=b"", headers=None):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode("utf-8")
+        elif isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _parse(self):
+        """Split the path into (item full name, remaining path, query)"""
+        url = urlsplit(self.path)
+        parts = url.path.strip("/").split("/") if url.path.strip("/") else []
+        names = []
+        while len(parts) >= 2 and parts[0] == "job":
+            names.append(unquote(parts[1]))
+            parts = parts[2:]
+        return "/".join(names), "/".join(parts), parse_qs(url.query)
+
+    def do_GET(self):
+        self.jenkins.requests.append(("GET", self.path, b""))
+        name, rest, query = self._parse()
+
+        if rest == "crumbIssuer/api/json":
+            return self._send(200, CRUMB)
+        if rest.startswith("view/"):
+            view = unquote(rest.split("/")[1])
+            if view not in self.jenkins.views:
+                return self._send(404)
+            return self._send(200, {"jobs": [{"name": n} for n in self.jenkins.views[view]]})
+        if rest == "api/json" and (not name or name not in self.jenkins.jobs):
+            children = self.jenkins.children(name)
+            if not children:
+                return self._send(404)
+            return self._send(200, {"jobs": [{"name": n} for n in children]})
+
+        job = self.jenkins.jobs.get(name)
+        if job is None:
+            return self._send(404)
+        if rest == "api/json":
+            return self._send(200, {"builds": job["builds"]})
+        if rest == "config.xml":
+            return self._send(200, job["config"], {"Content-Type": "application/xml"})
+        if rest == "lastBuild/api/json":
+            if not job["builds"]:
+                return self._send(404)
+            return self._send(200, {"number": max(b["number"] for b in job["builds"])})
+        if rest.endswith("/logText/progressiveText"):
+            return self._progressive_text(name, int(rest.split("/")[0]), query)
+        self._send(404)
+
+    def _progressive_text(self, name, number, query):
+        log = self.jenkins.logs.get((name, number))
+        if log is None:
+            return self._send(404)
+        start = int(query.get("start", ["0"])[0])
+        body = log[start:]
+        headers = {"X-Text-Size": str(len(log)), "X-More-Data": "false"}
+        drop_after, self.jenkins.drop_log_after = self.jenkins.drop_log_after, None
+        if drop_after is None:
+            return self._send(200, body, headers)
+
+        # Promise the whole body, send part of it and hang up
+        self.send_response(200)
+        for header, value in headers.items():
+            self.send_header(header, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body[:drop_after])
+        self.wfile.flush()
+        self.close_connection = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.jenkins.requests.append(("POST", self.path, body))
+        if self.headers.get(CRUMB["crumbRequestField"]) != CRUMB["crumb"]:
+            return self._send(403, "No valid crumb was included in the request")
+
+        name, rest, query = self._parse()
+        if rest == "createItem":
+            source = query["from"][0].strip("/")
+            if source not in self.jenkins.jobs:
+                return self._send(400, "No such job")
+            dest = "/".join(filter(None, [name, query["name"][0]]))
+            self.jenkins.add_job(dest, self.jenkins.jobs[source]["config"])
+            return self._send(200)
+
+        job = self.jenkins.jobs.get(name)
+        if job is None:
+            return self._send(404)
+        if rest == "config.xml":
+            job["config"] = body.decode("utf-8")
+            return self._send(200)
+        if rest in ("disable", "enable"):
+            disabled = "true" if rest == "disable" else "false"
+            job["config"] = f"<project><disabled>{disabled}</disabled></project>"
+            return self._send(302, headers={"Location": "/"})
+        if rest in ("build", "buildWithParameters"):
+            if rest == "build" and job["parameters"]:
+                return self._send(400, "Nothing is submitted")
+            params = {k: v[0] for k, v in parse_qs(body.decode("utf-8")).items()}
+            queue_id = self.jenkins.next_queue_id
+            self.jenkins.next_queue_id += 1
+            job["queued"].append({"id": queue_id, "params": params})
+            location = f"http://{self.headers['Host']}/queue/item/{queue_id}/"
+            return self._send(201, headers={"Location": location})
+        if rest.endswith("/stop"):
+            number = int(rest.split("/")[0])
+            for build in job["builds"]:
+                if build["number"] == number and self.jenkins.stop_status < 400:
+                    build["building"] = False
+            return self._send(self.jenkins.stop_status, headers={"Location": "/"})
+        self._send(404)
+
+
+@pytest.fixture
+def fake_jenkins():
+    """A FakeJenkins served on a free local port, as (state, url)"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.jenkins = FakeJenkins()
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    try:
+        yield server.jenkins, f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def unused_port_url():
+    """A local URL nothing listens on"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+
+@pytest.fixture
+def config(fake_jenkins, tmp_path, monkeypatch):
+    """A JenkinsConfig pointing at the fake server, isolated from ~/.jenkins-inspector"""
+    _, url = fake_jenkins
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("JENKINS_URL", url)
+    monkeypatch.setenv("JENKINS_USER_ID", "alice")
+    monkeypatch.setenv("JENKINS_API_TOKEN", "secret")
+    monkeypatch.setenv("JENKINS_TRANSPORT", "http")
+    return JenkinsConfig()
+
+
+@pytest.fixture
+def http(config):
+    """A JenkinsHTTP transport connected to the fake server"""
+    transport = JenkinsHTTP(config)
+    yield transport
+    transport.close()
@@ -0,0 +1,44 @@
+"""batch: subcommand failures are recorded without stopping the batch"""
+
+from jenkins_tools.commands.batch import BatchCommand
+from jenkins_tools.core import Command
+
+
+class _EchoCommand(Command):
+    def __init__(self, args=None):
+        self.args = args or []
+
+    def execute(self) -> int:
+        print(" ".join(self.args))
+        return 0
+
+
+class _CrashCommand(Command):
+    def __init__(self, args=None):
+        self.args = args or []
+
+    def execute(self) -> int:
+        raise ConnectionResetError("connection reset by peer")
+
+
+COMMANDS = {"echo": _EchoCommand, "crash": _CrashCommand}
+
+
+def test_run_captures_output():
+    record = BatchCommand()._run(COMMANDS, ["echo", "a", "b"], None)
+
+    assert record == {"args": ["echo", "a", "b"], "returncode": 0, "stdout": "a b\n", "stderr": ""}
+
+
+def test_run_records_unexpected_exception():
+    record = BatchCommand()._run(COMMANDS, ["crash"], None)
+
+    assert record["returncode"] == 1
+    assert record["stderr"] == "Error: ConnectionResetError: connection reset by peer\n"
+
+
+def test_unknown_command():
+    record = BatchCommand()._run(COMMANDS, ["nope"], None)
+
+    assert record["returncode"] == 1
+    assert record["stderr"] == "Error: Unknown command 'nope'\n"
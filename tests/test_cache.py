@@ -0,0 +1,118 @@
+"""Config cache: TTL-based get-job caching and invalidation after writes"""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jenkins_tools.cache import CACHE_OFF, CACHE_REFRESH, ConfigCache, fetch_job_config
+from jenkins_tools.commands import disable_job, enable_job
+from jenkins_tools.core import JenkinsHTTP
+
+
+def _sha256(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture
+def cache(config, tmp_path):
+    return ConfigCache(config, tmp_path / "cache")
+
+
+def _config_requests(jenkins):
+    return [path for method, path, _ in jenkins.requests if path.endswith("/config.xml")]
+
+
+def test_fresh_entry_is_served_from_disk(fake_jenkins, http, cache):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("backend", config="<project>v1</project>")
+
+    first = fetch_job_config(http, cache, "backend")
+    jenkins.jobs["backend"]["config"] = "<project>v2</project>"
+    second = fetch_job_config(http, cache, "backend")
+
+    assert first.stdout == second.stdout == "<project>v1</project>"
+    assert len(_config_requests(jenkins)) == 1
+
+
+def test_stale_entry_is_fetched_again(fake_jenkins, http, cache):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("backend", config="<project>v1</project>")
+    cache.ttl = 0
+
+    fetch_job_config(http, cache, "backend")
+    jenkins.jobs["backend"]["config"] = "<project>v2</project>"
+
+    assert fetch_job_config(http, cache, "backend").stdout == "<project>v2</project>"
+
+
+@pytest.mark.parametrize("mode", [CACHE_REFRESH, CACHE_OFF])
+def test_refresh_and_off_bypass_fresh_entries(fake_jenkins, http, cache, mode):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("backend", config="<project>v1</project>")
+    fetch_job_config(http, cache, "backend")
+    jenkins.jobs["backend"]["config"] = "<project>v2</project>"
+
+    assert fetch_job_config(http, cache, "backend", mode).stdout == "<project>v2</project>"
+
+
+def test_not_found_is_not_cached(fake_jenkins, http, cache):
+    result = fetch_job_config(http, cache, "missing")
+
+    assert result.returncode == 3
+    assert cache.lookup("missing") is None
+
+
+def test_connection_error_is_reported(config, cache, unused_port_url):
+    config.jenkins_url = unused_port_url
+    transport = JenkinsHTTP(config)
+
+    result = fetch_job_config(transport, cache, "backend")
+
+    assert result.returncode == 1
+    assert result.stderr.startswith("ERROR: ")
+
+
+@pytest.mark.parametrize(
+    "module, command_class, disabled",
+    [
+        (disable_job, disable_job.DisableJobCommand, "true"),
+        (enable_job, enable_job.EnableJobCommand, "false"),
+    ],
+)
+def test_enable_disable_invalidate_cache(
+    fake_jenkins, config, http, cache, monkeypatch, module, command_class, disabled
+):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("backend", config="<project>cached</project>")
+    fetch_job_config(http, cache, "backend")
+    monkeypatch.setattr(module, "ConfigCache", lambda config: cache)
+
+    assert command_class(["backend"]).bind(config, http).execute() == 0
+
+    expected = f"<project><disabled>{disabled}</disabled></project>"
+    assert fetch_job_config(http, cache, "backend").stdout == expected
+
+
+def test_concurrent_stores_of_identical_content(cache):
+    content = "<project>" + "x" * 100_000 + "</project>"
+    names = [f"job-{i}" for i in range(64)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda name: cache.store(name, content), names))
+
+    assert all(cache.lookup(name)["content"] == content for name in names)
+    assert [path.name for path in cache.blob_dir.iterdir()] == [f"{_sha256(content)}.xml"]
+
+
+def test_concurrent_stores_with_eviction(cache):
+    cache.max_bytes = 50_000
+    contents = [f"<project>{i % 4}{'x' * 20_000}</project>" for i in range(64)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: cache.store(f"job-{i}", contents[i]), range(64)))
+
+    assert not list(cache.blob_dir.glob(".*.tmp"))
+    for i in range(64):
+        entry = cache.lookup(f"job-{i}")
+        assert entry is None or entry["content"] == contents[i]
@@ -0,0 +1,87 @@
+"""CLI daemon: the warm JVM pool never grows past DAEMON_POOL_SIZE"""
+
+import threading
+import time
+
+import pytest
+
+from jenkins_tools import cli_daemon
+from jenkins_tools.cli_daemon import DAEMON_POOL_SIZE, CLIDaemon
+
+
+class _FakeJVM:
+    """Stands in for a launcher JVM: answers every command with its arguments"""
+
+    started = []
+
+    def __init__(self, cmd, **kwargs):
+        time.sleep(0.02)  # Starting a JVM takes a while: requests pile up meanwhile
+        self.returncode = None
+        _FakeJVM.started.append(self)
+
+    def poll(self):
+        return self.returncode
+
+    def communicate(self, input=None):
+        self.returncode = 0
+        return input.splitlines()[0], ""
+
+    def kill(self):
+        self.returncode = -9
+
+
+@pytest.fixture
+def daemon(config, tmp_path, monkeypatch):
+    _FakeJVM.started = []
+    monkeypatch.setattr(cli_daemon.subprocess, "Popen", _FakeJVM)
+    daemon = CLIDaemon(config, tmp_path / "daemon.sock", idle_timeout=60)
+    monkeypatch.setattr(daemon.cli, "get_server_args", lambda: [])
+    return daemon
+
+
+def _wait_for_spawns():
+    """Wait until the replacement threads stop starting JVMs"""
+    seen = -1
+    while seen != len(_FakeJVM.started):
+        seen = len(_FakeJVM.started)
+        time.sleep(0.05)
+
+
+def test_burst_keeps_pool_size(daemon):
+    requests = 10
+    barrier = threading.Barrier(requests)
+    results = []
+
+    def request(i):
+        barrier.wait()
+        results.append(daemon.execute(["who-am-i", str(i)], None))
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    _wait_for_spawns()
+
+    assert len(results) == requests
+    assert all(result["returncode"] == 0 for result in results)
+    assert daemon.spares.qsize() == DAEMON_POOL_SIZE
+    assert len(_FakeJVM.started) == requests + DAEMON_POOL_SIZE
+
+
+def test_failed_spawns_are_not_counted(daemon, monkeypatch):
+    def fail(cmd, **kwargs):
+        raise OSError("java: not found")
+
+    monkeypatch.setattr(cli_daemon.subprocess, "Popen", fail)
+    monkeypatch.setattr(cli_daemon, "DAEMON_SPARE_TIMEOUT", 0.05)
+
+    with pytest.raises(RuntimeError, match="No CLI launcher available"):
+        daemon.execute(["who-am-i"], None)
+    _wait_for_spawns()
+
+    assert daemon.spares.qsize() == 0
+    monkeypatch.setattr(cli_daemon.subprocess, "Popen", _FakeJVM)
+    assert daemon.execute(["who-am-i"], None)["returncode"] == 0
+    _wait_for_spawns()
+    assert daemon.spares.qsize() == DAEMON_POOL_SIZE
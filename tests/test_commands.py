@@ -0,0 +1,11 @@
+"""jenkins_tools.commands exports every registered command class"""
+
+import jenkins_tools.commands as commands
+
+
+def test_every_command_class_is_exported():
+    class_names = {class_name for _, class_name in commands.COMMAND_MODULES.values()}
+
+    assert class_names - set(commands.__all__) == set()
+    for class_name in class_names:
+        assert getattr(commands, class_name).__name__ == class_name
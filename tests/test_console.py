@@ -0,0 +1,97 @@
+"""console over HTTP: resuming after dropped connections never repeats output"""
+
+import pytest
+
+from jenkins_tools.commands import console
+from jenkins_tools.commands.console import ConsoleCommand
+from jenkins_tools.core import HTTP_READ_SIZE
+
+# Long enough to span several read chunks, with multi-byte characters throughout
+LOG = "".join(f"line {i}: ステップ完了\n" for i in range(10000)).encode("utf-8")
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(console.time, "sleep", lambda seconds: None)
+
+
+@pytest.fixture
+def jenkins(fake_jenkins):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("backend")
+    jenkins.logs[("backend", 7)] = LOG
+    return jenkins
+
+
+def _run(config, http, *args):
+    return ConsoleCommand(["backend", "7", *args]).bind(config, http).execute()
+
+
+def test_streams_whole_log(jenkins, config, http, capsysbinary):
+    assert _run(config, http) == 0
+
+    assert capsysbinary.readouterr().out == LOG
+
+
+def test_retry_resumes_after_printed_output(jenkins, config, http, capsysbinary):
+    # Drop mid-way through a character, after more than one chunk was written
+    jenkins.drop_log_after = HTTP_READ_SIZE + 1000 + 1
+    assert LOG[jenkins.drop_log_after - 1] >= 0x80
+
+    assert _run(config, http) == 0
+
+    assert capsysbinary.readouterr().out == LOG
+
+
+def test_offset_file_resumes_without_duplicates(
+    jenkins, config, http, capsysbinary, monkeypatch, tmp_path
+):
+    offset_file = tmp_path / "offset"
+    monkeypatch.setattr(console, "CONSOLE_RETRIES", 0)
+    jenkins.drop_log_after = HTTP_READ_SIZE + 1000 + 1
+
+    assert _run(config, http, "--offset-file", str(offset_file)) == 1
+    first = capsysbinary.readouterr().out
+    assert offset_file.read_text() == f"7 {len(first)}\n"
+
+    assert _run(config, http, "--offset-file", str(offset_file)) == 0
+    second = capsysbinary.readouterr().out
+
+    assert first + second == LOG
+    assert offset_file.read_text() == f"7 {len(LOG)}\n"
+
+
+def test_offset_file_stays_on_resolved_build(
+    jenkins, config, http, capsysbinary, monkeypatch, tmp_path
+):
+    offset_file = tmp_path / "offset"
+    jenkins.jobs["backend"]["builds"] = [{"number": 7, "building": True}]
+    monkeypatch.setattr(console, "CONSOLE_RETRIES", 0)
+    jenkins.drop_log_after = HTTP_READ_SIZE + 1000 + 1
+
+    assert (
+        ConsoleCommand(["backend", "--offset-file", str(offset_file)]).bind(config, http).execute()
+        == 1
+    )
+    first = capsysbinary.readouterr().out
+
+    # A newer build starts before the run is resumed
+    jenkins.jobs["backend"]["builds"].append({"number": 8, "building": True})
+    jenkins.logs[("backend", 8)] = b"build 8\n"
+
+    assert (
+        ConsoleCommand(["backend", "--offset-file", str(offset_file)]).bind(config, http).execute()
+        == 0
+    )
+
+    assert first + capsysbinary.readouterr().out == LOG
+
+
+def test_offset_file_of_another_build_is_rejected(jenkins, config, http, capsys, tmp_path):
+    offset_file = tmp_path / "offset"
+    offset_file.write_text("6 1234\n")
+
+    assert _run(config, http, "--offset-file", str(offset_file)) == 1
+
+    assert f"{offset_file} records the offset of build 6" in capsys.readouterr().err
+    assert offset_file.read_text() == "6 1234\n"
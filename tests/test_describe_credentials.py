@@ -0,0 +1,60 @@
+"""describe-credentials --show-secret: only the described credentials' secrets are requested"""
+
+import subprocess
+
+from jenkins_tools.commands.describe_credentials import DescribeCredentialsCommand
+from jenkins_tools.core import Transport
+from jenkins_tools.groovy_scripts import groovy_string
+
+STORE_XML = """<list>
+  <com.cloudbees.plugins.credentials.domains.DomainCredentials>
+    <domain><name>(global)</name></domain>
+    <credentials>
+      <org.jenkinsci.plugins.plaincredentials.impl.StringCredentialsImpl>
+        <scope>GLOBAL</scope><id>api-token</id><description>API</description>
+      </org.jenkinsci.plugins.plaincredentials.impl.StringCredentialsImpl>
+      <com.cloudbees.plugins.credentials.impl.UsernamePasswordCredentialsImpl>
+        <scope>GLOBAL</scope><id>deploy-user</id><description>Deploy</description>
+      </com.cloudbees.plugins.credentials.impl.UsernamePasswordCredentialsImpl>
+    </credentials>
+  </com.cloudbees.plugins.credentials.domains.DomainCredentials>
+</list>
+"""
+
+
+class _CredentialsTransport(Transport):
+    """Serves one credentials store and records the secrets script"""
+
+    def __init__(self):
+        self.scripts = []
+
+    def run(self, command, *args, stdin_input=None):
+        if command == "groovy":
+            self.scripts.append(stdin_input)
+            return subprocess.CompletedProcess([command], 0, "", "")
+        assert command == "list-credentials-as-xml"
+        return subprocess.CompletedProcess([command], 0, STORE_XML, "")
+
+
+def _secrets_script(config, *args):
+    transport = _CredentialsTransport()
+    command = DescribeCredentialsCommand([*args, "--show-secret", "--no-cache"])
+
+    assert command.bind(config, transport).execute() == 0
+
+    [script] = transport.scripts
+    return script
+
+
+def test_all_names_the_store_credentials(config, capsys):
+    script = _secrets_script(config, "--all")
+
+    assert "byId.keySet()" not in script
+    assert f"[{groovy_string('api-token')}, {groovy_string('deploy-user')}]" in script
+
+
+def test_selected_ids_only(config, capsys):
+    script = _secrets_script(config, "deploy-user")
+
+    assert f"[{groovy_string('deploy-user')}]" in script
+    assert groovy_string("api-token") not in script
@@ -0,0 +1,154 @@
+"""JenkinsHTTP command handlers against the fake Jenkins in conftest.py"""
+
+from urllib.parse import parse_qs
+
+
+def test_list_jobs_top_level(fake_jenkins, http):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("backend")
+    jenkins.add_job("team/frontend")
+
+    result = http.run("list-jobs")
+
+    assert result.returncode == 0
+    assert result.stdout == "backend\nteam\n"
+
+
+def test_list_jobs_view_and_folder(fake_jenkins, http):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("backend")
+    jenkins.add_job("team/frontend")
+    jenkins.views["services"] = ["backend"]
+
+    assert http.run("list-jobs", "services").stdout == "backend\n"
+    assert http.run("list-jobs", "team").stdout == "frontend\n"
+
+
+def test_list_jobs_unknown_view(fake_jenkins, http):
+    result = http.run("list-jobs", "missing")
+
+    assert result.returncode == 3
+    assert "missing" in result.stderr
+
+
+def test_get_job(fake_jenkins, http):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("team/frontend", config="<project><description>x</description></project>")
+
+    result = http.run("get-job", "team/frontend")
+
+    assert result.returncode == 0
+    assert result.stdout == "<project><description>x</description></project>"
+
+
+def test_get_job_not_found(fake_jenkins, http):
+    result = http.run("get-job", "missing")
+
+    assert result.returncode == 3
+    assert result.stderr == "ERROR: No such job 'missing'\n"
+
+
+def test_update_job_posts_config_with_crumb(fake_jenkins, http):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("backend")
+
+    result = http.run("update-job", "backend", stdin_input="<project>new</project>")
+
+    assert result.returncode == 0
+    assert jenkins.jobs["backend"]["config"] == "<project>new</project>"
+
+
+def test_update_job_not_found(fake_jenkins, http):
+    result = http.run("update-job", "missing", stdin_input="<project/>")
+
+    assert result.returncode == 3
+
+
+def test_copy_job_into_folder(fake_jenkins, http):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("backend", config="<project>b</project>")
+    jenkins.add_job("team/frontend")
+
+    result = http.run("copy-job", "backend", "team/backend-copy")
+
+    assert result.returncode == 0
+    assert jenkins.jobs["team/backend-copy"]["config"] == "<project>b</project>"
+
+
+def test_copy_job_missing_source(fake_jenkins, http):
+    result = http.run("copy-job", "missing", "copy")
+
+    assert result.returncode == 1
+    assert "HTTP 400" in result.stderr
+
+
+def test_build_returns_queue_id(fake_jenkins, http):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("backend")
+
+    status, queue_id, _ = http.trigger_build("backend", [])
+
+    assert status == 201
+    assert queue_id == 100
+    assert http.run("build", "backend").returncode == 0
+
+
+def test_build_with_parameters(fake_jenkins, http):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("deploy", parameters=["ENV"])
+
+    result = http.run("build", "deploy", "-p", "ENV=staging", "-p", "DRY=true")
+
+    assert result.returncode == 0
+    assert jenkins.jobs["deploy"]["queued"][0]["params"] == {"ENV": "staging", "DRY": "true"}
+    method, path, body = jenkins.requests[-1]
+    assert path.endswith("/buildWithParameters")
+    assert parse_qs(body.decode()) == {"ENV": ["staging"], "DRY": ["true"]}
+
+
+def test_build_parameterized_job_without_parameters(fake_jenkins, http):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("deploy", parameters=["ENV"])
+
+    status, queue_id, _ = http.trigger_build("deploy", [])
+
+    assert status == 201
+    assert queue_id == 100
+    assert jenkins.requests[-1][1].endswith("/buildWithParameters")
+
+
+def test_build_not_found(fake_jenkins, http):
+    result = http.run("build", "missing")
+
+    assert result.returncode == 3
+
+
+def test_stop_builds_stops_running_builds_only(fake_jenkins, http):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job(
+        "backend", builds=[{"number": 3, "building": True}, {"number": 2, "building": False}]
+    )
+
+    result = http.run("stop-builds", "backend")
+
+    assert result.returncode == 0
+    stops = [path for method, path, _ in jenkins.requests if path.endswith("/stop")]
+    assert stops == ["/job/backend/3/stop"]
+    assert not jenkins.jobs["backend"]["builds"][0]["building"]
+
+
+def test_stop_builds_reports_failed_stop(fake_jenkins, http):
+    jenkins, _ = fake_jenkins
+    jenkins.add_job("backend", builds=[{"number": 3, "building": True}])
+    jenkins.stop_status = 403
+
+    result = http.run("stop-builds", "backend")
+
+    assert result.returncode == 1
+    assert result.stderr == "ERROR: Failed to stop backend #3: HTTP 403\n"
+
+
+def test_stop_builds_not_found(fake_jenkins, http):
+    result = http.run("stop-builds", "missing")
+
+    assert result.returncode == 3
@@ -0,0 +1,107 @@
+"""search-config over the local inventory: substring semantics of plain patterns"""
+
+import json
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from jenkins_tools.core import Transport
+from jenkins_tools.inventory import RECORD_PREFIX, JobInventory
+
+CONFIGS = {
+    "agents": "<project><assignedNode>docker-agent</assignedNode></project>",
+    "pipeline": (
+        "<flow-definition><definition><script>@Library('my-shared-lib') _\n"
+        "node('linux') { sh 'make deploy' }</script></definition></flow-definition>"
+    ),
+    "deploy": (
+        "<project><scm><url>git@gitlab.example.com:ops/deploy.git</url></scm>"
+        "<builders><hudson.tasks.Shell><command>./gitlab-deploy.sh --env=prod</command>"
+        "</hudson.tasks.Shell></builders></project>"
+    ),
+}
+
+
+class _InventoryTransport(Transport):
+    """Answers the inventory script with one record per job in CONFIGS"""
+
+    def run(self, command, *args, stdin_input=None):
+        lines = [
+            RECORD_PREFIX
+            + json.dumps(
+                {
+                    "name": name,
+                    "folder": "",
+                    "type": "Job",
+                    "hash": name,
+                    "views": [],
+                    "config": xml,
+                }
+            )
+            for name, xml in CONFIGS.items()
+        ]
+        return subprocess.CompletedProcess([command, *args], 0, "\n".join(lines) + "\n", "")
+
+
+@pytest.fixture
+def inventory(tmp_path):
+    inventory = JobInventory(SimpleNamespace(jenkins_url="http://jenkins/"), tmp_path)
+    stats, failed = inventory.refresh(_InventoryTransport())
+    assert failed is None and stats["added"] == len(CONFIGS)
+    yield inventory
+    inventory.close()
+
+
+def _expected(inventory, pattern):
+    """Jobs with a value containing the pattern, by scanning every value"""
+    rows = inventory.open().execute("SELECT name, value FROM config_values")
+    return sorted({name for name, value in rows if pattern.lower() in value.lower()})
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "docker-agent",
+        "ocker",
+        "ocker-ag",
+        "ared-lib",
+        "my-shared",
+        "lab-deploy",
+        "itlab.example.com:ops/dep",
+        "--env=prod",
+        "=prod",
+        "make deploy",
+        "Library('",
+        "nothing-like-this",
+    ],
+)
+def test_plain_pattern_matches_substrings(inventory, pattern):
+    found = sorted(name for name, _ in inventory.search_config(pattern))
+
+    assert found == _expected(inventory, pattern)
+
+
+def test_mid_word_matches(inventory):
+    assert [name for name, _ in inventory.search_config("ocker")] == ["agents"]
+    assert [name for name, _ in inventory.search_config("ared-lib")] == ["pipeline"]
+
+
+def test_case_sensitive(inventory):
+    assert inventory.search_config("library", ignore_case=False) == []
+    assert [name for name, _ in inventory.search_config("Library", ignore_case=False)] == [
+        "pipeline"
+    ]
+
+
+def test_multiline_hits_report_line_numbers(inventory):
+    [(name, hits)] = inventory.search_config("make deploy")
+
+    assert name == "pipeline"
+    assert hits == [
+        {
+            "path": "/flow-definition/definition/script",
+            "line": 2,
+            "text": "node('linux') { sh 'make deploy' }",
+        }
+    ]
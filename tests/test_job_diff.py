@@ -0,0 +1,73 @@
+"""job-diff --many: job selection covers jobs inside folders"""
+
+import subprocess
+
+from jenkins_tools.commands.job_diff import JobDiffCommand
+from jenkins_tools.core import Transport
+from jenkins_tools.groovy_scripts import JOB_NAME_PREFIX
+
+CONFIG = (
+    "<project><builders><hudson.tasks.Shell><command>{}</command>"
+    "</hudson.tasks.Shell></builders></project>"
+)
+JOBS = {
+    "svc-deploy": CONFIG.format("deploy.sh svc"),
+    "team-a/svc-deploy": CONFIG.format("deploy.sh team-a"),
+    "team-a/nested/svc-deploy": CONFIG.format("deploy.sh nested"),
+    "team-a/other": CONFIG.format("make"),
+}
+
+
+class _JobsTransport(Transport):
+    def __init__(self, script_output=None):
+        self.script_output = script_output
+        self.fetched = []
+
+    def run(self, command, *args, stdin_input=None):
+        if command == "groovy":
+            stdout = self.script_output
+            if stdout is None:
+                stdout = "".join(f"{JOB_NAME_PREFIX}{name}\n" for name in JOBS)
+            return subprocess.CompletedProcess([command], 0, stdout, "")
+        assert command == "get-job"
+        self.fetched.append(args[0])
+        return subprocess.CompletedProcess([command], 0, JOBS[args[0]], "")
+
+
+def test_many_selects_jobs_in_folders(config, capsys):
+    transport = _JobsTransport()
+    command = JobDiffCommand(["--many", "svc-deploy", "--summary", "--no-cache"])
+
+    assert command.bind(config, transport).execute() == 0
+
+    assert sorted(transport.fetched) == [
+        "svc-deploy",
+        "team-a/nested/svc-deploy",
+        "team-a/svc-deploy",
+    ]
+    assert "Compared 3 job(s) matching 'svc-deploy'" in capsys.readouterr().out
+
+
+def test_many_glob_matches_full_names(config, capsys):
+    transport = _JobsTransport()
+    command = JobDiffCommand(["--many", "team-a/*", "--summary", "--no-cache"])
+
+    assert command.bind(config, transport).execute() == 0
+
+    assert sorted(transport.fetched) == [
+        "team-a/nested/svc-deploy",
+        "team-a/other",
+        "team-a/svc-deploy",
+    ]
+
+
+def test_many_reports_script_errors(config, capsys):
+    transport = _JobsTransport("groovy.lang.MissingPropertyException: boom\n")
+    command = JobDiffCommand(["--many", "svc", "--no-cache"])
+
+    assert command.bind(config, transport).execute() == 1
+
+    err = capsys.readouterr().err
+    assert "Error: Failed to list jobs" in err
+    assert "MissingPropertyException" in err
+    assert transport.fetched == []
@@ -0,0 +1,46 @@
+"""JenkinsSession: every transport it hands out is reused and closed with it"""
+
+import pytest
+
+from jenkins_tools import core
+from jenkins_tools.core import JenkinsConfig, JenkinsSession, Transport
+
+
+class _TrackedTransport(Transport):
+    def __init__(self, config):
+        self.config = config
+        self.closed = False
+
+    def run(self, command, *args, stdin_input=None):
+        raise AssertionError("not used")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def session(config, monkeypatch):
+    monkeypatch.setattr(core, "open_transport", _TrackedTransport)
+    with JenkinsSession() as session:
+        yield session
+
+
+def test_shared_transport_for_session_config(session):
+    transport = session.transport()
+
+    assert session.transport(session.config) is transport
+    session.close()
+    assert transport.closed
+
+
+def test_other_config_gets_one_transport_closed_with_session(session):
+    shared = session.transport()
+    other = JenkinsConfig()
+
+    transport = session.transport(other)
+
+    assert transport is not shared
+    assert transport.config is other
+    assert session.transport(other) is transport
+    session.close()
+    assert transport.closed and shared.closed
@@ -0,0 +1,95 @@
+"""snapshot: each streamed job record reaches the user in full"""
+
+import json
+import subprocess
+
+from jenkins_tools.commands.snapshot import RECORD_PREFIX, SnapshotCommand
+from jenkins_tools.core import Transport
+
+RECORDS = [
+    {
+        "name": "backend-build",
+        "type": "FreeStyleProject",
+        "enabled": True,
+        "buildable": True,
+        "health": {
+            "score": 80,
+            "description": "Build stability: 1 out of the last 5 builds failed.",
+        },
+        "lastBuild": 130,
+        "lastStableBuild": 130,
+        "lastSuccessfulBuild": 130,
+        "lastFailedBuild": 127,
+        "lastUnsuccessfulBuild": 127,
+        "lastCompletedBuild": 130,
+        "upstream": ["backend-test"],
+        "downstream": ["backend-deploy-staging", "backend-docs"],
+        "builds": [130, 129, 128],
+    },
+    {
+        "name": "legacy/old-cron",
+        "type": "FreeStyleProject",
+        "enabled": False,
+        "buildable": False,
+        "health": None,
+        "lastBuild": None,
+        "lastStableBuild": None,
+        "lastSuccessfulBuild": None,
+        "lastFailedBuild": None,
+        "lastUnsuccessfulBuild": None,
+        "lastCompletedBuild": None,
+        "upstream": [],
+        "downstream": [],
+        "builds": [],
+    },
+]
+
+
+class _ScriptTransport(Transport):
+    """Answers the snapshot script with canned record lines"""
+
+    def run(self, command, *args, stdin_input=None):
+        assert (command, args) == ("groovy", ("=",))
+        stdout = "".join(f"{RECORD_PREFIX}{json.dumps(record)}\n" for record in RECORDS)
+        return subprocess.CompletedProcess([command], 0, stdout, "")
+
+
+def _run(config, *args):
+    return SnapshotCommand.from_args(list(args)).bind(config, _ScriptTransport()).execute()
+
+
+def test_text_shows_permalinks_and_relations(config, capsys):
+    assert _run(config) == 0
+
+    assert capsys.readouterr().out.splitlines() == [
+        "backend-build  ENABLED  health 80%  last #130  builds: 130 129 128",
+        "    stable #130  successful #130  failed #127  unsuccessful #127  completed #130",
+        "    upstream: backend-test",
+        "    downstream: backend-deploy-staging, backend-docs",
+        "legacy/old-cron  DISABLED  health -  last -",
+        "Total: 2 job(s)",
+    ]
+
+
+def test_ndjson_writes_whole_records(config, capsys):
+    assert _run(config, "--format", "ndjson") == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == RECORDS
+
+
+def test_json_is_a_list_of_records(config, capsys):
+    assert _run(config, "--format", "json") == 0
+
+    assert json.loads(capsys.readouterr().out) == RECORDS
+
+
+def test_tsv_columns(config, capsys):
+    assert _run(config, "--format", "tsv") == 0
+
+    header, first, second = capsys.readouterr().out.splitlines()
+    assert header.split("\t") == SnapshotCommand.RECORD_FIELDS
+    row = dict(zip(SnapshotCommand.RECORD_FIELDS, first.split("\t")))
+    assert row["downstream"] == "backend-deploy-staging,backend-docs"
+    assert row["builds"] == "130,129,128"
+    assert second.split("\t")[:4] == ["legacy/old-cron", "FreeStyleProject", "false", "false"]
@@ -0,0 +1,76 @@
+"""Startup cost: help must not import command modules or heavy dependencies"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Run the CLI in a fresh interpreter, then report which modules it loaded
+SCRIPT = """
+import json, sys
+from jenkins_tools import cli
+
+report_path, argv = sys.argv[1], json.loads(sys.argv[2])
+sys.argv = ["jenkee"] + argv
+try:
+    cli.main()
+except SystemExit:
+    pass
+with open(report_path, "w") as f:
+    json.dump(sorted(sys.modules), f)
+"""
+
+HEAVY_MODULES = [
+    "asyncio",
+    "concurrent.futures",
+    "dotenv",
+    "http.client",
+    "sqlite3",
+    "ssl",
+    "urllib.request",
+    "xml.etree.ElementTree",
+]
+ALLOWED_PACKAGE_MODULES = {
+    "jenkins_tools",
+    "jenkins_tools.cli",
+    "jenkins_tools.commands",
+    "jenkins_tools.commands.help",
+    "jenkins_tools.core",
+}
+
+
+def _loaded_modules(tmp_path, argv):
+    report = tmp_path / "modules.json"
+    env = {key: value for key, value in os.environ.items() if not key.startswith("JENKINS_")}
+    env.update(PYTHONPATH=str(REPO_ROOT), HOME=str(tmp_path))
+    subprocess.run(
+        [sys.executable, "-c", SCRIPT, str(report), json.dumps(argv)],
+        cwd=tmp_path,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    return set(json.loads(report.read_text()))
+
+
+@pytest.mark.parametrize("argv", [[], ["help"], ["help", "list-jobs"]])
+def test_help_loads_no_heavy_modules(tmp_path, argv):
+    modules = _loaded_modules(tmp_path, argv)
+
+    assert [name for name in HEAVY_MODULES if name in modules] == []
+    package_modules = {name for name in modules if name.startswith("jenkins_tools")}
+    assert package_modules <= ALLOWED_PACKAGE_MODULES
+
+
+def test_command_loads_only_its_own_module(tmp_path):
+    # Fails before any request: credentials are not configured in the empty HOME
+    modules = _loaded_modules(tmp_path, ["get-job", "some-job"])
+
+    commands = {name for name in modules if name.startswith("jenkins_tools.commands.")}
+    assert commands == {"jenkins_tools.commands.get_job"}
+    assert "asyncio" not in modules
@@ -0,0 +1,83 @@
+"""watch: failed requests, including the extra builds lookup, are retried"""
+
+import pytest
+
+from jenkins_tools.commands import watch
+from jenkins_tools.commands.watch import WatchCommand
+from jenkins_tools.core import JenkinsHTTP
+
+
+def _build(number, result=None):
+    return {
+        "number": number,
+        "building": result is None,
+        "result": result,
+        "timestamp": 0,
+        "duration": 0 if result is None else 60000,
+        "estimatedDuration": -1,
+    }
+
+
+def _folder(in_queue, last_build):
+    return {"jobs": [{"name": "app", "inQueue": in_queue, "lastBuild": last_build}]}
+
+
+class _ScriptedHTTP:
+    """Answers folder polls and builds lookups from scripted responses"""
+
+    item_path = staticmethod(JenkinsHTTP.item_path)
+
+    def __init__(self, folders, builds):
+        self.folders = list(folders)
+        self.builds = list(builds)
+
+    def get_json(self, path, tree=None):
+        responses = self.folders if tree.startswith("jobs[") else self.builds
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return 200, response
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(watch.time, "sleep", lambda seconds: None)
+
+
+def test_failed_builds_lookup_is_retried(capsys):
+    second_poll = _folder(True, _build(3))
+    http = _ScriptedHTTP(
+        folders=[
+            _folder(False, _build(1)),
+            second_poll,
+            second_poll,
+            _folder(False, _build(3, "SUCCESS")),
+        ],
+        builds=[
+            ConnectionResetError("connection reset"),
+            {"builds": [_build(3), _build(2, "FAILURE"), _build(1, "SUCCESS")]},
+        ],
+    )
+
+    assert WatchCommand()._watch(http, ["app"], 1, 1, None, True) == 1
+
+    out, err = capsys.readouterr()
+    events = [line.split("  ", 1)[1] for line in out.splitlines()[1:]]
+    assert events == [
+        "app queued",
+        "app #1 finished: SUCCESS in 1m 0s",
+        "app #2 started",
+        "app #2 finished: FAILURE (was SUCCESS) in 1m 0s",
+        "app #3 started",
+        "app #3 finished: SUCCESS (was FAILURE) in 1m 0s",
+    ]
+    assert "Warning: Poll failed (connection reset)" in err
+
+
+def test_gives_up_after_retries(capsys, monkeypatch):
+    monkeypatch.setattr(watch, "WATCH_RETRIES", 1)
+    http = _ScriptedHTTP(folders=[OSError("down"), OSError("down")], builds=[])
+
+    assert WatchCommand()._watch(http, ["app"], 1, 1, None, True) == 1
+
+    assert "Error: Failed to poll Jenkins: down" in capsys.readouterr().err